@@ -0,0 +1,40 @@
+import os
+import sys
+import time
+import feedparser
+
+# Thêm thư mục src vào Python path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from utils.fast_feed_parser import parse_feed
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "feeds")
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+HEADERS = {"content-location": "https://example.com/feed"}
+
+def bench(func, content: bytes) -> float:
+    """Thời gian trung bình cho một lần parse (ms)."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(content, response_headers=HEADERS)
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+def main():
+    print(f"⏱️  Feed parsing, {ROUNDS} rounds, ms per feed")
+    print(f"{'fixture':<22}{'KB':>7}{'feedparser':>12}{'fast':>9}{'speedup':>9}")
+    total_bytes = total_slow = total_fast = 0.0
+    for filename in sorted(os.listdir(FIXTURES_DIR)):
+        with open(os.path.join(FIXTURES_DIR, filename), "rb") as f:
+            content = f.read()
+        slow = bench(feedparser.parse, content)
+        fast = bench(parse_feed, content)
+        total_bytes += len(content)
+        total_slow += slow
+        total_fast += fast
+        print(f"{filename:<22}{len(content) / 1024:>7.1f}{slow:>12.2f}{fast:>9.2f}{slow / fast:>8.1f}x")
+    megabytes = total_bytes / 1024 / 1024
+    print(f"throughput: feedparser {megabytes / total_slow * 1000:.1f} MB/s, "
+          f"fast {megabytes / total_fast * 1000:.1f} MB/s ({total_slow / total_fast:.1f}x)")
+
+if __name__ == "__main__":
+    main()
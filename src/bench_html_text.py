@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+import feedparser
+
+# Thêm thư mục src vào Python path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from utils.text_processor import TextProcessor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "feeds")
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+
+def load_contents():
+    """Nội dung HTML của từng entry trong các feed mẫu, lấy giống read_rss_link."""
+    contents = {}
+    for filename in sorted(os.listdir(FIXTURES_DIR)):
+        feed = feedparser.parse(os.path.join(FIXTURES_DIR, filename))
+        values = []
+        for entry in feed.entries:
+            if isinstance(entry.get("content"), list) and entry["content"]:
+                values.append(entry["content"][0].get("value", ""))
+            else:
+                values.append(entry.get("summary", entry.get("description", "")) or "")
+        contents[filename] = values
+    return contents
+
+def bench(func, values) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for value in values:
+            func(value)
+    return (time.perf_counter() - started) / (ROUNDS * len(values)) * 1e6
+
+def main():
+    print(f"⏱️  HTML → text, {ROUNDS} rounds, µs per entry")
+    print(f"{'fixture':<22}{'entries':>8}{'soup':>10}{'fast':>10}{'speedup':>9}")
+    total_soup = total_fast = 0.0
+    for filename, values in load_contents().items():
+        soup = bench(TextProcessor.parse_html_soup, values)
+        fast = bench(TextProcessor.parse_html, values)
+        total_soup += soup * len(values)
+        total_fast += fast * len(values)
+        print(f"{filename:<22}{len(values):>8}{soup:>10.1f}{fast:>10.1f}{soup / fast:>8.1f}x")
+    print(f"{'overall':<30}{'':>20}{total_soup / total_fast:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
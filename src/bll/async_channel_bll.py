@@ -0,0 +1,36 @@
+from bll.singleton import Singleton
+from dal.dal_factory import create_async_channel_dal
+from dto.channel_dto import ChannelDTO
+from typing import Optional
+from typing import List
+from typing import AsyncIterator
+
+class AsyncChannelBLL(Singleton):
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            self.__channelDAL = create_async_channel_dal()
+            self._initialized = True
+
+    async def insert_channel(self, channel_dto: ChannelDTO) -> bool:
+        return await self.__channelDAL.insert_channel(channel_dto)
+
+    async def delete_channel_by_channel_id(self, channel_link: str) -> bool:
+        return await self.__channelDAL.delete_channel_by_channel_id(channel_link)
+
+    async def delete_all_channel(self) -> bool:
+        return await self.__channelDAL.delete_all_channel()
+
+    async def update_channel(self, Channel_dto: ChannelDTO) -> bool:
+        return await self.__channelDAL.update_channel(Channel_dto)
+
+    async def upsert_channel_batch(self, channel_dtos: List[ChannelDTO]) -> bool:
+        return await self.__channelDAL.upsert_channel_batch(channel_dtos)
+
+    async def get_channel_by_channel_id(self, channel_id: str) -> Optional[ChannelDTO]:
+        return await self.__channelDAL.get_channel_by_channel_id(channel_id)
+
+    def iter_all_channel(self, ignore_state=False, is_active=True) -> AsyncIterator[ChannelDTO]:
+        return self.__channelDAL.iter_all_channel(ignore_state, is_active)
+
+    async def get_all_channel(self, ignore_state=False, is_active=True) -> List[ChannelDTO]:
+        return await self.__channelDAL.get_all_channel(ignore_state, is_active)
@@ -0,0 +1,56 @@
+from bll.singleton import Singleton
+from dto.feed_dto import FeedDTO
+from dal.dal_factory import create_async_feed_dal
+from dal.base_dal import ProgressCallback
+from typing import Optional
+from typing import List
+from typing import AsyncIterator
+from typing import Tuple
+
+class AsyncFeedBLL(Singleton):
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            self.__feedDAL = create_async_feed_dal()
+            self._initialized = True
+
+    async def insert_feed(self, feed_dto: FeedDTO) -> bool:
+        return await self.__feedDAL.insert_feed(feed_dto)
+
+    async def delete_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return await self.__feedDAL.delete_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id, on_progress)
+
+    async def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return await self.__feedDAL.delete_feed_by_link_feed_and_channel_id(link_feed, channel_id, on_progress)
+
+    async def delete_feed_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return await self.__feedDAL.delete_feed_by_channel_id(channel_id, on_progress)
+
+    async def delete_all_feed(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return await self.__feedDAL.delete_all_feed(on_progress)
+
+    async def update_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str, feed_dto: FeedDTO) -> bool:
+        return await self.__feedDAL.update_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id, feed_dto)
+
+    async def update_last_emty(self, feed_dto: FeedDTO, link_emty: str) -> bool:
+        return await self.__feedDAL.update_last_emty(feed_dto, link_emty)
+
+    async def update_last_emty_batch(self, cursors: List[Tuple[FeedDTO, str]]) -> bool:
+        return await self.__feedDAL.update_last_emty_batch(cursors)
+
+    async def update_server_id_batch(self, updates: List[Tuple[FeedDTO, str]]) -> bool:
+        return await self.__feedDAL.update_server_id_batch(updates)
+
+    async def get_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str) -> Optional[FeedDTO]:
+        return await self.__feedDAL.get_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id)
+
+    def iter_all_feed(self) -> AsyncIterator[FeedDTO]:
+        return self.__feedDAL.iter_all_feed()
+
+    async def get_all_feed(self) -> List[FeedDTO]:
+        return await self.__feedDAL.get_all_feed()
+
+    async def get_all_feed_by_channel_id(self, channel_id: str) -> List[FeedDTO]:
+        return await self.__feedDAL.get_all_feed_by_channel_id(channel_id)
+
+    async def get_all_feed_by_server_id(self, server_id: str) -> List[FeedDTO]:
+        return await self.__feedDAL.get_all_feed_by_server_id(server_id)
@@ -0,0 +1,54 @@
+from bll.singleton import Singleton
+from bll.server_bll import server_cache
+from dto.server_dto import ServerDTO
+from dal.dal_factory import create_async_server_dal
+from utils.ttl_cache import TTLCache
+from typing import Optional
+from typing import List
+from typing import AsyncIterator
+
+class AsyncServerBLL(Singleton):
+    def __init__(self):
+        if not hasattr(self, '_initialized'):
+            self.__serverDAL = create_async_server_dal()
+            self.__cache = server_cache
+            self._initialized = True
+
+    async def insert_server(self, server_dto: ServerDTO) -> bool:
+        result = await self.__serverDAL.insert_server(server_dto)
+        self.__cache.invalidate(server_dto.get_server_id())
+        return result
+
+    async def update_server(self, server_dto: ServerDTO) -> bool:
+        result = await self.__serverDAL.update_server(server_dto)
+        self.__cache.invalidate(server_dto.get_server_id())
+        return result
+
+    async def delete_all_server(self) -> bool:
+        result = await self.__serverDAL.delete_all_server()
+        self.__cache.clear()
+        return result
+
+    async def delete_server_by_server_id(self, server_id: str) -> bool:
+        result = await self.__serverDAL.delete_server_by_server_id(server_id)
+        self.__cache.invalidate(server_id)
+        return result
+
+    async def upsert_server_batch(self, server_dtos: List[ServerDTO]) -> bool:
+        result = await self.__serverDAL.upsert_server_batch(server_dtos)
+        for server_dto in server_dtos:
+            self.__cache.invalidate(server_dto.get_server_id())
+        return result
+
+    async def get_server_by_server_id(self, server_id: str) -> Optional[ServerDTO]:
+        server_dto = self.__cache.get(server_id, TTLCache.MISSING)
+        if server_dto is TTLCache.MISSING:
+            server_dto = await self.__serverDAL.get_server_by_server_id(server_id)
+            self.__cache.set(server_id, server_dto)
+        return server_dto
+
+    def iter_all_server(self, ignore_state=False, is_active=True) -> AsyncIterator[ServerDTO]:
+        return self.__serverDAL.iter_all_server(ignore_state, is_active)
+
+    async def get_all_server(self, ignore_state=False, is_active=True) -> List[ServerDTO]:
+        return await self.__serverDAL.get_all_server(ignore_state, is_active)
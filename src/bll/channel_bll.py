@@ -1,13 +1,14 @@
 from bll.singleton import Singleton
-from dal.channel_dal import ChannelDAL
+from dal.dal_factory import create_channel_dal
 from dto.channel_dto import ChannelDTO
 from typing import Optional
 from typing import List
+from typing import Iterator
 
 class ChannelBLL(Singleton):
     def __init__(self):
         if not hasattr(self, '_initialized'):
-            self.__channelDAL = ChannelDAL()
+            self.__channelDAL = create_channel_dal()
             self._initialized = True
     
     def insert_channel(self, channel_dto: ChannelDTO) -> bool:
@@ -22,9 +23,15 @@ class ChannelBLL(Singleton):
     def update_channel(self, Channel_dto: ChannelDTO) -> bool:
         return self.__channelDAL.update_channel(Channel_dto)
             
+    def upsert_channel_batch(self, channel_dtos: List[ChannelDTO]) -> bool:
+        return self.__channelDAL.upsert_channel_batch(channel_dtos)
+            
     def get_channel_by_channel_id(self, channel_id: str) -> Optional[ChannelDTO]:
         return self.__channelDAL.get_channel_by_channel_id(channel_id)
 
-    def get_all_channel(self) -> List[ChannelDTO]:
-        return self.__channelDAL.get_all_channel()
+    def iter_all_channel(self, ignore_state=False, is_active=True) -> Iterator[ChannelDTO]:
+        return self.__channelDAL.iter_all_channel(ignore_state, is_active)
+
+    def get_all_channel(self, ignore_state=False, is_active=True) -> List[ChannelDTO]:
+        return self.__channelDAL.get_all_channel(ignore_state, is_active)
     
\ No newline at end of file
@@ -1,33 +1,41 @@
 from click import prompt
 from bll.singleton import Singleton
 from dto.emty_dto import EmtyDTO
-from dal.emty_dal import EmtyDAL
+from dal.dal_factory import create_emty_dal
+from dal.base_dal import ProgressCallback
 from typing import Optional
 from typing import List
+from typing import Iterator
 
 class EmtyBLL(Singleton):
     def __init__(self):
         if not hasattr(self, '_initialized'):
-            self.__emtyDAL = EmtyDAL()
+            self.__emtyDAL = create_emty_dal()
             self._initialized = True
 
     def insert_emty(self, emty_dto: EmtyDTO) -> bool:
         return self.__emtyDAL.insert_emty(emty_dto)
 
+    def insert_emty_batch(self, emty_dtos: List[EmtyDTO]) -> List[Optional[bool]]:
+        return self.__emtyDAL.insert_emty_batch(emty_dtos)
+
     def delete_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> bool:
         return self.__emtyDAL.delete_emty_by_link_emty_and_channel_id(emty_link, channel_id)
 
-    def delete_emty_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str) -> bool:
-        return self.__emtyDAL.delete_emty_by_link_atom_and_channel_id(link_atom_feed, channel_id)
+    def delete_emty_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__emtyDAL.delete_emty_by_link_atom_and_channel_id(link_atom_feed, channel_id, on_progress)
     
-    def delete_emty_by_channel_id(self, channel_id: str) -> bool:
-        return self.__emtyDAL.delete_emty_by_channel_id(channel_id)
+    def delete_emty_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__emtyDAL.delete_emty_by_channel_id(channel_id, on_progress)
     
-    def delete_all_emty(self) -> bool:
-        return self.__emtyDAL.delete_all_emty()
+    def delete_all_emty(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__emtyDAL.delete_all_emty(on_progress)
 
     def get_emty_by_link_emty_and_channel_emty(self, emty_link: str, channel_id: str) -> Optional[EmtyDTO]:
         return self.__emtyDAL.get_emty_by_link_emty_and_channel_id(emty_link, channel_id)
 
+    def iter_all_emty(self) -> Iterator[EmtyDTO]:
+        return self.__emtyDAL.iter_all_emty()
+
     def get_all_emty(self) -> List[EmtyDTO]:
         return self.__emtyDAL.get_all_emty()
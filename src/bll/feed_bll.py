@@ -1,38 +1,56 @@
 from bll.singleton import Singleton
 from dto.feed_dto import FeedDTO
-from dal.feed_dal import FeedDAL
+from dal.dal_factory import create_feed_dal
+from dal.base_dal import ProgressCallback
 from typing import Optional
 from typing import List
+from typing import Iterator
+from typing import Tuple
 
 class FeedBLL(Singleton):
     def __init__(self):
         if not hasattr(self, '_initialized'):
-            self.__feedDAL = FeedDAL()
+            self.__feedDAL = create_feed_dal()
             self._initialized = True
 
     def insert_feed(self, feed_dto: FeedDTO) -> bool:
         return self.__feedDAL.insert_feed(feed_dto)
 
-    def delete_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str) -> bool:
-        return self.__feedDAL.delete_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id)
+    def delete_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__feedDAL.delete_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id, on_progress)
     
-    def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str) -> bool:
-        return self.__feedDAL.delete_feed_by_link_feed_and_channel_id(link_feed, channel_id)
+    def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__feedDAL.delete_feed_by_link_feed_and_channel_id(link_feed, channel_id, on_progress)
    
-    def delete_feed_by_channel_id(self, channel_id: str) -> bool:
-        return self.__feedDAL.delete_feed_by_channel_id(channel_id)
+    def delete_feed_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__feedDAL.delete_feed_by_channel_id(channel_id, on_progress)
     
-    def delete_all_feed(self) -> bool:
-        return self.__feedDAL.delete_all_feed()
+    def delete_all_feed(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        return self.__feedDAL.delete_all_feed(on_progress)
 
     def update_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str, feed_dto: FeedDTO) -> bool:
         return self.__feedDAL.update_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id, feed_dto)
 
+    def update_last_emty(self, feed_dto: FeedDTO, link_emty: str) -> bool:
+        return self.__feedDAL.update_last_emty(feed_dto, link_emty)
+
+    def update_last_emty_batch(self, cursors: List[Tuple[FeedDTO, str]]) -> bool:
+        return self.__feedDAL.update_last_emty_batch(cursors)
+
+    def update_server_id_batch(self, updates: List[Tuple[FeedDTO, str]]) -> bool:
+        return self.__feedDAL.update_server_id_batch(updates)
+
     def get_feed_by_link_atom_feed_and_channel_id(self, linkAtom_feed: str, channel_id: str) -> Optional[FeedDTO]:
         return self.__feedDAL.get_feed_by_link_atom_feed_and_channel_id(linkAtom_feed, channel_id)
 
+    def iter_all_feed(self) -> Iterator[FeedDTO]:
+        return self.__feedDAL.iter_all_feed()
+
     def get_all_feed(self) -> List[FeedDTO]:
         return self.__feedDAL.get_all_feed()
     
     def get_all_feed_by_channel_id(self, channel_id: str) -> List[FeedDTO]:
-        return self.__feedDAL.get_all_feed_by_channel_id(channel_id)
\ No newline at end of file
+        return self.__feedDAL.get_all_feed_by_channel_id(channel_id)
+
+    def get_all_feed_by_server_id(self, server_id: str) -> List[FeedDTO]:
+        return self.__feedDAL.get_all_feed_by_server_id(server_id)
@@ -1,35 +1,69 @@
+import os
 from bll.singleton import Singleton
 from dto.server_dto import ServerDTO
-from dal.server_dal import ServerDAL
+from dal.dal_factory import create_server_dal
+from utils.ttl_cache import TTLCache
 from typing import Optional
 from typing import List
+from typing import Iterator
+
+# Cache đọc server (màu embed...): thời gian sống (giây) và số server tối đa
+SERVER_CACHE_TTL = int(os.getenv("SERVER_CACHE_TTL", "300"))
+SERVER_CACHE_SIZE = int(os.getenv("SERVER_CACHE_SIZE", "1024"))
+
+# Dùng chung cho ServerBLL và AsyncServerBLL để ghi ở bản nào cũng làm mất hiệu lực ở cả hai
+server_cache = TTLCache(maxsize=SERVER_CACHE_SIZE, ttl=SERVER_CACHE_TTL)
 
 class ServerBLL(Singleton):
     def __init__(self):
         if not hasattr(self, '_initialized'):
-            self.__serverDAL = ServerDAL()
+            self.__serverDAL = create_server_dal()
+            self.__cache = server_cache
             self._initialized = True
-        
+
     def insert_server(self, server_dto: ServerDTO) -> bool:
-            return self.__serverDAL.insert_server(server_dto)
+            result = self.__serverDAL.insert_server(server_dto)
+            self.__cache.invalidate(server_dto.get_server_id())  # Xóa sau khi ghi để không giữ lại bản cũ
+            return result
+
 
-            
     def update_server(self, server_dto: ServerDTO) -> bool:
-            return self.__serverDAL.update_server(server_dto)
+            result = self.__serverDAL.update_server(server_dto)
+            self.__cache.invalidate(server_dto.get_server_id())
+            return result
+
 
-            
     def delete_all_server(self) -> bool:
-            return self.__serverDAL.delete_all_server()
+            result = self.__serverDAL.delete_all_server()
+            self.__cache.clear()
+            return result
+
 
-            
     def delete_server_by_server_id(self, server_id: str) -> bool:
-            return self.__serverDAL.delete_server_by_server_id(server_id)
+            result = self.__serverDAL.delete_server_by_server_id(server_id)
+            self.__cache.invalidate(server_id)
+            return result
+
+
+    def upsert_server_batch(self, server_dtos: List[ServerDTO]) -> bool:
+            result = self.__serverDAL.upsert_server_batch(server_dtos)
+            for server_dto in server_dtos:
+                self.__cache.invalidate(server_dto.get_server_id())
+            return result
+
 
-            
     def get_server_by_server_id(self, server_id: str) -> Optional[ServerDTO]:
-            return self.__serverDAL.get_server_by_server_id(server_id)
+            # Read-through: cache cả kết quả None để server chưa đăng ký không tốn round trip mỗi lần
+            server_dto = self.__cache.get(server_id, TTLCache.MISSING)
+            if server_dto is TTLCache.MISSING:
+                server_dto = self.__serverDAL.get_server_by_server_id(server_id)
+                self.__cache.set(server_id, server_dto)
+            return server_dto
+
+    def iter_all_server(self, ignore_state=False, is_active=True) -> Iterator[ServerDTO]:
+            return self.__serverDAL.iter_all_server(ignore_state, is_active)
+
+    def get_all_server(self, ignore_state=False, is_active=True) -> List[ServerDTO]:
+            return self.__serverDAL.get_all_server(ignore_state, is_active)
 
-    def get_all_server(self) -> List[ServerDTO]:
-            return self.__serverDAL.get_all_server()
 
-            
\ No newline at end of file
@@ -4,6 +4,7 @@ from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
 from utils.commands_cog import CommandsCog
 from utils.handle_rss import get_rss_link, analyze_rss_link
+from utils.executor import run_blocking
 
 logger = logging.getLogger("CommandAnalyzeRSS")
 
@@ -23,7 +24,7 @@ class CommandAnalyzeRSS(CommandsCog):
             return
 
         if not link_rss and url:
-            link_rss = get_rss_link(url)
+            link_rss = await run_blocking(get_rss_link, url)
             if not link_rss:
                 await ctx.send("Không tìm thấy RSS link từ URL đã cho.")
                 return
@@ -45,7 +46,7 @@ class CommandAnalyzeRSS(CommandsCog):
             return
 
         if not link_rss and url:
-            link_rss = get_rss_link(url)
+            link_rss = await run_blocking(get_rss_link, url)
             if not link_rss:
                 await interaction.followup.send("Không tìm thấy RSS link từ URL đã cho.")
                 return
@@ -55,7 +56,7 @@ class CommandAnalyzeRSS(CommandsCog):
     async def _handle_analyze(self, source, link_rss: str):
         """Xử lý phân tích RSS bằng Gemini và trả về kết quả."""
         try:
-            result = analyze_rss_link(rss_link=link_rss, num_entries=5)
+            result = await run_blocking(analyze_rss_link, rss_link=link_rss, num_entries=5)
             if not result or "Không nhận được phản hồi" in result:
                 await source.send("Không phân tích được dữ liệu từ Gemini.")
                 return
@@ -1,14 +1,15 @@
 from calendar import c
+import asyncio
 import logging
 import nextcord
 from nextcord.ext import commands
 from nextcord import DMChannel, Interaction, SlashOption, TextChannel
 from typing import Optional, Union
-from bll.channel_bll import ChannelBLL
-from bll.emty_bll import EmtyBLL
-from bll.feed_bll import FeedBLL
+from bll.async_emty_bll import AsyncEmtyBLL
+from bll.async_feed_bll import AsyncFeedBLL
 from utils.commands_cog import CommandsCog
 from utils.handle_rss import get_rss_link
+from utils.executor import run_blocking
 
 logger = logging.getLogger("CommandDeleteFeed")
 
@@ -33,7 +34,7 @@ class CommandDeleteFeed(CommandsCog):
             return
         
         if url:
-            link_rss = get_rss_link(url)
+            link_rss = await run_blocking(get_rss_link, url)
             if not link_rss:
                 await interaction.followup.send('RSS link not found for the provided URL.')
                 return
@@ -42,8 +43,8 @@ class CommandDeleteFeed(CommandsCog):
     async def _delete_feed(self, source, channel, user, link_rss: Optional[str] = None):
         try:
             
-            feed_bll = FeedBLL()
-            emty_bll = EmtyBLL()
+            feed_bll = AsyncFeedBLL()
+            emty_bll = AsyncEmtyBLL()
             channel_id = channel.id if isinstance(channel, TextChannel) else str(user.id)
         
             if isinstance(channel, (TextChannel, DMChannel)):
@@ -58,19 +59,34 @@ class CommandDeleteFeed(CommandsCog):
                 return
             
             if link_rss:
-                if not feed_bll.get_feed_by_link_atom_feed_and_channel_id(link_rss, channel_id):
+                if not await feed_bll.get_feed_by_link_atom_feed_and_channel_id(link_rss, channel_id):
                     if isinstance(channel, TextChannel):
                         await source.send(f"RSS feed not found in {channel.mention}.")
                     else:
                         await source.send(f"RSS feed not found in the **{user.name}** channel.")
                     return 
-                feed_bll.delete_feed_by_link_atom_feed_and_channel_id(link_rss, channel_id)
-                emty_bll.delete_emty_by_link_atom_feed_and_channel_id(link_rss, channel_id)
+
+            # Xóa theo từng batch, báo tiến độ bằng cách sửa tin nhắn trạng thái.
+            # Callback có thể chạy trên event loop (Firestore async) hoặc thread của executor (SQLite).
+            status = await source.send("Deleting feed(s)...")
+            loop = asyncio.get_running_loop()
+            pending_edits = []
+
+            def report(kind: str):
+                def on_progress(deleted: int):
+                    pending_edits.append(asyncio.run_coroutine_threadsafe(
+                        status.edit(content=f"Deleting {kind}... {deleted} removed so far."), loop))
+                return on_progress
+
+            if link_rss:
+                await feed_bll.delete_feed_by_link_atom_feed_and_channel_id(link_rss, channel_id, report("feed(s)"))
+                await emty_bll.delete_emty_by_link_atom_feed_and_channel_id(link_rss, channel_id, report("sent entries"))
             else:
-                feed_bll.delete_feed_by_channel_id(channel_id or str(user.id))
-                emty_bll.delete_emty_by_channel_id(channel_id or str(user.id))
-        
-            await source.send(f"Successfully deleted feed(s) from channel.")
+                await feed_bll.delete_feed_by_channel_id(channel_id or str(user.id), report("feed(s)"))
+                await emty_bll.delete_emty_by_channel_id(channel_id or str(user.id), report("sent entries"))
+
+            await asyncio.gather(*(asyncio.wrap_future(edit) for edit in pending_edits), return_exceptions=True)
+            await status.edit(content="Successfully deleted feed(s) from channel.")
         
         except Exception as e:
             await source.send(f"An error occurred: {e}")
@@ -3,13 +3,14 @@ from typing import Optional, Union
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption, TextChannel, DMChannel
-from bll.feed_bll import FeedBLL
-from bll.channel_bll import ChannelBLL
-from bll.server_bll import ServerBLL
+from bll.async_feed_bll import AsyncFeedBLL
+from bll.async_channel_bll import AsyncChannelBLL
+from bll.async_server_bll import AsyncServerBLL
 from dto.server_dto import ServerDTO
 from dto.channel_dto import ChannelDTO
 from utils.commands_cog import CommandsCog
 from utils.handle_rss import get_rss_link, read_rss_link
+from utils.executor import run_blocking
 
 logger = logging.getLogger("CommandSetFeed")
 
@@ -52,7 +53,7 @@ class CommandSetFeed(CommandsCog):
             return
 
         if not link_rss and url:
-            link_rss = get_rss_link(url)  # type: ignore
+            link_rss = await run_blocking(get_rss_link, url)  # type: ignore
             if not link_rss:
                 await interaction.followup.send('Not found any RSS link for the provided URL.')
                 return
@@ -66,7 +67,7 @@ class CommandSetFeed(CommandsCog):
                 await source.send("This command is only available in servers.")
                 return
             
-            feed_data = read_rss_link(rss_link=link_rss)
+            feed_data = await run_blocking(read_rss_link, rss_link=link_rss)
             if not feed_data or not feed_data[0]:
                 await source.send("Not found any feed data.")
                 return
@@ -86,14 +87,15 @@ class CommandSetFeed(CommandsCog):
                 channel_name = channel.name
 
             server_dto = ServerDTO(server_id, server_name)
-            channel_dto = ChannelDTO(channel_id, channel_name, server_dto.get_server_id())
+            channel_dto = ChannelDTO(channel_id, server_dto.get_server_id(), channel_name)
 
-            ServerBLL().insert_server(server_dto)
-            ChannelBLL().insert_channel(channel_dto)
+            await AsyncServerBLL().insert_server(server_dto)
+            await AsyncChannelBLL().insert_channel(channel_dto)
 
             feed_dto.set_channel_id(channel_dto.get_channel_id())
             feed_dto.set_link_atom_feed(link_rss)
-            FeedBLL().insert_feed(feed_dto)
+            feed_dto.set_server_id(server_dto.get_server_id())
+            await AsyncFeedBLL().insert_feed(feed_dto)
             
             if isinstance(channel, TextChannel):
                 await source.send(f"RSS feed has been set up for {channel.mention}.")
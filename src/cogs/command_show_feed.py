@@ -2,10 +2,11 @@ import logging
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, ui, DMChannel
-from bll.feed_bll import FeedBLL
+from bll.async_feed_bll import AsyncFeedBLL
 from gui.embed_custom import EmbedCustom
 from utils.commands_cog import CommandsCog
 from utils.handle_rss import analyze_rss_link  # ✅ dùng phân tích RSS
+from utils.executor import run_blocking
 
 logger = logging.getLogger("CommandShowChannel")
 
@@ -38,7 +39,7 @@ class CommandShowChannel(CommandsCog):
                     return
 
                 feed_dto = self.feeds[idx]
-                result = analyze_rss_link(rss_link=feed_dto.get_link_atom_feed())
+                result = await run_blocking(analyze_rss_link, rss_link=feed_dto.get_link_atom_feed())
 
                 if len(result) > 1900:
                     preview = result[:1900] + "..."
@@ -88,29 +89,23 @@ class CommandShowChannel(CommandsCog):
                 guild_id = str(guild.id)
                 guild_name = guild.name
 
-            feed_bll = FeedBLL()
+            feed_bll = AsyncFeedBLL()
             feeds = []
             server_data = {}
             num_feeds = 0
 
-            for feed_dto in feed_bll.get_all_feed():
-                channel_id = int(feed_dto.get_channel_id())
-                if not guild:
-                    if str(user.id) == str(channel_id):  # DM case
-                        channel_info = f"{num_feeds+1}. **DM Channel** - [{feed_dto.get_title_feed()}]({feed_dto.get_link_feed()})"
-                        server_data.setdefault("Direct Message", []).append(channel_info)
-                        feeds.append(feed_dto)
-                        num_feeds += 1
-                else:
-                    channel = self.bot.get_channel(channel_id)
-                    if channel is not None and channel.guild.id == int(guild_id):
-                        server_name = f"**Server:** {guild_name} ({guild_id})"
-                        channel_info = f"{num_feeds+1}. **Channel:** {channel.mention} - [{feed_dto.get_title_feed()}]({feed_dto.get_link_feed()})"
-                        server_data.setdefault(server_name, []).append(channel_info)
-                        feeds.append(feed_dto)
-                        num_feeds += 1
-
-            embed = EmbedCustom(
+            # Chỉ đọc feed của guild này (truy vấn theo server_id có index)
+            for feed_dto in await feed_bll.get_all_feed_by_server_id(guild_id):
+                channel = self.bot.get_channel(int(feed_dto.get_channel_id()))
+                if channel is not None:
+                    server_name = f"**Server:** {guild_name} ({guild_id})"
+                    channel_info = f"{num_feeds+1}. **Channel:** {channel.mention} - [{feed_dto.get_title_feed()}]({feed_dto.get_link_feed()})"
+                    server_data.setdefault(server_name, []).append(channel_info)
+                    feeds.append(feed_dto)
+                    num_feeds += 1
+
+            embed = await run_blocking(
+                EmbedCustom,
                 id_server=guild_id,
                 title="List of Feeds in Channels",
                 description=f"You have {num_feeds} feeds in channels:"
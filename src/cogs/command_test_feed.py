@@ -6,6 +6,7 @@ from nextcord import Interaction, SlashOption
 from gui.embed_feed import EmbedFeed
 from utils.commands_cog import CommandsCog
 from utils.handle_rss import get_rss_link, read_rss_link
+from utils.executor import run_blocking
 
 logger = logging.getLogger("CommandTestFeed")
 
@@ -16,12 +17,13 @@ class CommandTestFeed(CommandsCog):
     async def _test(self, ctx, guild, user, link_rss: Optional[str] = None):  # Đổi thứ tự các tham số
         server_id = guild.id if guild else user.id 
         try:
-            feed_data = read_rss_link(rss_link=link_rss)
+            feed_data = await run_blocking(read_rss_link, rss_link=link_rss)
             if not feed_data or not all(feed_data):
                 raise TypeError("Feed data is incomplete or None")
             
             feed_dto, emty_dto = feed_data
-            embed = EmbedFeed(
+            embed = await run_blocking(
+                EmbedFeed,
                 id_server=server_id, 
                 feed_dto=feed_dto, 
                 emty_dto=emty_dto
@@ -37,12 +39,12 @@ class CommandTestFeed(CommandsCog):
         '''Test the feed link'''
         link_rss = None
         if not url:
-            link_rss = get_rss_link(url="https://fit.sgu.edu.vn/site/")
+            link_rss = await run_blocking(get_rss_link, url="https://fit.sgu.edu.vn/site/")
             if not link_rss:
                 await ctx.send('Link Atom feed is not found.')
                 return
         else:
-            link_rss = get_rss_link(url)
+            link_rss = await run_blocking(get_rss_link, url)
         await self._test(ctx, ctx.guild, ctx.author, link_rss)
 
     @nextcord.slash_command(name="test", description="Test the bot")
@@ -54,12 +56,12 @@ class CommandTestFeed(CommandsCog):
             await interaction.followup.send('Choose one of link_rss or url.')
             return
         elif not link_rss and not url:
-            link_rss = get_rss_link(url="https://fit.sgu.edu.vn/site/")
+            link_rss = await run_blocking(get_rss_link, url="https://fit.sgu.edu.vn/site/")
             if not link_rss:
                 await interaction.followup.send('Link Atom feed is not found.')
                 return
         elif not link_rss and url:
-            link_rss = get_rss_link(url)
+            link_rss = await run_blocking(get_rss_link, url)
         
         await self._test(interaction.followup, interaction.guild, interaction.user, link_rss)
 
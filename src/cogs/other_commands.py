@@ -5,6 +5,7 @@ from utils.handle_rss import get_rss_link
 from gui.embed_custom import EmbedCustom
 from gui.button_of_help_command import ButtonOfHelpCommnad
 from utils.commands_cog import CommandsCog
+from utils.executor import run_blocking
 
 logger = logging.getLogger("OtherCommands")
 
@@ -35,7 +36,7 @@ class OtherCommands(CommandsCog):  # Đảm bảo kế thừa từ CommandsCog
         if await self.is_dm_channel(ctx):
             return
         try:
-            await ctx.send(self.get_rss(url))
+            await ctx.send(await run_blocking(self.get_rss, url))
         except Exception as e:
             await ctx.send(f"Error: {e}")
             logger.error(f"Error: {e}")
@@ -44,7 +45,7 @@ class OtherCommands(CommandsCog):  # Đảm bảo kế thừa từ CommandsCog
     async def slash_command_get_rss(self, interaction, url: str):
         await interaction.response.defer()
         try:
-            await interaction.followup.send(self.get_rss(url))
+            await interaction.followup.send(await run_blocking(self.get_rss, url))
         except Exception as e:
             await interaction.followup.send(f"Error: {e}", ephemeral=True)
             logger.error(f"Error: {e}")
@@ -57,7 +58,8 @@ class OtherCommands(CommandsCog):  # Đảm bảo kế thừa từ CommandsCog
             available_commands = [command.name for command in self.bot.commands]
             available_slash_commands = [command.name for command in self.bot.get_application_commands()]
 
-            embed = EmbedCustom(
+            embed = await run_blocking(
+                EmbedCustom,
                 id_server=str(interaction.guild.id) if interaction.guild else "DM",
                 title="List of commands",
                 description=f'''
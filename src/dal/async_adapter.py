@@ -0,0 +1,33 @@
+from itertools import islice
+from typing import Any
+from dal.base_dal import PAGE_SIZE
+from utils.executor import run_blocking
+
+class AsyncDALAdapter:
+    """
+    Bọc một DAL đồng bộ (vd. SQLite) thành bản async cùng bộ method:
+    mỗi lời gọi chạy trên executor dùng chung và được await như AsyncFeedDAL...
+    """
+    def __init__(self, dal):
+        self.__dal = dal
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.__dal, name)
+        if not callable(attr):
+            return attr
+
+        if name.startswith("iter_"):
+            # Generator: kéo từng trang trên executor rồi trả ra dưới dạng async iterator
+            async def iterate(*args, **kwargs):
+                iterator = attr(*args, **kwargs)
+                while True:
+                    page = await run_blocking(list, islice(iterator, PAGE_SIZE))
+                    for item in page:
+                        yield item
+                    if len(page) < PAGE_SIZE:
+                        return
+            return iterate
+
+        async def call(*args, **kwargs):
+            return await run_blocking(attr, *args, **kwargs)
+        return call
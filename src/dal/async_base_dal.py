@@ -0,0 +1,64 @@
+from firebase_admin import firestore_async
+from typing import Any, AsyncIterator, List, Optional
+from dal.base_dal import BATCH_SIZE
+from dal.base_dal import BaseDAL
+from dal.base_dal import init_firebase_app
+from dal.base_dal import PAGE_SIZE
+from dal.base_dal import ProgressCallback
+
+class AsyncBaseDAL:
+    """
+    Bản async của BaseDAL trên Firestore AsyncClient: mọi thao tác là coroutine,
+    nhiều request có thể chạy song song trên event loop mà không tốn thread.
+    Phải được khởi tạo bên trong event loop sẽ dùng nó.
+    """
+    _chunked = staticmethod(BaseDAL._chunked)
+
+    def __init__(self):
+        init_firebase_app()
+        self.db = firestore_async.client()
+
+    @staticmethod
+    async def _iter_query(query, page_size: int = PAGE_SIZE) -> AsyncIterator[Any]:
+        """Bản async của BaseDAL._iter_query."""
+        last_doc = None
+        while True:
+            page = query.limit(page_size)
+            if last_doc is not None:
+                page = page.start_after(last_doc)
+            docs = [doc async for doc in page.stream()]
+            for doc in docs:
+                yield doc
+            if len(docs) < page_size:
+                return
+            last_doc = docs[-1]
+
+    def _on_deleted(self, doc_ids: List[str]) -> None:
+        """Hook cho lớp con, được gọi sau mỗi batch xóa thành công."""
+        pass
+
+    async def _bulk_delete(self, query, on_progress: Optional[ProgressCallback] = None, page_size: int = BATCH_SIZE) -> int:
+        """Giống BaseDAL._bulk_delete: xóa theo trang, mỗi trang một WriteBatch. Trả về số document đã xóa."""
+        deleted = 0
+        last_doc = None
+        while True:
+            page = query.limit(page_size)
+            if last_doc is not None:
+                page = page.start_after(last_doc)
+            docs = [doc async for doc in page.stream()]
+            if not docs:
+                break
+
+            batch = self.db.batch()
+            for doc in docs:
+                batch.delete(doc.reference)
+            await batch.commit()
+
+            deleted += len(docs)
+            last_doc = docs[-1]
+            self._on_deleted([doc.id for doc in docs])
+            if on_progress:
+                on_progress(deleted)
+            if len(docs) < page_size:
+                break
+        return deleted
@@ -0,0 +1,102 @@
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from dto.channel_dto import ChannelDTO
+from dal.async_base_dal import AsyncBaseDAL
+from dal.base_dal import logger
+
+class AsyncChannelDAL(AsyncBaseDAL):
+    def __init__(self):
+        super().__init__()
+        self.collection = self.db.collection("tbl_channel")
+
+    async def insert_channel(self, channel_dto: ChannelDTO) -> bool:
+        try:
+            doc_ref = self.collection.document(channel_dto.get_channel_id())
+            if (await doc_ref.get()).exists:
+                logger.error(f"Channel with channel_id={channel_dto.get_channel_id()} already exists in 'tbl_channel'")
+                return False
+            await doc_ref.set(channel_dto.to_document())
+            logger.info(f"Data inserted into 'tbl_channel' successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error inserting data into 'tbl_channel': {e}")
+            return False
+
+    async def delete_channel_by_channel_id(self, channel_id: str) -> bool:
+        try:
+            doc_ref = self.collection.document(channel_id)
+            if (await doc_ref.get()).exists:
+                await doc_ref.update({"is_active": False})
+                logger.info(f"Channel {channel_id} marked inactive successfully.")
+                return True
+            else:
+                logger.warning(f"Channel {channel_id} not found.")
+                return False
+        except Exception as e:
+            logger.error(f"Error deleting data from 'tbl_channel': {e}")
+            return False
+
+    async def delete_all_channel(self) -> bool:
+        try:
+            async for doc in self.collection.stream():
+                await doc.reference.update({"is_active": False})
+            logger.info(f"All channels marked inactive successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting all channels: {e}")
+            return False
+
+    async def update_channel(self, channel_dto: ChannelDTO) -> bool:
+        try:
+            doc_ref = self.collection.document(channel_dto.get_channel_id())
+            if (await doc_ref.get()).exists:
+                await doc_ref.update({
+                    "channel_name": channel_dto.get_channel_name(),
+                    "is_active": channel_dto.get_state()
+                })
+                logger.info(f"Channel {channel_dto.get_channel_id()} updated successfully.")
+                return True
+            else:
+                logger.warning(f"Channel {channel_dto.get_channel_id()} not found.")
+                return False
+        except Exception as e:
+            logger.error(f"Error updating channel: {e}")
+            return False
+
+    async def upsert_channel_batch(self, channel_dtos: List[ChannelDTO]) -> bool:
+        """Ghi (tạo mới hoặc ghi đè) nhiều channel bằng WriteBatch, không cần đọc trước."""
+        try:
+            for chunk in self._chunked(channel_dtos):
+                batch = self.db.batch()
+                for channel_dto in chunk:
+                    batch.set(self.collection.document(channel_dto.get_channel_id()), channel_dto.to_document(), merge=True)
+                await batch.commit()
+            logger.info(f"Upserted {len(channel_dtos)} channel(s) into 'tbl_channel'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error upserting channels into 'tbl_channel': {e}")
+            return False
+
+    async def get_channel_by_channel_id(self, channel_id: str) -> Optional[ChannelDTO]:
+        try:
+            doc = await self.collection.document(channel_id).get()
+            return ChannelDTO.from_document(doc.to_dict()) if doc.exists else None
+        except Exception as e:
+            logger.error(f"Error fetching channel {channel_id}: {e}")
+            return None
+
+    async def iter_all_channel(self, ignore_state=False, is_active=True) -> AsyncIterator[ChannelDTO]:
+        try:
+            query = self.collection if ignore_state else self.collection.where("is_active", "==", is_active)
+            async for doc in self._iter_query(query):
+                yield ChannelDTO.from_document(doc.to_dict())
+        except Exception as e:
+            logger.error(f"Error fetching all channels: {e}")
+            raise
+
+    async def get_all_channel(self, ignore_state=False, is_active=True) -> List[ChannelDTO]:
+        try:
+            return [channel_dto async for channel_dto in self.iter_all_channel(ignore_state, is_active)]
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_channel
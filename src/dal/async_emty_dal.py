@@ -0,0 +1,169 @@
+import asyncio
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from typing import Set
+from dto.emty_dto import EmtyDTO
+from dal.async_base_dal import AsyncBaseDAL
+from dal.base_dal import logger
+from dal.base_dal import ProgressCallback
+from dal.emty_dal import EmtyDAL
+from dal.emty_dal import seen_index
+from google.api_core.exceptions import AlreadyExists
+
+class AsyncEmtyDAL(AsyncBaseDAL):
+    def __init__(self):
+        super().__init__()
+        self.collection_name = 'tbl_emty'
+        self.__seen_lock = asyncio.Lock()
+
+    # Cùng doc ID / schema với EmtyDAL
+    _generate_doc_id = EmtyDAL._generate_doc_id
+
+    async def _seen_index(self) -> Optional[Set[str]]:
+        """Tập doc ID đã có trong tbl_emty, nạp một lần, dùng chung với EmtyDAL (xem SeenIndex)."""
+        if seen_index.ids is None:
+            async with self.__seen_lock:
+                if seen_index.ids is None:
+                    try:
+                        refs = self.db.collection(self.collection_name).list_documents()
+                        ids = seen_index.install({ref.id async for ref in refs})
+                        logger.info(f"Loaded {len(ids)} seen emty id(s) from '{self.collection_name}'.")
+                    except Exception as e:
+                        logger.error(f"Error loading seen emty ids from '{self.collection_name}': {e}")
+        return seen_index.ids
+
+    def _forget(self, doc_id: str) -> None:
+        seen_index.discard(doc_id)
+
+    def _on_deleted(self, doc_ids: List[str]) -> None:
+        for doc_id in doc_ids:
+            self._forget(doc_id)
+
+    async def insert_emty(self, emty_dto: EmtyDTO) -> bool:
+        return bool(await self._create_emty(emty_dto))
+
+    async def _create_emty(self, emty_dto: EmtyDTO) -> Optional[bool]:
+        """True = vừa ghi, False = đã tồn tại, None = ghi lỗi (như insert_emty_batch)."""
+        try:
+            doc_id = self._generate_doc_id(emty_dto.get_link_emty(), emty_dto.get_channel_id())
+            seen = await self._seen_index()
+            if seen is not None and doc_id in seen:
+                logger.warning(f"Emty with link_emty={emty_dto.get_link_emty()} and channel_id={emty_dto.get_channel_id()} already exists.")
+                return False
+
+            doc_ref = self.db.collection(self.collection_name).document(doc_id)
+            await doc_ref.create(emty_dto.to_document())
+            if seen is not None:
+                seen.add(doc_id)
+            logger.info(f"Data inserted into '{self.collection_name}' successfully.")
+            return True
+        except AlreadyExists:
+            seen_index.add(doc_id)
+            logger.warning(f"Emty with link_emty={emty_dto.get_link_emty()} and channel_id={emty_dto.get_channel_id()} already exists.")
+            return False
+        except Exception as e:
+            logger.error(f"Error inserting data into '{self.collection_name}': {e}")
+            return None
+
+    async def insert_emty_batch(self, emty_dtos: List[EmtyDTO]) -> List[Optional[bool]]:
+        """Kết quả theo thứ tự đầu vào: True = vừa ghi, False = đã tồn tại, None = ghi lỗi."""
+        results: List[Optional[bool]] = [False] * len(emty_dtos)
+        seen = await self._seen_index()
+        pending = []
+        queued = set()
+        for index, emty_dto in enumerate(emty_dtos):
+            doc_id = self._generate_doc_id(emty_dto.get_link_emty(), emty_dto.get_channel_id())
+            if (seen is not None and doc_id in seen) or doc_id in queued:
+                continue
+            queued.add(doc_id)
+            pending.append((index, doc_id, emty_dto))
+
+        collection = self.db.collection(self.collection_name)
+        for chunk in self._chunked(pending):
+            try:
+                batch = self.db.batch()
+                for _, doc_id, emty_dto in chunk:
+                    batch.create(collection.document(doc_id), emty_dto.to_document())
+                await batch.commit()
+                for index, doc_id, _ in chunk:
+                    results[index] = True
+                    if seen is not None:
+                        seen.add(doc_id)
+                logger.info(f"Batch inserted {len(chunk)} emty(s) into '{self.collection_name}'.")
+            except AlreadyExists:
+                # Ghi lại từng cái (song song) để có kết quả chính xác cho từng document
+                inserted = await asyncio.gather(*(self._create_emty(emty_dto) for _, _, emty_dto in chunk))
+                for (index, _, _), result in zip(chunk, inserted):
+                    results[index] = result
+            except Exception as e:
+                logger.error(f"Error batch inserting data into '{self.collection_name}': {e}")
+                for index, _, _ in chunk:
+                    results[index] = None
+        return results
+
+    async def delete_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> bool:
+        try:
+            doc_id = self._generate_doc_id(emty_link, channel_id)
+            await self.db.collection(self.collection_name).document(doc_id).delete()
+            self._forget(doc_id)
+            logger.info(f"Data deleted from '{self.collection_name}' successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data from '{self.collection_name}': {e}")
+            return False
+
+    async def delete_emty_by_link_atom_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            query = self.db.collection(self.collection_name) \
+                           .where("link_atom_feed", "==", link_atom_feed) \
+                           .where("channel_id", "==", channel_id)
+            return await self._bulk_delete(query, on_progress) > 0
+        except Exception as e:
+            logger.error(f"Error deleting data from '{self.collection_name}': {e}")
+            return False
+
+    async def delete_emty_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            query = self.db.collection(self.collection_name).where("channel_id", "==", channel_id)
+            deleted = await self._bulk_delete(query, on_progress)
+            logger.info(f"All data for channel_id={channel_id} deleted successfully ({deleted} document(s)).")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data by channel_id from '{self.collection_name}': {e}")
+            return False
+
+    async def delete_all_emty(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            deleted = await self._bulk_delete(self.db.collection(self.collection_name), on_progress)
+            logger.info(f"All data deleted successfully ({deleted} document(s)).")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting all data from '{self.collection_name}': {e}")
+            return False
+
+    async def get_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> Optional[EmtyDTO]:
+        try:
+            doc_id = self._generate_doc_id(emty_link, channel_id)
+            seen = await self._seen_index()
+            if seen is not None and doc_id not in seen:
+                return None
+            doc = await self.db.collection(self.collection_name).document(doc_id).get()
+            return EmtyDTO.from_document(doc.to_dict()) if doc.exists else None
+        except Exception as e:
+            logger.error(f"Error fetching data from '{self.collection_name}': {e}")
+            return None
+
+    async def iter_all_emty(self) -> AsyncIterator[EmtyDTO]:
+        try:
+            async for doc in self._iter_query(self.db.collection(self.collection_name)):
+                yield EmtyDTO.from_document(doc.to_dict())
+        except Exception as e:
+            logger.error(f"Error fetching all data from '{self.collection_name}': {e}")
+            raise
+
+    async def get_all_emty(self) -> List[EmtyDTO]:
+        try:
+            return [emty_dto async for emty_dto in self.iter_all_emty()]
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_emty
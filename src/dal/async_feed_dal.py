@@ -0,0 +1,177 @@
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from dto.feed_dto import FeedDTO
+from dal.async_base_dal import AsyncBaseDAL
+from dal.base_dal import logger
+from dal.base_dal import ProgressCallback
+from dal.feed_dal import FeedDAL
+import traceback
+
+
+class AsyncFeedDAL(AsyncBaseDAL):
+    def __init__(self):
+        super().__init__()
+        self.collection_name = "tbl_feed"
+
+    # Dùng chung cách sinh doc ID với FeedDAL để hai bản luôn trỏ cùng document
+    _generate_doc_id = FeedDAL._generate_doc_id
+    _doc_id = FeedDAL._doc_id
+    _updatable_fields = staticmethod(FeedDAL._updatable_fields)
+
+    async def insert_feed(self, feed_dto: FeedDTO) -> bool:
+        try:
+            doc_id = self._generate_doc_id(feed_dto)
+            doc_ref = self.db.collection(self.collection_name).document(doc_id)
+
+            if (await doc_ref.get()).exists:
+                logger.warning(f"Feed đã tồn tại: {doc_id}")
+                return False
+
+            await doc_ref.set(feed_dto.to_document())
+            logger.info(f"Thêm feed thành công: {doc_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi insert feed: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def delete_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            query = self.db.collection(self.collection_name) \
+                           .where("link_atom_feed", "==", link_atom_feed) \
+                           .where("channel_id", "==", channel_id)
+            return await self._bulk_delete(query, on_progress) > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi delete feed theo link_atom_feed+channel_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            query = self.db.collection(self.collection_name) \
+                           .where("link_feed", "==", link_feed) \
+                           .where("channel_id", "==", channel_id)
+            return await self._bulk_delete(query, on_progress) > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi delete feed theo link_feed+channel_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def delete_feed_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            query = self.db.collection(self.collection_name) \
+                           .where("channel_id", "==", channel_id)
+            return await self._bulk_delete(query, on_progress) > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi delete feed theo channel_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def delete_all_feed(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            await self._bulk_delete(self.db.collection(self.collection_name), on_progress)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi delete all feed: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def update_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str, feed_dto: FeedDTO) -> bool:
+        try:
+            query = self.db.collection(self.collection_name) \
+                           .where("link_atom_feed", "==", link_atom_feed) \
+                           .where("channel_id", "==", channel_id) \
+                           .stream()
+            fields = self._updatable_fields(feed_dto)
+            updated = False
+            async for doc in query:
+                await doc.reference.update(fields)
+                updated = True
+            return updated
+        except Exception as e:
+            logger.error(f"Lỗi khi update feed: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def update_last_emty(self, feed_dto: FeedDTO, link_emty: str) -> bool:
+        """Lưu con trỏ (link entry mới nhất đã gửi) cho cặp feed + channel."""
+        try:
+            doc_id = self._doc_id(feed_dto)
+            await self.db.collection(self.collection_name).document(doc_id).update({"last_emty_link": link_emty})
+            feed_dto.set_last_emty_link(link_emty)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi update last_emty_link: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def update_last_emty_batch(self, cursors: List[Tuple[FeedDTO, str]]) -> bool:
+        """Lưu con trỏ cho nhiều subscription bằng WriteBatch (tối đa BATCH_SIZE mỗi lần commit)."""
+        try:
+            collection = self.db.collection(self.collection_name)
+            for chunk in self._chunked(cursors):
+                batch = self.db.batch()
+                for feed_dto, link_emty in chunk:
+                    batch.update(collection.document(self._doc_id(feed_dto)), {"last_emty_link": link_emty})
+                await batch.commit()
+                for feed_dto, link_emty in chunk:
+                    feed_dto.set_last_emty_link(link_emty)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi batch update last_emty_link: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def update_server_id_batch(self, updates: List[Tuple[FeedDTO, str]]) -> bool:
+        """Gán server_id cho nhiều feed (dùng khi backfill các document cũ)."""
+        try:
+            collection = self.db.collection(self.collection_name)
+            for chunk in self._chunked(updates):
+                batch = self.db.batch()
+                for feed_dto, server_id in chunk:
+                    batch.update(collection.document(self._doc_id(feed_dto)), {"server_id": server_id})
+                await batch.commit()
+                for feed_dto, server_id in chunk:
+                    feed_dto.set_server_id(server_id)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi batch update server_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    async def get_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str) -> Optional[FeedDTO]:
+        try:
+            query = self.db.collection(self.collection_name) \
+                           .where("link_atom_feed", "==", link_atom_feed) \
+                           .where("channel_id", "==", str(channel_id)) \
+                           .limit(1) \
+                           .stream()
+            async for doc in query:
+                return FeedDTO.from_document(doc.to_dict(), doc.id)
+            return None
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed: {e}\n{traceback.format_exc()}")
+            return None
+
+    async def iter_all_feed(self) -> AsyncIterator[FeedDTO]:
+        try:
+            async for doc in self._iter_query(self.db.collection(self.collection_name)):
+                yield FeedDTO.from_document(doc.to_dict(), doc.id)
+        except Exception as e:
+            logger.error(f"Lỗi khi get all feed: {e}\n{traceback.format_exc()}")
+            raise
+
+    async def get_all_feed(self) -> List[FeedDTO]:
+        try:
+            return [feed_dto async for feed_dto in self.iter_all_feed()]
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_feed
+
+    async def get_all_feed_by_channel_id(self, channel_id: str) -> List[FeedDTO]:
+        try:
+            docs = self.db.collection(self.collection_name).where("channel_id", "==", str(channel_id)).stream()
+            return [FeedDTO.from_document(d.to_dict(), d.id) async for d in docs]
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed theo channel_id: {e}\n{traceback.format_exc()}")
+            return []
+
+    async def get_all_feed_by_server_id(self, server_id: str) -> List[FeedDTO]:
+        try:
+            docs = self.db.collection(self.collection_name).where("server_id", "==", str(server_id)).stream()
+            return [FeedDTO.from_document(d.to_dict(), d.id) async for d in docs]
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed theo server_id: {e}\n{traceback.format_exc()}")
+            return []
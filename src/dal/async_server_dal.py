@@ -0,0 +1,101 @@
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from dto.server_dto import ServerDTO
+from dal.async_base_dal import AsyncBaseDAL
+from dal.base_dal import logger
+
+class AsyncServerDAL(AsyncBaseDAL):
+    def __init__(self):
+        super().__init__()
+        self.collection = self.db.collection("tbl_server")
+
+    async def insert_server(self, server_dto: ServerDTO) -> bool:
+        try:
+            doc_ref = self.collection.document(server_dto.get_server_id())
+            if (await doc_ref.get()).exists:
+                logger.error(f"Server with server_id={server_dto.get_server_id()} already exists in 'tbl_server'")
+                return False
+            await doc_ref.set(server_dto.to_document())
+            logger.info(f"Data inserted successfully into 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error inserting data into 'tbl_server': {e}")
+            return False
+
+    async def delete_server_by_server_id(self, server_id: str) -> bool:
+        try:
+            doc_ref = self.collection.document(server_id)
+            if not (await doc_ref.get()).exists:
+                logger.error(f"Server with id={server_id} not found.")
+                return False
+            await doc_ref.update({"is_active": False})
+            logger.info(f"Data deleted successfully from 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data from 'tbl_server': {e}")
+            return False
+
+    async def delete_all_server(self) -> bool:
+        try:
+            async for doc in self.collection.stream():
+                await doc.reference.update({"is_active": False})
+            logger.info("All data marked as deleted in 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting all data from 'tbl_server': {e}")
+            return False
+
+    async def update_server(self, server_dto: ServerDTO) -> bool:
+        try:
+            doc_ref = self.collection.document(server_dto.get_server_id())
+            if not (await doc_ref.get()).exists:
+                logger.error(f"Server with id={server_dto.get_server_id()} not found for update.")
+                return False
+            await doc_ref.update({
+                "server_name": server_dto.get_server_name(),
+                "hex_color": server_dto.get_hex_color(),
+                "is_active": server_dto.get_state()
+            })
+            logger.info(f"Server {server_dto.get_server_id()} updated successfully in 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error updating server: {e}")
+            return False
+
+    async def upsert_server_batch(self, server_dtos: List[ServerDTO]) -> bool:
+        """Ghi (tạo mới hoặc ghi đè) nhiều server bằng WriteBatch, không cần đọc trước."""
+        try:
+            for chunk in self._chunked(server_dtos):
+                batch = self.db.batch()
+                for server_dto in chunk:
+                    batch.set(self.collection.document(server_dto.get_server_id()), server_dto.to_document(), merge=True)
+                await batch.commit()
+            logger.info(f"Upserted {len(server_dtos)} server(s) into 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error upserting servers into 'tbl_server': {e}")
+            return False
+
+    async def get_server_by_server_id(self, server_id: str) -> Optional[ServerDTO]:
+        try:
+            doc = await self.collection.document(server_id).get()
+            return ServerDTO.from_document(doc.to_dict()) if doc.exists else None
+        except Exception as e:
+            logger.error(f"Error fetching server by id={server_id}: {e}")
+            return None
+
+    async def iter_all_server(self, ignore_state=False, is_active=True) -> AsyncIterator[ServerDTO]:
+        try:
+            query = self.collection if ignore_state else self.collection.where("is_active", "==", is_active)
+            async for doc in self._iter_query(query):
+                yield ServerDTO.from_document(doc.to_dict())
+        except Exception as e:
+            logger.error(f"Error fetching all servers: {e}")
+            raise
+
+    async def get_all_server(self, ignore_state=False, is_active=True) -> List[ServerDTO]:
+        try:
+            return [server_dto async for server_dto in self.iter_all_server(ignore_state, is_active)]
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_server
@@ -5,21 +5,92 @@ from dotenv import load_dotenv
 import logging
 import os
 import json
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar
 
 load_dotenv()
 logger = logging.getLogger("dal")
 
+# Firestore giới hạn 500 thao tác cho mỗi WriteBatch
+BATCH_SIZE = 500
+
+T = TypeVar("T")
+
+# Số document đọc mỗi trang khi duyệt cả collection (iter_all_*)
+PAGE_SIZE = int(os.getenv("DAL_PAGE_SIZE", "500"))
+
+# Callback nhận tổng số document đã xử lý tới thời điểm hiện tại
+ProgressCallback = Callable[[int], None]
+
+def init_firebase_app() -> None:
+    """Khởi tạo firebase app mặc định (một lần) cho cả DAL sync và async."""
+    # Lấy đường dẫn file credentials từ biến môi trường
+    firebase_json = os.getenv("FIREBASE_CREDENTIALS")
+    if not firebase_admin._apps:
+        if firebase_json and os.path.exists(firebase_json):
+            cred = credentials.Certificate(firebase_json)
+        else:
+            # Hoặc đọc JSON từ ENV (nếu lưu trực tiếp trong GitHub Secrets)
+            cred_dict = json.loads(os.getenv("FIREBASE_CREDENTIALS_JSON"))
+            cred = credentials.Certificate(cred_dict)
+
+        firebase_admin.initialize_app(cred)
+
 class BaseDAL:
     def __init__(self):
-        # Lấy đường dẫn file credentials từ biến môi trường
-        firebase_json = os.getenv("FIREBASE_CREDENTIALS")
-        if not firebase_admin._apps:
-            if firebase_json and os.path.exists(firebase_json):
-                cred = credentials.Certificate(firebase_json)
-            else:
-                # Hoặc đọc JSON từ ENV (nếu lưu trực tiếp trong GitHub Secrets)
-                cred_dict = json.loads(os.getenv("FIREBASE_CREDENTIALS_JSON"))
-                cred = credentials.Certificate(cred_dict)
-
-            firebase_admin.initialize_app(cred)
+        init_firebase_app()
         self.db = firestore.client()
+
+    @staticmethod
+    def _chunked(items: Sequence[T], size: int = BATCH_SIZE) -> Iterator[List[T]]:
+        for start in range(0, len(items), size):
+            yield list(items[start:start + size])
+
+    @staticmethod
+    def _iter_query(query, page_size: int = PAGE_SIZE) -> Iterator[Any]:
+        """
+        Duyệt `query` theo trang (limit + start_after), chỉ giữ một trang trong bộ nhớ
+        thay vì tải cả collection như stream() rồi list().
+        """
+        last_doc = None
+        while True:
+            page = query.limit(page_size)
+            if last_doc is not None:
+                page = page.start_after(last_doc)
+            docs = list(page.stream())
+            yield from docs
+            if len(docs) < page_size:
+                return
+            last_doc = docs[-1]
+
+    def _on_deleted(self, doc_ids: List[str]) -> None:
+        """Hook cho lớp con, được gọi sau mỗi batch xóa thành công."""
+        pass
+
+    def _bulk_delete(self, query, on_progress: Optional[ProgressCallback] = None, page_size: int = BATCH_SIZE) -> int:
+        """
+        Xóa mọi document khớp `query`: đọc theo trang (limit + start_after), mỗi trang xóa bằng một WriteBatch.
+        Trả về số document đã xóa.
+        """
+        deleted = 0
+        last_doc = None
+        while True:
+            page = query.limit(page_size)
+            if last_doc is not None:
+                page = page.start_after(last_doc)
+            docs = list(page.stream())
+            if not docs:
+                break
+
+            batch = self.db.batch()
+            for doc in docs:
+                batch.delete(doc.reference)
+            batch.commit()
+
+            deleted += len(docs)
+            last_doc = docs[-1]
+            self._on_deleted([doc.id for doc in docs])
+            if on_progress:
+                on_progress(deleted)
+            if len(docs) < page_size:
+                break
+        return deleted
@@ -1,3 +1,4 @@
+from typing import Iterator
 from typing import List
 from typing import Optional
 from dto.channel_dto import ChannelDTO
@@ -16,12 +17,7 @@ class ChannelDAL(BaseDAL):
             if doc_ref.get().exists:
                 logger.error(f"Channel with channel_id={channel_dto.get_channel_id()} already exists in 'tbl_channel'")
                 return False
-            doc_ref.set({
-                "channel_id": channel_dto.get_channel_id(),
-                "server_id": channel_dto.get_server_id(),
-                "channel_name": channel_dto.get_channel_name(),
-                "is_active": channel_dto.get_state() if channel_dto.get_state() is not None else True
-            })
+            doc_ref.set(channel_dto.to_document())
             logger.info(f"Data inserted into 'tbl_channel' successfully.")
             return True
         except Exception as e:
@@ -70,39 +66,42 @@ class ChannelDAL(BaseDAL):
             logger.error(f"Error updating channel: {e}")
             return False
 
+    def upsert_channel_batch(self, channel_dtos: List[ChannelDTO]) -> bool:
+        """Ghi (tạo mới hoặc ghi đè) nhiều channel bằng WriteBatch, không cần đọc trước."""
+        try:
+            for chunk in self._chunked(channel_dtos):
+                batch = self.db.batch()
+                for channel_dto in chunk:
+                    batch.set(self.collection.document(channel_dto.get_channel_id()), channel_dto.to_document(), merge=True)
+                batch.commit()
+            logger.info(f"Upserted {len(channel_dtos)} channel(s) into 'tbl_channel'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error upserting channels into 'tbl_channel': {e}")
+            return False
+
     def get_channel_by_channel_id(self, channel_id: str) -> Optional[ChannelDTO]:
         try:
             doc: DocumentSnapshot = self.collection.document(channel_id).get()
             if doc.exists:
-                data = doc.to_dict()
-                return ChannelDTO(
-                    data["channel_id"],
-                    data["server_id"],
-                    data["channel_name"],
-                    bool(data.get("is_active", True))
-                )
+                return ChannelDTO.from_document(doc.to_dict())
             return None
         except Exception as e:
             logger.error(f"Error fetching channel {channel_id}: {e}")
             return None
 
-    def get_all_channel(self, ignore_state=False, is_active=True) -> List[ChannelDTO]:
+    def iter_all_channel(self, ignore_state=False, is_active=True) -> Iterator[ChannelDTO]:
+        """Duyệt tbl_channel theo trang (mỗi lần chỉ giữ một trang trong bộ nhớ)."""
         try:
-            if ignore_state:
-                docs = self.collection.stream()
-            else:
-                docs = self.collection.where("is_active", "==", is_active).stream()
-
-            result = []
-            for doc in docs:
-                data = doc.to_dict()
-                result.append(ChannelDTO(
-                    data["channel_id"],
-                    data["server_id"],
-                    data["channel_name"],
-                    bool(data.get("is_active", True))
-                ))
-            return result
+            query = self.collection if ignore_state else self.collection.where("is_active", "==", is_active)
+            for doc in self._iter_query(query):
+                yield ChannelDTO.from_document(doc.to_dict())
         except Exception as e:
             logger.error(f"Error fetching all channels: {e}")
-            return []
+            raise
+
+    def get_all_channel(self, ignore_state=False, is_active=True) -> List[ChannelDTO]:
+        try:
+            return list(self.iter_all_channel(ignore_state, is_active))
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_channel
@@ -0,0 +1,61 @@
+import os
+from dal.async_adapter import AsyncDALAdapter
+
+# Backend lưu trữ: "firestore" (mặc định) hoặc "sqlite"
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "firestore").strip().lower()
+
+def use_sqlite() -> bool:
+    return STORAGE_BACKEND == "sqlite"
+
+def create_feed_dal():
+    if use_sqlite():
+        from dal.sqlite_feed_dal import SqliteFeedDAL
+        return SqliteFeedDAL()
+    from dal.feed_dal import FeedDAL
+    return FeedDAL()
+
+def create_emty_dal():
+    if use_sqlite():
+        from dal.sqlite_emty_dal import SqliteEmtyDAL
+        return SqliteEmtyDAL()
+    from dal.emty_dal import EmtyDAL
+    return EmtyDAL()
+
+def create_channel_dal():
+    if use_sqlite():
+        from dal.sqlite_channel_dal import SqliteChannelDAL
+        return SqliteChannelDAL()
+    from dal.channel_dal import ChannelDAL
+    return ChannelDAL()
+
+def create_server_dal():
+    if use_sqlite():
+        from dal.sqlite_server_dal import SqliteServerDAL
+        return SqliteServerDAL()
+    from dal.server_dal import ServerDAL
+    return ServerDAL()
+
+# SQLite không có client async: bọc DAL đồng bộ để chạy trên executor
+def create_async_feed_dal():
+    if use_sqlite():
+        return AsyncDALAdapter(create_feed_dal())
+    from dal.async_feed_dal import AsyncFeedDAL
+    return AsyncFeedDAL()
+
+def create_async_emty_dal():
+    if use_sqlite():
+        return AsyncDALAdapter(create_emty_dal())
+    from dal.async_emty_dal import AsyncEmtyDAL
+    return AsyncEmtyDAL()
+
+def create_async_channel_dal():
+    if use_sqlite():
+        return AsyncDALAdapter(create_channel_dal())
+    from dal.async_channel_dal import AsyncChannelDAL
+    return AsyncChannelDAL()
+
+def create_async_server_dal():
+    if use_sqlite():
+        return AsyncDALAdapter(create_server_dal())
+    from dal.async_server_dal import AsyncServerDAL
+    return AsyncServerDAL()
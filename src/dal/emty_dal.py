@@ -1,13 +1,45 @@
 import hashlib
+import threading
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from dto.emty_dto import EmtyDTO
 from dal.base_dal import BaseDAL
 from dal.base_dal import logger
+from dal.base_dal import ProgressCallback
 import google.generativeai as genai
 from google.cloud import firestore
+from google.api_core.exceptions import AlreadyExists
 import os
 
+class SeenIndex:
+    """
+    Tập doc ID đã có trong tbl_emty, dùng chung cho EmtyDAL và AsyncEmtyDAL trong cả tiến trình,
+    để ghi/xóa qua DAL này thì kiểm tra trùng ở DAL kia vẫn đúng. `ids` là None khi chưa nạp.
+    """
+    def __init__(self):
+        self.ids: Optional[Set[str]] = None
+        self.load_lock = threading.Lock()  # Chỉ một lần nạp từ EmtyDAL (AsyncEmtyDAL có lock riêng)
+        self.__lock = threading.Lock()
+
+    def install(self, ids: Set[str]) -> Set[str]:
+        """Dùng `ids` vừa nạp, trừ khi DAL kia đã nạp trước; trả về tập đang dùng."""
+        with self.__lock:
+            if self.ids is None:
+                self.ids = ids
+            return self.ids
+
+    def add(self, doc_id: str) -> None:
+        if self.ids is not None:
+            self.ids.add(doc_id)
+
+    def discard(self, doc_id: str) -> None:
+        if self.ids is not None:
+            self.ids.discard(doc_id)
+
+seen_index = SeenIndex()
+
 class EmtyDAL(BaseDAL):
     def __init__(self):
         super().__init__()
@@ -20,73 +52,130 @@ class EmtyDAL(BaseDAL):
         hash_input = f"{link_emty}_{channel_id}"
         return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
 
+    def _seen_index(self) -> Optional[Set[str]]:
+        """
+        Tập doc ID đã có trong tbl_emty, nạp một lần (chỉ lấy ID, không tải nội dung)
+        rồi được cập nhật theo mỗi lần insert/delete. Trả về None nếu chưa nạp được.
+        """
+        if seen_index.ids is None:
+            with seen_index.load_lock:
+                if seen_index.ids is None:
+                    try:
+                        refs = self.db.collection(self.collection_name).list_documents()
+                        ids = seen_index.install({ref.id for ref in refs})
+                        logger.info(f"Loaded {len(ids)} seen emty id(s) from '{self.collection_name}'.")
+                    except Exception as e:
+                        logger.error(f"Error loading seen emty ids from '{self.collection_name}': {e}")
+        return seen_index.ids
+
+    def _forget(self, doc_id: str) -> None:
+        seen_index.discard(doc_id)
+
+    def _on_deleted(self, doc_ids: List[str]) -> None:
+        for doc_id in doc_ids:
+            self._forget(doc_id)
+
     def insert_emty(self, emty_dto: EmtyDTO) -> bool:
+        return bool(self._create_emty(emty_dto))
+
+    def _create_emty(self, emty_dto: EmtyDTO) -> Optional[bool]:
+        """True = vừa ghi, False = đã tồn tại, None = ghi lỗi (như insert_emty_batch)."""
         try:
             doc_id = self._generate_doc_id(emty_dto.get_link_emty(), emty_dto.get_channel_id())
-            doc_ref = self.db.collection(self.collection_name).document(doc_id)
-            if doc_ref.get().exists:
+            seen = self._seen_index()
+            if seen is not None and doc_id in seen:
                 logger.warning(f"Emty with link_emty={emty_dto.get_link_emty()} and channel_id={emty_dto.get_channel_id()} already exists.")
                 return False
 
-            doc_ref.set({
-                "link_emty": emty_dto.get_link_emty(),
-                "link_feed": emty_dto.get_link_feed(),
-                "link_atom_feed": emty_dto.get_link_atom_feed(),
-                "title_emty": emty_dto.get_title_emty(),
-                "description_emty": emty_dto.get_description_emty(),
-                "image_emty": emty_dto.get_image_emty(),
-                "pubdate_emty": emty_dto.get_pubdate_emty(),
-                "channel_id": emty_dto.get_channel_id()
-            })
+            # create() thất bại nếu document đã tồn tại → kiểm tra + ghi trong một round trip
+            doc_ref = self.db.collection(self.collection_name).document(doc_id)
+            doc_ref.create(emty_dto.to_document())
+            if seen is not None:
+                seen.add(doc_id)
             logger.info(f"Data inserted into '{self.collection_name}' successfully.")
             return True
+        except AlreadyExists:
+            seen_index.add(doc_id)
+            logger.warning(f"Emty with link_emty={emty_dto.get_link_emty()} and channel_id={emty_dto.get_channel_id()} already exists.")
+            return False
         except Exception as e:
             logger.error(f"Error inserting data into '{self.collection_name}': {e}")
-            return False
+            return None
+
+    def insert_emty_batch(self, emty_dtos: List[EmtyDTO]) -> List[Optional[bool]]:
+        """
+        Ghi nhiều emty bằng WriteBatch, mỗi lần commit tối đa BATCH_SIZE document.
+        Kết quả theo thứ tự đầu vào: True = vừa ghi, False = đã tồn tại, None = ghi lỗi.
+        """
+        results: List[Optional[bool]] = [False] * len(emty_dtos)
+        seen = self._seen_index()
+        pending = []
+        queued = set()
+        for index, emty_dto in enumerate(emty_dtos):
+            doc_id = self._generate_doc_id(emty_dto.get_link_emty(), emty_dto.get_channel_id())
+            if (seen is not None and doc_id in seen) or doc_id in queued:
+                continue
+            queued.add(doc_id)
+            pending.append((index, doc_id, emty_dto))
+
+        collection = self.db.collection(self.collection_name)
+        for chunk in self._chunked(pending):
+            try:
+                batch = self.db.batch()
+                for _, doc_id, emty_dto in chunk:
+                    batch.create(collection.document(doc_id), emty_dto.to_document())
+                batch.commit()
+                for index, doc_id, _ in chunk:
+                    results[index] = True
+                    if seen is not None:
+                        seen.add(doc_id)
+                logger.info(f"Batch inserted {len(chunk)} emty(s) into '{self.collection_name}'.")
+            except AlreadyExists:
+                # Một document đã tồn tại làm cả batch bị hủy → ghi lại từng cái để có kết quả chính xác
+                for index, _, emty_dto in chunk:
+                    results[index] = self._create_emty(emty_dto)
+            except Exception as e:
+                logger.error(f"Error batch inserting data into '{self.collection_name}': {e}")
+                for index, _, _ in chunk:
+                    results[index] = None
+        return results
 
     def delete_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> bool:
         try:
             doc_id = self._generate_doc_id(emty_link, channel_id)
             doc_ref = self.db.collection(self.collection_name).document(doc_id)
             doc_ref.delete()
+            self._forget(doc_id)
             logger.info(f"Data deleted from '{self.collection_name}' successfully.")
             return True
         except Exception as e:
             logger.error(f"Error deleting data from '{self.collection_name}': {e}")
             return False
         
-    def delete_emty_by_link_atom_and_channel_id(self, link_atom_feed: str, channel_id: str) -> bool:
+    def delete_emty_by_link_atom_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
-            docs = self.db.collection(self.collection_name) \
+            query = self.db.collection(self.collection_name) \
                            .where("link_atom_feed", "==", link_atom_feed) \
-                           .where("channel_id", "==", channel_id) \
-                           .stream()
-            deleted = False
-            for doc in docs:
-                doc.reference.delete()
-                deleted = True
-            return deleted
+                           .where("channel_id", "==", channel_id)
+            return self._bulk_delete(query, on_progress) > 0
         except Exception as e:
             logger.error(f"Error deleting data from '{self.collection_name}': {e}")
             return False
 
-    def delete_emty_by_channel_id(self, channel_id: str) -> bool:
+    def delete_emty_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
-            docs = self.db.collection(self.collection_name).where("channel_id", "==", channel_id).stream()
-            for doc in docs:
-                doc.reference.delete()
-            logger.info(f"All data for channel_id={channel_id} deleted successfully.")
+            query = self.db.collection(self.collection_name).where("channel_id", "==", channel_id)
+            deleted = self._bulk_delete(query, on_progress)
+            logger.info(f"All data for channel_id={channel_id} deleted successfully ({deleted} document(s)).")
             return True
         except Exception as e:
             logger.error(f"Error deleting data by channel_id from '{self.collection_name}': {e}")
             return False
 
-    def delete_all_emty(self) -> bool:
+    def delete_all_emty(self, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
-            docs = self.db.collection(self.collection_name).stream()
-            for doc in docs:
-                doc.reference.delete()
-            logger.info("All data deleted successfully.")
+            deleted = self._bulk_delete(self.db.collection(self.collection_name), on_progress)
+            logger.info(f"All data deleted successfully ({deleted} document(s)).")
             return True
         except Exception as e:
             logger.error(f"Error deleting all data from '{self.collection_name}': {e}")
@@ -95,40 +184,30 @@ class EmtyDAL(BaseDAL):
     def get_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> Optional[EmtyDTO]:
         try:
             doc_id = self._generate_doc_id(emty_link, channel_id)
+            seen = self._seen_index()
+            if seen is not None and doc_id not in seen:
+                return None
             doc_ref = self.db.collection(self.collection_name).document(doc_id)
             doc = doc_ref.get()
             if doc.exists:
-                data = doc.to_dict()
-                return EmtyDTO(
-                    data["link_emty"],
-                    data["link_feed"],
-                    data["link_atom_feed"],
-                    data["title_emty"],
-                    data["description_emty"],
-                    data["image_emty"],
-                    data["pubdate_emty"],
-                    data["channel_id"]
-                )
+                return EmtyDTO.from_document(doc.to_dict())
             else:
                 return None
         except Exception as e:
             logger.error(f"Error fetching data from '{self.collection_name}': {e}")
             return None
 
-    def get_all_emty(self) -> List[EmtyDTO]:
+    def iter_all_emty(self) -> Iterator[EmtyDTO]:
+        """Duyệt tbl_emty theo trang (mỗi lần chỉ giữ một trang trong bộ nhớ)."""
         try:
-            docs = self.db.collection(self.collection_name).stream()
-            return [
-                EmtyDTO(
-                    d.to_dict()["link_emty"],
-                    d.to_dict()["link_feed"],
-                    d.to_dict()["link_atom_feed"],
-                    d.to_dict()["title_emty"],
-                    d.to_dict()["description_emty"],
-                    d.to_dict()["image_emty"],
-                    d.to_dict()["pubdate_emty"],
-                    d.to_dict()["channel_id"]
-                ) for d in docs]
+            for doc in self._iter_query(self.db.collection(self.collection_name)):
+                yield EmtyDTO.from_document(doc.to_dict())
         except Exception as e:
             logger.error(f"Error fetching all data from '{self.collection_name}': {e}")
-            return []
+            raise
+
+    def get_all_emty(self) -> List[EmtyDTO]:
+        try:
+            return list(self.iter_all_emty())
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_emty
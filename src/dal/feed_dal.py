@@ -1,11 +1,14 @@
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from dto.feed_dto import FeedDTO
 from firebase_admin import credentials
 from firebase_admin import firestore
 from firebase_admin import initialize_app
 from dal.base_dal import BaseDAL
 from dal.base_dal import logger
+from dal.base_dal import ProgressCallback
 import hashlib
 import traceback
 
@@ -26,6 +29,17 @@ class FeedDAL(BaseDAL):
         raw_id = f"{feed_dto.get_link_feed()}_{feed_dto.get_link_atom_feed()}_{feed_dto.get_channel_id()}"
         return hashlib.md5(raw_id.encode("utf-8")).hexdigest()
 
+    def _doc_id(self, feed_dto: FeedDTO) -> str:
+        """ID đã đọc từ DB nếu có (document cũ có thể không khớp _generate_doc_id), nếu không thì sinh lại."""
+        return feed_dto.get_doc_id() or self._generate_doc_id(feed_dto)
+
+    @staticmethod
+    def _updatable_fields(feed_dto: FeedDTO) -> dict:
+        """Các field được ghi đè khi cập nhật feed (giữ nguyên channel_id, server_id và con trỏ)."""
+        document = feed_dto.to_document()
+        del document["channel_id"], document["last_emty_link"], document["server_id"]
+        return document
+
     def insert_feed(self, feed_dto: FeedDTO) -> bool:
         try:
             doc_id = self._generate_doc_id(feed_dto)
@@ -35,70 +49,45 @@ class FeedDAL(BaseDAL):
                 logger.warning(f"Feed đã tồn tại: {doc_id}")
                 return False
 
-            doc_ref.set({
-                "link_feed": feed_dto.get_link_feed(),
-                "link_atom_feed": feed_dto.get_link_atom_feed(),
-                "title_feed": feed_dto.get_title_feed(),
-                "description_feed": feed_dto.get_description_feed(),
-                "logo_feed": feed_dto.get_logo_feed(),
-                "pubdate_feed": feed_dto.get_pubdate_feed(),
-                "channel_id": feed_dto.get_channel_id()
-            })
+            doc_ref.set(feed_dto.to_document())
             logger.info(f"Thêm feed thành công: {doc_id}")
             return True
         except Exception as e:
             logger.error(f"Lỗi khi insert feed: {e}\n{traceback.format_exc()}")
             return False
 
-    def delete_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str) -> bool:
+    def delete_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
             query = self.db.collection(self.collection_name) \
                            .where("link_atom_feed", "==", link_atom_feed) \
-                           .where("channel_id", "==", channel_id) \
-                           .stream()
-            deleted = False
-            for doc in query:
-                doc.reference.delete()
-                deleted = True
-            return deleted
+                           .where("channel_id", "==", channel_id)
+            return self._bulk_delete(query, on_progress) > 0
         except Exception as e:
             logger.error(f"Lỗi khi delete feed theo link_atom_feed+channel_id: {e}\n{traceback.format_exc()}")
             return False
 
-    def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str) -> bool:
+    def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
             query = self.db.collection(self.collection_name) \
                            .where("link_feed", "==", link_feed) \
-                           .where("channel_id", "==", channel_id) \
-                           .stream()
-            deleted = False
-            for doc in query:
-                doc.reference.delete()
-                deleted = True
-            return deleted
+                           .where("channel_id", "==", channel_id)
+            return self._bulk_delete(query, on_progress) > 0
         except Exception as e:
             logger.error(f"Lỗi khi delete feed theo link_feed+channel_id: {e}\n{traceback.format_exc()}")
             return False
 
-    def delete_feed_by_channel_id(self, channel_id: str) -> bool:
+    def delete_feed_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
             query = self.db.collection(self.collection_name) \
-                           .where("channel_id", "==", channel_id) \
-                           .stream()
-            deleted = False
-            for doc in query:
-                doc.reference.delete()
-                deleted = True
-            return deleted
+                           .where("channel_id", "==", channel_id)
+            return self._bulk_delete(query, on_progress) > 0
         except Exception as e:
             logger.error(f"Lỗi khi delete feed theo channel_id: {e}\n{traceback.format_exc()}")
             return False
 
-    def delete_all_feed(self) -> bool:
+    def delete_all_feed(self, on_progress: Optional[ProgressCallback] = None) -> bool:
         try:
-            docs = self.db.collection(self.collection_name).stream()
-            for doc in docs:
-                doc.reference.delete()
+            self._bulk_delete(self.db.collection(self.collection_name), on_progress)
             return True
         except Exception as e:
             logger.error(f"Lỗi khi delete all feed: {e}\n{traceback.format_exc()}")
@@ -110,22 +99,59 @@ class FeedDAL(BaseDAL):
                            .where("link_atom_feed", "==", link_atom_feed) \
                            .where("channel_id", "==", channel_id) \
                            .stream()
+            fields = self._updatable_fields(feed_dto)
             updated = False
             for doc in query:
-                doc.reference.update({
-                    "link_feed": feed_dto.get_link_feed(),
-                    "link_atom_feed": feed_dto.get_link_atom_feed(),
-                    "title_feed": feed_dto.get_title_feed(),
-                    "description_feed": feed_dto.get_description_feed(),
-                    "logo_feed": feed_dto.get_logo_feed(),
-                    "pubdate_feed": feed_dto.get_pubdate_feed(),
-                })
+                doc.reference.update(fields)
                 updated = True
             return updated
         except Exception as e:
             logger.error(f"Lỗi khi update feed: {e}\n{traceback.format_exc()}")
             return False
 
+    def update_last_emty(self, feed_dto: FeedDTO, link_emty: str) -> bool:
+        """Lưu con trỏ (link entry mới nhất đã gửi) cho cặp feed + channel."""
+        try:
+            doc_id = self._doc_id(feed_dto)
+            self.db.collection(self.collection_name).document(doc_id).update({"last_emty_link": link_emty})
+            feed_dto.set_last_emty_link(link_emty)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi update last_emty_link: {e}\n{traceback.format_exc()}")
+            return False
+
+    def update_last_emty_batch(self, cursors: List[Tuple[FeedDTO, str]]) -> bool:
+        """Lưu con trỏ cho nhiều subscription bằng WriteBatch (tối đa BATCH_SIZE mỗi lần commit)."""
+        try:
+            collection = self.db.collection(self.collection_name)
+            for chunk in self._chunked(cursors):
+                batch = self.db.batch()
+                for feed_dto, link_emty in chunk:
+                    batch.update(collection.document(self._doc_id(feed_dto)), {"last_emty_link": link_emty})
+                batch.commit()
+                for feed_dto, link_emty in chunk:
+                    feed_dto.set_last_emty_link(link_emty)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi batch update last_emty_link: {e}\n{traceback.format_exc()}")
+            return False
+
+    def update_server_id_batch(self, updates: List[Tuple[FeedDTO, str]]) -> bool:
+        """Gán server_id cho nhiều feed (dùng khi backfill các document cũ)."""
+        try:
+            collection = self.db.collection(self.collection_name)
+            for chunk in self._chunked(updates):
+                batch = self.db.batch()
+                for feed_dto, server_id in chunk:
+                    batch.update(collection.document(self._doc_id(feed_dto)), {"server_id": server_id})
+                batch.commit()
+                for feed_dto, server_id in chunk:
+                    feed_dto.set_server_id(server_id)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi batch update server_id: {e}\n{traceback.format_exc()}")
+            return False
+
     def get_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str) -> Optional[FeedDTO]:
         try:
             query = self.db.collection(self.collection_name) \
@@ -134,53 +160,39 @@ class FeedDAL(BaseDAL):
                            .limit(1) \
                            .stream()
             for doc in query:
-                data = doc.to_dict()
-                return FeedDTO(
-                    data["link_feed"],
-                    data["link_atom_feed"],
-                    data["title_feed"],
-                    data["description_feed"],
-                    data["logo_feed"],
-                    data["pubdate_feed"],
-                    data["channel_id"]
-                )
+                return FeedDTO.from_document(doc.to_dict(), doc.id)
             return None
         except Exception as e:
             logger.error(f"Lỗi khi get feed: {e}\n{traceback.format_exc()}")
             return None
 
-    def get_all_feed(self) -> List[FeedDTO]:
+    def iter_all_feed(self) -> Iterator[FeedDTO]:
+        """Duyệt tbl_feed theo trang (mỗi lần chỉ giữ một trang trong bộ nhớ)."""
         try:
-            docs = self.db.collection(self.collection_name).stream()
-            return [
-                FeedDTO(
-                    d.to_dict()["link_feed"],
-                    d.to_dict()["link_atom_feed"],
-                    d.to_dict()["title_feed"],
-                    d.to_dict()["description_feed"],
-                    d.to_dict()["logo_feed"],
-                    d.to_dict()["pubdate_feed"],
-                    d.to_dict()["channel_id"]
-                ) for d in docs
-            ]
+            for doc in self._iter_query(self.db.collection(self.collection_name)):
+                yield FeedDTO.from_document(doc.to_dict(), doc.id)
         except Exception as e:
             logger.error(f"Lỗi khi get all feed: {e}\n{traceback.format_exc()}")
-            return []
+            raise
+
+    def get_all_feed(self) -> List[FeedDTO]:
+        try:
+            return list(self.iter_all_feed())
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_feed
 
     def get_all_feed_by_channel_id(self, channel_id: str) -> List[FeedDTO]:
         try:
             docs = self.db.collection(self.collection_name).where("channel_id", "==", str(channel_id)).stream()
-            return [
-                FeedDTO(
-                    d.to_dict()["link_feed"],
-                    d.to_dict()["link_atom_feed"],
-                    d.to_dict()["title_feed"],
-                    d.to_dict()["description_feed"],
-                    d.to_dict()["logo_feed"],
-                    d.to_dict()["pubdate_feed"],
-                    d.to_dict()["channel_id"]
-                ) for d in docs
-            ]
+            return [FeedDTO.from_document(d.to_dict(), d.id) for d in docs]
         except Exception as e:
             logger.error(f"Lỗi khi get feed theo channel_id: {e}\n{traceback.format_exc()}")
             return []
+
+    def get_all_feed_by_server_id(self, server_id: str) -> List[FeedDTO]:
+        try:
+            docs = self.db.collection(self.collection_name).where("server_id", "==", str(server_id)).stream()
+            return [FeedDTO.from_document(d.to_dict(), d.id) for d in docs]
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed theo server_id: {e}\n{traceback.format_exc()}")
+            return []
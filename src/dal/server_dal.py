@@ -1,3 +1,4 @@
+from typing import Iterator
 from typing import List
 from typing import Optional
 from dto.server_dto import ServerDTO
@@ -16,12 +17,7 @@ class ServerDAL(BaseDAL):
             if doc_ref.get().exists:
                 logger.error(f"Server with server_id={server_dto.get_server_id()} already exists in 'tbl_server'")
                 return False
-            doc_ref.set({
-                "server_id": server_dto.get_server_id(),
-                "server_name": server_dto.get_server_name(),
-                "hex_color": server_dto.get_hex_color(),
-                "is_active": server_dto.get_state() if hasattr(server_dto, "get_state") else True
-            })
+            doc_ref.set(server_dto.to_document())
             logger.info(f"Data inserted successfully into 'tbl_server'.")
             return True
         except Exception as e:
@@ -72,38 +68,42 @@ class ServerDAL(BaseDAL):
             logger.error(f"Error updating server: {e}")
             return False
 
+    def upsert_server_batch(self, server_dtos: List[ServerDTO]) -> bool:
+        """Ghi (tạo mới hoặc ghi đè) nhiều server bằng WriteBatch, không cần đọc trước."""
+        try:
+            for chunk in self._chunked(server_dtos):
+                batch = self.db.batch()
+                for server_dto in chunk:
+                    batch.set(self.collection.document(server_dto.get_server_id()), server_dto.to_document(), merge=True)
+                batch.commit()
+            logger.info(f"Upserted {len(server_dtos)} server(s) into 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error upserting servers into 'tbl_server': {e}")
+            return False
+
     def get_server_by_server_id(self, server_id: str) -> Optional[ServerDTO]:
         try:
             doc = self.collection.document(server_id).get()
             if doc.exists:
-                data = doc.to_dict()
-                return ServerDTO(
-                    data["server_id"],
-                    data["server_name"],
-                    data["hex_color"],
-                    data.get("is_active", True)
-                )
+                return ServerDTO.from_document(doc.to_dict())
             return None
         except Exception as e:
             logger.error(f"Error fetching server by id={server_id}: {e}")
             return None
 
-    def get_all_server(self, ignore_state=False, is_active=True) -> List[ServerDTO]:
+    def iter_all_server(self, ignore_state=False, is_active=True) -> Iterator[ServerDTO]:
+        """Duyệt tbl_server theo trang (mỗi lần chỉ giữ một trang trong bộ nhớ)."""
         try:
-            if ignore_state:
-                docs = self.collection.stream()
-            else:
-                docs = self.collection.where("is_active", "==", is_active).stream()
-            servers = []
-            for doc in docs:
-                data = doc.to_dict()
-                servers.append(ServerDTO(
-                    data["server_id"],
-                    data["server_name"],
-                    data["hex_color"],
-                    data.get("is_active", True)
-                ))
-            return servers
+            query = self.collection if ignore_state else self.collection.where("is_active", "==", is_active)
+            for doc in self._iter_query(query):
+                yield ServerDTO.from_document(doc.to_dict())
         except Exception as e:
             logger.error(f"Error fetching all servers: {e}")
-            return []
+            raise
+
+    def get_all_server(self, ignore_state=False, is_active=True) -> List[ServerDTO]:
+        try:
+            return list(self.iter_all_server(ignore_state, is_active))
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_server
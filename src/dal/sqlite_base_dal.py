@@ -0,0 +1,163 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from dal.base_dal import BATCH_SIZE
+from dal.base_dal import BaseDAL
+from dal.base_dal import PAGE_SIZE
+from dal.base_dal import ProgressCallback
+
+# File SQLite khi STORAGE_BACKEND=sqlite
+SQLITE_PATH = os.getenv("SQLITE_PATH", "readrss.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tbl_server (
+    server_id   TEXT PRIMARY KEY,
+    server_name TEXT,
+    hex_color   TEXT,
+    is_active   INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS tbl_channel (
+    channel_id   TEXT PRIMARY KEY,
+    server_id    TEXT,
+    channel_name TEXT,
+    is_active    INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS tbl_feed (
+    doc_id           TEXT PRIMARY KEY,
+    link_feed        TEXT,
+    link_atom_feed   TEXT,
+    title_feed       TEXT,
+    description_feed TEXT,
+    logo_feed        TEXT,
+    pubdate_feed     TEXT,
+    channel_id       TEXT,
+    last_emty_link   TEXT,
+    server_id        TEXT
+);
+CREATE TABLE IF NOT EXISTS tbl_emty (
+    doc_id           TEXT PRIMARY KEY,
+    link_emty        TEXT,
+    link_feed        TEXT,
+    link_atom_feed   TEXT,
+    title_emty       TEXT,
+    description_emty TEXT,
+    image_emty       TEXT,
+    pubdate_emty     TEXT,
+    channel_id       TEXT
+);
+"""
+
+# Cột thêm sau khi schema đầu tiên đã được phát hành: (bảng, cột, kiểu)
+_ADDED_COLUMNS = [
+    ("tbl_feed", "server_id", "TEXT"),
+]
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_channel_is_active ON tbl_channel(is_active);
+CREATE INDEX IF NOT EXISTS idx_server_is_active ON tbl_server(is_active);
+CREATE INDEX IF NOT EXISTS idx_feed_channel_id ON tbl_feed(channel_id);
+CREATE INDEX IF NOT EXISTS idx_feed_link_atom_feed ON tbl_feed(link_atom_feed, channel_id);
+CREATE INDEX IF NOT EXISTS idx_feed_link_feed ON tbl_feed(link_feed, channel_id);
+CREATE INDEX IF NOT EXISTS idx_feed_server_id ON tbl_feed(server_id);
+CREATE INDEX IF NOT EXISTS idx_emty_channel_id ON tbl_emty(channel_id);
+CREATE INDEX IF NOT EXISTS idx_emty_link_atom_feed ON tbl_emty(link_atom_feed, channel_id);
+"""
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    # Dòng trả về là dict như doc.to_dict() của Firestore → dùng chung DTO.from_document
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+_connections: Dict[str, Tuple[sqlite3.Connection, threading.RLock]] = {}
+_connections_lock = threading.Lock()
+
+def _open(path: str) -> Tuple[sqlite3.Connection, threading.RLock]:
+    """Một connection (WAL) dùng chung cho mỗi file, tạo schema ở lần mở đầu tiên."""
+    with _connections_lock:
+        if path not in _connections:
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = _dict_row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            for table, column, kind in _ADDED_COLUMNS:
+                if column not in {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+            conn.executescript(_INDEXES)
+            _connections[path] = (conn, threading.RLock())
+        return _connections[path]
+
+class SqliteBaseDAL:
+    """
+    Backend SQLite cục bộ cho các DAL, cùng bộ method với bản Firestore.
+    Không cần mạng hay credentials: hợp cho triển khai nhỏ và chạy thử/load test offline.
+    """
+    _chunked = staticmethod(BaseDAL._chunked)
+
+    def __init__(self, path: str = SQLITE_PATH):
+        self.conn, self._lock = _open(path)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _insert_sql(table: str, columns: Iterable[str], upsert_key: Optional[str] = None) -> str:
+        """
+        INSERT theo tên cột của `DTO.to_document()`: bỏ qua dòng trùng khóa, hoặc ghi đè
+        các cột còn lại nếu có `upsert_key` (giống set(merge=True) của Firestore).
+        """
+        columns = list(columns)
+        values = f"({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        if upsert_key is None:
+            return f"INSERT OR IGNORE INTO {table} {values}"
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != upsert_key)
+        return f"INSERT INTO {table} {values} ON CONFLICT({upsert_key}) DO UPDATE SET {updates}"
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _iter_rows(self, table: str, key: str, where: str = "1", params: tuple = (),
+                   page_size: int = PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Duyệt bảng theo trang bằng keyset (`key` > giá trị cuối của trang trước)."""
+        last_key = None
+        while True:
+            if last_key is None:
+                rows = self._query(f"SELECT * FROM {table} WHERE {where} ORDER BY {key} LIMIT ?", (*params, page_size))
+            else:
+                rows = self._query(f"SELECT * FROM {table} WHERE ({where}) AND {key} > ? ORDER BY {key} LIMIT ?",
+                                   (*params, last_key, page_size))
+            yield from rows
+            if len(rows) < page_size:
+                return
+            last_key = rows[-1][key]
+
+    def _bulk_delete(self, table: str, where: str = "1", params: tuple = (),
+                     on_progress: Optional[ProgressCallback] = None, page_size: int = BATCH_SIZE) -> int:
+        """
+        Xóa mọi dòng (theo doc_id) khớp `where`, mỗi trang `page_size` dòng một transaction
+        như BaseDAL._bulk_delete. Trả về số dòng đã xóa.
+        """
+        deleted = 0
+        while True:
+            with self._transaction() as conn:
+                ids = [row["doc_id"] for row in conn.execute(f"SELECT doc_id FROM {table} WHERE {where} LIMIT ?", (*params, page_size))]
+                if ids:
+                    conn.executemany(f"DELETE FROM {table} WHERE doc_id = ?", [(doc_id,) for doc_id in ids])
+            if not ids:
+                break
+            deleted += len(ids)
+            if on_progress:
+                on_progress(deleted)
+            if len(ids) < page_size:
+                break
+        return deleted
@@ -0,0 +1,96 @@
+from typing import Iterator
+from typing import List
+from typing import Optional
+from dto.channel_dto import ChannelDTO
+from dal.base_dal import logger
+from dal.sqlite_base_dal import SqliteBaseDAL
+
+class SqliteChannelDAL(SqliteBaseDAL):
+    def insert_channel(self, channel_dto: ChannelDTO) -> bool:
+        try:
+            with self._transaction() as conn:
+                document = channel_dto.to_document()
+                cursor = conn.execute(self._insert_sql("tbl_channel", document), tuple(document.values()))
+            if cursor.rowcount == 0:
+                logger.error(f"Channel with channel_id={channel_dto.get_channel_id()} already exists in 'tbl_channel'")
+                return False
+            logger.info(f"Data inserted into 'tbl_channel' successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error inserting data into 'tbl_channel': {e}")
+            return False
+
+    def delete_channel_by_channel_id(self, channel_id: str) -> bool:
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute("UPDATE tbl_channel SET is_active = 0 WHERE channel_id = ?", (channel_id,))
+            if cursor.rowcount == 0:
+                logger.warning(f"Channel {channel_id} not found.")
+                return False
+            logger.info(f"Channel {channel_id} marked inactive successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data from 'tbl_channel': {e}")
+            return False
+
+    def delete_all_channel(self) -> bool:
+        try:
+            with self._transaction() as conn:
+                conn.execute("UPDATE tbl_channel SET is_active = 0")
+            logger.info(f"All channels marked inactive successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting all channels: {e}")
+            return False
+
+    def update_channel(self, channel_dto: ChannelDTO) -> bool:
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute("UPDATE tbl_channel SET channel_name = ?, is_active = ? WHERE channel_id = ?",
+                                      (channel_dto.get_channel_name(), channel_dto.get_state(), channel_dto.get_channel_id()))
+            if cursor.rowcount == 0:
+                logger.warning(f"Channel {channel_dto.get_channel_id()} not found.")
+                return False
+            logger.info(f"Channel {channel_dto.get_channel_id()} updated successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error updating channel: {e}")
+            return False
+
+    def upsert_channel_batch(self, channel_dtos: List[ChannelDTO]) -> bool:
+        """Ghi (tạo mới hoặc ghi đè) nhiều channel trong một transaction."""
+        try:
+            with self._transaction() as conn:
+                documents = [channel_dto.to_document() for channel_dto in channel_dtos]
+                if documents:
+                    conn.executemany(self._insert_sql("tbl_channel", documents[0], upsert_key="channel_id"),
+                                     [tuple(document.values()) for document in documents])
+            logger.info(f"Upserted {len(channel_dtos)} channel(s) into 'tbl_channel'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error upserting channels into 'tbl_channel': {e}")
+            return False
+
+    def get_channel_by_channel_id(self, channel_id: str) -> Optional[ChannelDTO]:
+        try:
+            rows = self._query("SELECT * FROM tbl_channel WHERE channel_id = ?", (channel_id,))
+            return ChannelDTO.from_document(rows[0]) if rows else None
+        except Exception as e:
+            logger.error(f"Error fetching channel {channel_id}: {e}")
+            return None
+
+    def iter_all_channel(self, ignore_state=False, is_active=True) -> Iterator[ChannelDTO]:
+        try:
+            rows = self._iter_rows("tbl_channel", "channel_id") if ignore_state else \
+                self._iter_rows("tbl_channel", "channel_id", "is_active = ?", (bool(is_active),))
+            for row in rows:
+                yield ChannelDTO.from_document(row)
+        except Exception as e:
+            logger.error(f"Error fetching all channels: {e}")
+            raise
+
+    def get_all_channel(self, ignore_state=False, is_active=True) -> List[ChannelDTO]:
+        try:
+            return list(self.iter_all_channel(ignore_state, is_active))
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_channel
@@ -0,0 +1,101 @@
+from typing import Iterator
+from typing import List
+from typing import Optional
+from dto.emty_dto import EmtyDTO
+from dal.base_dal import logger
+from dal.base_dal import ProgressCallback
+from dal.emty_dal import EmtyDAL
+from dal.sqlite_base_dal import SqliteBaseDAL
+
+class SqliteEmtyDAL(SqliteBaseDAL):
+    collection_name = 'tbl_emty'
+
+    # Cùng doc ID với EmtyDAL; doc_id là khóa chính nên không cần index "đã gửi" trong bộ nhớ
+    _generate_doc_id = EmtyDAL._generate_doc_id
+
+    def _to_row(self, emty_dto: EmtyDTO) -> dict:
+        doc_id = self._generate_doc_id(emty_dto.get_link_emty(), emty_dto.get_channel_id())
+        return {"doc_id": doc_id, **emty_dto.to_document()}
+
+    def insert_emty(self, emty_dto: EmtyDTO) -> bool:
+        result = self.insert_emty_batch([emty_dto])[0]
+        if result is False:
+            logger.warning(f"Emty with link_emty={emty_dto.get_link_emty()} and channel_id={emty_dto.get_channel_id()} already exists.")
+        return bool(result)
+
+    def insert_emty_batch(self, emty_dtos: List[EmtyDTO]) -> List[Optional[bool]]:
+        """
+        Ghi nhiều emty, mỗi BATCH_SIZE dòng một transaction.
+        Kết quả theo thứ tự đầu vào: True = vừa ghi, False = đã tồn tại, None = ghi lỗi.
+        """
+        results: List[Optional[bool]] = []
+        for chunk in self._chunked(emty_dtos):
+            try:
+                rows = [self._to_row(emty_dto) for emty_dto in chunk]
+                sql = self._insert_sql(self.collection_name, rows[0])
+                with self._transaction() as conn:
+                    chunk_results = [conn.execute(sql, tuple(row.values())).rowcount == 1 for row in rows]
+                results += chunk_results
+                logger.info(f"Batch inserted {sum(chunk_results)} emty(s) into '{self.collection_name}'.")
+            except Exception as e:
+                logger.error(f"Error batch inserting data into '{self.collection_name}': {e}")
+                results += [None] * len(chunk)
+        return results
+
+    def delete_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> bool:
+        try:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM tbl_emty WHERE doc_id = ?", (self._generate_doc_id(emty_link, channel_id),))
+            logger.info(f"Data deleted from '{self.collection_name}' successfully.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data from '{self.collection_name}': {e}")
+            return False
+
+    def delete_emty_by_link_atom_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            return self._bulk_delete(self.collection_name, "link_atom_feed = ? AND channel_id = ?",
+                                     (link_atom_feed, channel_id), on_progress) > 0
+        except Exception as e:
+            logger.error(f"Error deleting data from '{self.collection_name}': {e}")
+            return False
+
+    def delete_emty_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            deleted = self._bulk_delete(self.collection_name, "channel_id = ?", (channel_id,), on_progress)
+            logger.info(f"All data for channel_id={channel_id} deleted successfully ({deleted} document(s)).")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data by channel_id from '{self.collection_name}': {e}")
+            return False
+
+    def delete_all_emty(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            deleted = self._bulk_delete(self.collection_name, on_progress=on_progress)
+            logger.info(f"All data deleted successfully ({deleted} document(s)).")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting all data from '{self.collection_name}': {e}")
+            return False
+
+    def get_emty_by_link_emty_and_channel_id(self, emty_link: str, channel_id: str) -> Optional[EmtyDTO]:
+        try:
+            rows = self._query("SELECT * FROM tbl_emty WHERE doc_id = ?", (self._generate_doc_id(emty_link, channel_id),))
+            return EmtyDTO.from_document(rows[0]) if rows else None
+        except Exception as e:
+            logger.error(f"Error fetching data from '{self.collection_name}': {e}")
+            return None
+
+    def iter_all_emty(self) -> Iterator[EmtyDTO]:
+        try:
+            for row in self._iter_rows("tbl_emty", "doc_id"):
+                yield EmtyDTO.from_document(row)
+        except Exception as e:
+            logger.error(f"Error fetching all data from '{self.collection_name}': {e}")
+            raise
+
+    def get_all_emty(self) -> List[EmtyDTO]:
+        try:
+            return list(self.iter_all_emty())
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_emty
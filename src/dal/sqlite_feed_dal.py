@@ -0,0 +1,147 @@
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from dto.feed_dto import FeedDTO
+from dal.base_dal import logger
+from dal.base_dal import ProgressCallback
+from dal.feed_dal import FeedDAL
+from dal.sqlite_base_dal import SqliteBaseDAL
+import traceback
+
+
+class SqliteFeedDAL(SqliteBaseDAL):
+    collection_name = "tbl_feed"
+
+    # Cùng doc ID với FeedDAL để dữ liệu có thể chuyển qua lại giữa hai backend
+    _generate_doc_id = FeedDAL._generate_doc_id
+    _doc_id = FeedDAL._doc_id
+
+    def create_table(self):
+        logger.info(f"Table '{self.collection_name}' được tạo cùng schema SQLite.")
+
+    def insert_feed(self, feed_dto: FeedDTO) -> bool:
+        try:
+            doc_id = self._generate_doc_id(feed_dto)
+            row = {"doc_id": doc_id, **feed_dto.to_document()}
+            with self._transaction() as conn:
+                cursor = conn.execute(self._insert_sql(self.collection_name, row), tuple(row.values()))
+            if cursor.rowcount == 0:
+                logger.warning(f"Feed đã tồn tại: {doc_id}")
+                return False
+            logger.info(f"Thêm feed thành công: {doc_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi insert feed: {e}\n{traceback.format_exc()}")
+            return False
+
+    def delete_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            return self._bulk_delete(self.collection_name, "link_atom_feed = ? AND channel_id = ?",
+                                     (link_atom_feed, channel_id), on_progress) > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi delete feed theo link_atom_feed+channel_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    def delete_feed_by_link_feed_and_channel_id(self, link_feed: str, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            return self._bulk_delete(self.collection_name, "link_feed = ? AND channel_id = ?",
+                                     (link_feed, channel_id), on_progress) > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi delete feed theo link_feed+channel_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    def delete_feed_by_channel_id(self, channel_id: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            return self._bulk_delete(self.collection_name, "channel_id = ?", (channel_id,), on_progress) > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi delete feed theo channel_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    def delete_all_feed(self, on_progress: Optional[ProgressCallback] = None) -> bool:
+        try:
+            self._bulk_delete(self.collection_name, on_progress=on_progress)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi delete all feed: {e}\n{traceback.format_exc()}")
+            return False
+
+    def update_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str, feed_dto: FeedDTO) -> bool:
+        try:
+            fields = FeedDAL._updatable_fields(feed_dto)
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    f"UPDATE tbl_feed SET {', '.join(f'{column} = ?' for column in fields)} "
+                    "WHERE link_atom_feed = ? AND channel_id = ?",
+                    (*fields.values(), link_atom_feed, channel_id))
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Lỗi khi update feed: {e}\n{traceback.format_exc()}")
+            return False
+
+    def update_last_emty(self, feed_dto: FeedDTO, link_emty: str) -> bool:
+        """Lưu con trỏ (link entry mới nhất đã gửi) cho cặp feed + channel."""
+        return self.update_last_emty_batch([(feed_dto, link_emty)])
+
+    def update_last_emty_batch(self, cursors: List[Tuple[FeedDTO, str]]) -> bool:
+        """Lưu con trỏ cho nhiều subscription trong một transaction."""
+        try:
+            with self._transaction() as conn:
+                conn.executemany("UPDATE tbl_feed SET last_emty_link = ? WHERE doc_id = ?",
+                                 [(link_emty, self._doc_id(feed_dto)) for feed_dto, link_emty in cursors])
+            for feed_dto, link_emty in cursors:
+                feed_dto.set_last_emty_link(link_emty)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi batch update last_emty_link: {e}\n{traceback.format_exc()}")
+            return False
+
+    def update_server_id_batch(self, updates: List[Tuple[FeedDTO, str]]) -> bool:
+        """Gán server_id cho nhiều feed (dùng khi backfill các dòng cũ)."""
+        try:
+            with self._transaction() as conn:
+                conn.executemany("UPDATE tbl_feed SET server_id = ? WHERE doc_id = ?",
+                                 [(server_id, self._doc_id(feed_dto)) for feed_dto, server_id in updates])
+            for feed_dto, server_id in updates:
+                feed_dto.set_server_id(server_id)
+            return True
+        except Exception as e:
+            logger.error(f"Lỗi khi batch update server_id: {e}\n{traceback.format_exc()}")
+            return False
+
+    def get_feed_by_link_atom_feed_and_channel_id(self, link_atom_feed: str, channel_id: str) -> Optional[FeedDTO]:
+        try:
+            rows = self._query("SELECT * FROM tbl_feed WHERE link_atom_feed = ? AND channel_id = ? LIMIT 1",
+                               (link_atom_feed, str(channel_id)))
+            return FeedDTO.from_document(rows[0]) if rows else None
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed: {e}\n{traceback.format_exc()}")
+            return None
+
+    def iter_all_feed(self) -> Iterator[FeedDTO]:
+        try:
+            for row in self._iter_rows("tbl_feed", "doc_id"):
+                yield FeedDTO.from_document(row)
+        except Exception as e:
+            logger.error(f"Lỗi khi get all feed: {e}\n{traceback.format_exc()}")
+            raise
+
+    def get_all_feed(self) -> List[FeedDTO]:
+        try:
+            return list(self.iter_all_feed())
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_feed
+
+    def get_all_feed_by_channel_id(self, channel_id: str) -> List[FeedDTO]:
+        try:
+            return [FeedDTO.from_document(row) for row in self._query("SELECT * FROM tbl_feed WHERE channel_id = ?", (str(channel_id),))]
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed theo channel_id: {e}\n{traceback.format_exc()}")
+            return []
+
+    def get_all_feed_by_server_id(self, server_id: str) -> List[FeedDTO]:
+        try:
+            return [FeedDTO.from_document(row) for row in self._query("SELECT * FROM tbl_feed WHERE server_id = ?", (str(server_id),))]
+        except Exception as e:
+            logger.error(f"Lỗi khi get feed theo server_id: {e}\n{traceback.format_exc()}")
+            return []
@@ -0,0 +1,97 @@
+from typing import Iterator
+from typing import List
+from typing import Optional
+from dto.server_dto import ServerDTO
+from dal.base_dal import logger
+from dal.sqlite_base_dal import SqliteBaseDAL
+
+class SqliteServerDAL(SqliteBaseDAL):
+    def insert_server(self, server_dto: ServerDTO) -> bool:
+        try:
+            with self._transaction() as conn:
+                document = server_dto.to_document()
+                cursor = conn.execute(self._insert_sql("tbl_server", document), tuple(document.values()))
+            if cursor.rowcount == 0:
+                logger.error(f"Server with server_id={server_dto.get_server_id()} already exists in 'tbl_server'")
+                return False
+            logger.info(f"Data inserted successfully into 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error inserting data into 'tbl_server': {e}")
+            return False
+
+    def delete_server_by_server_id(self, server_id: str) -> bool:
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute("UPDATE tbl_server SET is_active = 0 WHERE server_id = ?", (server_id,))
+            if cursor.rowcount == 0:
+                logger.error(f"Server with id={server_id} not found.")
+                return False
+            logger.info(f"Data deleted successfully from 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting data from 'tbl_server': {e}")
+            return False
+
+    def delete_all_server(self) -> bool:
+        try:
+            with self._transaction() as conn:
+                conn.execute("UPDATE tbl_server SET is_active = 0")
+            logger.info("All data marked as deleted in 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting all data from 'tbl_server': {e}")
+            return False
+
+    def update_server(self, server_dto: ServerDTO) -> bool:
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    "UPDATE tbl_server SET server_name = ?, hex_color = ?, is_active = ? WHERE server_id = ?",
+                    (server_dto.get_server_name(), server_dto.get_hex_color(), server_dto.get_state(), server_dto.get_server_id()))
+            if cursor.rowcount == 0:
+                logger.error(f"Server with id={server_dto.get_server_id()} not found for update.")
+                return False
+            logger.info(f"Server {server_dto.get_server_id()} updated successfully in 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error updating server: {e}")
+            return False
+
+    def upsert_server_batch(self, server_dtos: List[ServerDTO]) -> bool:
+        """Ghi (tạo mới hoặc ghi đè) nhiều server trong một transaction."""
+        try:
+            with self._transaction() as conn:
+                documents = [server_dto.to_document() for server_dto in server_dtos]
+                if documents:
+                    conn.executemany(self._insert_sql("tbl_server", documents[0], upsert_key="server_id"),
+                                     [tuple(document.values()) for document in documents])
+            logger.info(f"Upserted {len(server_dtos)} server(s) into 'tbl_server'.")
+            return True
+        except Exception as e:
+            logger.error(f"Error upserting servers into 'tbl_server': {e}")
+            return False
+
+    def get_server_by_server_id(self, server_id: str) -> Optional[ServerDTO]:
+        try:
+            rows = self._query("SELECT * FROM tbl_server WHERE server_id = ?", (server_id,))
+            return ServerDTO.from_document(rows[0]) if rows else None
+        except Exception as e:
+            logger.error(f"Error fetching server by id={server_id}: {e}")
+            return None
+
+    def iter_all_server(self, ignore_state=False, is_active=True) -> Iterator[ServerDTO]:
+        try:
+            rows = self._iter_rows("tbl_server", "server_id") if ignore_state else \
+                self._iter_rows("tbl_server", "server_id", "is_active = ?", (bool(is_active),))
+            for row in rows:
+                yield ServerDTO.from_document(row)
+        except Exception as e:
+            logger.error(f"Error fetching all servers: {e}")
+            raise
+
+    def get_all_server(self, ignore_state=False, is_active=True) -> List[ServerDTO]:
+        try:
+            return list(self.iter_all_server(ignore_state, is_active))
+        except Exception:
+            return []  # Lỗi đã được log trong iter_all_server
@@ -1,12 +1,32 @@
 from types import NotImplementedType
+from typing import Any, Dict, Mapping
 
 class ChannelDTO:
+    __slots__ = ("__channel_id", "__server_id", "__channel_name", "__is_active")
+
     def __init__(self, channel_id: str, server_id: str, channel_name: str, is_active=True):
         self.__channel_id = channel_id
         self.__server_id = server_id
         self.__channel_name = channel_name
         self.__is_active = is_active
-        
+
+    @classmethod
+    def from_document(cls, data: Mapping[str, Any]) -> "ChannelDTO":
+        return cls(
+            data["channel_id"],
+            data["server_id"],
+            data["channel_name"],
+            bool(data.get("is_active", True))
+        )
+
+    def to_document(self) -> Dict[str, Any]:
+        return {
+            "channel_id": self.__channel_id,
+            "server_id": self.__server_id,
+            "channel_name": self.__channel_name,
+            "is_active": self.__is_active
+        }
+
     def __str__(self) -> str:
         return f"ChannelDTO(channel_id={self.__channel_id}, server_id={self.__server_id}, channel_name={self.__channel_name}, is_active={self.__is_active})"
     
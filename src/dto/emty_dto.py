@@ -1,8 +1,10 @@
 from datetime import datetime
 from types import NotImplementedType
-from typing import Optional
+from typing import Any, Dict, Mapping, Optional
 
 class EmtyDTO:
+    __slots__ = ("__link_emty", "__link_feed", "__link_atom_feed", "__title_emty", "__description_emty", "__image_emty", "__pubdate_emty", "__channel_id")
+
     def __init__(self, link_emty: str, link_feed: str, link_atom_feed: str, title_emty: str, description_emty: str, image_emty: str, pubdate_emty: datetime, channel_id: Optional[str]=None):
         self.__link_emty = link_emty
         self.__link_feed = link_feed
@@ -12,7 +14,32 @@ class EmtyDTO:
         self.__image_emty = image_emty
         self.__pubdate_emty = pubdate_emty
         self.__channel_id = channel_id
-        
+
+    @classmethod
+    def from_document(cls, data: Mapping[str, Any]) -> "EmtyDTO":
+        return cls(
+            data["link_emty"],
+            data["link_feed"],
+            data["link_atom_feed"],
+            data["title_emty"],
+            data["description_emty"],
+            data["image_emty"],
+            data["pubdate_emty"],
+            data.get("channel_id")
+        )
+
+    def to_document(self) -> Dict[str, Any]:
+        return {
+            "link_emty": self.__link_emty,
+            "link_feed": self.__link_feed,
+            "link_atom_feed": self.__link_atom_feed,
+            "title_emty": self.__title_emty,
+            "description_emty": self.__description_emty,
+            "image_emty": self.__image_emty,
+            "pubdate_emty": self.__pubdate_emty,
+            "channel_id": self.__channel_id
+        }
+
     def __str__(self) -> str:
         return f"EmtyDTO(link_emty={self.__link_emty}, link_feed={self.__link_feed}, link_atom_feed={self.__link_atom_feed}, title_emty={self.__title_emty}, description_emty={self.__description_emty}, image_emty={self.__image_emty}, pubdate_emty={self.__pubdate_emty}, channel_id={self.__channel_id})"
         
@@ -1,9 +1,12 @@
 from datetime import datetime
 from types import NotImplementedType
-from typing import Optional
+from typing import Any, Dict, Mapping, Optional
 
 class FeedDTO:
-    def __init__(self, link_feed: str, link_atom_feed: str, title_feed: str, description_feed: str, logo_feed: str, pubDate_feed: datetime, channel_id: Optional[str]=None):
+    # Không có __dict__ riêng cho mỗi instance: nhẹ hơn khi nạp cả collection
+    __slots__ = ("__link_feed", "__link_atom_feed", "__title_feed", "__description_feed", "__logo_feed", "__pubdate_feed", "__channel_id", "__last_emty_link", "__server_id", "__doc_id")
+
+    def __init__(self, link_feed: str, link_atom_feed: str, title_feed: str, description_feed: str, logo_feed: str, pubDate_feed: datetime, channel_id: Optional[str]=None, last_emty_link: Optional[str]=None, server_id: Optional[str]=None, doc_id: Optional[str]=None):
         self.__link_feed = link_feed
         self.__link_atom_feed = link_atom_feed
         self.__title_feed = title_feed
@@ -11,9 +14,44 @@ class FeedDTO:
         self.__logo_feed = logo_feed
         self.__pubdate_feed = pubDate_feed
         self.__channel_id = channel_id
+        self.__last_emty_link = last_emty_link  # link entry mới nhất đã gửi cho channel này
+        self.__server_id = server_id  # guild chứa channel (user ID với DM), dùng để lọc theo server
+        self.__doc_id = doc_id  # ID document/dòng khi đọc từ DB (không ghi vào to_document)
+
+    @classmethod
+    def from_document(cls, data: Mapping[str, Any], doc_id: Optional[str] = None) -> "FeedDTO":
+        """
+        Tạo DTO từ document Firestore (`doc.to_dict()`, kèm `doc.id`) hoặc dòng SQLite (có cột doc_id),
+        đọc mỗi field một lần.
+        """
+        return cls(
+            data["link_feed"],
+            data["link_atom_feed"],
+            data["title_feed"],
+            data["description_feed"],
+            data["logo_feed"],
+            data["pubdate_feed"],
+            data.get("channel_id"),
+            data.get("last_emty_link"),
+            data.get("server_id"),
+            doc_id if doc_id is not None else data.get("doc_id")
+        )
+
+    def to_document(self) -> Dict[str, Any]:
+        return {
+            "link_feed": self.__link_feed,
+            "link_atom_feed": self.__link_atom_feed,
+            "title_feed": self.__title_feed,
+            "description_feed": self.__description_feed,
+            "logo_feed": self.__logo_feed,
+            "pubdate_feed": self.__pubdate_feed,
+            "channel_id": self.__channel_id,
+            "last_emty_link": self.__last_emty_link,
+            "server_id": self.__server_id
+        }
 
     def __str__(self) -> str:
-        return f"FeedDTO(link_feed={self.__link_feed}, link_atom_feed={self.__link_atom_feed}, title_feed={self.__title_feed}, description_feed={self.__description_feed}, logo_feed={self.__logo_feed}, pubdate_feed={self.__pubdate_feed}, channel_id={self.__channel_id})"
+        return f"FeedDTO(link_feed={self.__link_feed}, link_atom_feed={self.__link_atom_feed}, title_feed={self.__title_feed}, description_feed={self.__description_feed}, logo_feed={self.__logo_feed}, pubdate_feed={self.__pubdate_feed}, channel_id={self.__channel_id}, last_emty_link={self.__last_emty_link}, server_id={self.__server_id})"
 
     def __eq__(self, other: object) -> bool | NotImplementedType:
         if not isinstance(other, FeedDTO):
@@ -41,7 +79,16 @@ class FeedDTO:
     
     def set_channel_id(self, channel_id: str) -> None:
         self.__channel_id = channel_id
+
+    def set_last_emty_link(self, last_emty_link: Optional[str]) -> None:
+        self.__last_emty_link = last_emty_link
         
+    def set_server_id(self, server_id: Optional[str]) -> None:
+        self.__server_id = server_id
+
+    def set_doc_id(self, doc_id: Optional[str]) -> None:
+        self.__doc_id = doc_id
+
     def get_link_feed(self) -> str:
         return self.__link_feed
     
@@ -61,4 +108,13 @@ class FeedDTO:
         return self.__pubdate_feed
     
     def get_channel_id(self) -> str:
-        return self.__channel_id
\ No newline at end of file
+        return self.__channel_id
+
+    def get_last_emty_link(self) -> Optional[str]:
+        return self.__last_emty_link
+
+    def get_server_id(self) -> Optional[str]:
+        return self.__server_id
+
+    def get_doc_id(self) -> Optional[str]:
+        return self.__doc_id
@@ -1,12 +1,32 @@
 from types import NotImplementedType
+from typing import Any, Dict, Mapping
 
 class ServerDTO:
+    __slots__ = ("__server_id", "__server_name", "__hex_color", "__is_active")
+
     def __init__(self, server_id: str, server_name: str, hex_color: str="0x3498DB", is_active=True):
         self.__server_id = server_id
         self.__server_name = server_name
         self.__hex_color = hex_color
         self.__is_active = is_active
-        
+
+    @classmethod
+    def from_document(cls, data: Mapping[str, Any]) -> "ServerDTO":
+        return cls(
+            data["server_id"],
+            data["server_name"],
+            data.get("hex_color", "0x3498DB"),
+            bool(data.get("is_active", True))
+        )
+
+    def to_document(self) -> Dict[str, Any]:
+        return {
+            "server_id": self.__server_id,
+            "server_name": self.__server_name,
+            "hex_color": self.__hex_color,
+            "is_active": self.__is_active
+        }
+
     def __str__(self) -> str:
         return f"ServerDTO(server_id={self.__server_id}, server_name={self.__server_name}, is_active={self.__is_active})"
     
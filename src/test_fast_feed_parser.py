@@ -0,0 +1,89 @@
+import os
+import sys
+import feedparser
+
+# Thêm thư mục src vào Python path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from utils.fast_feed_parser import parse_fast, parse_feed, UnsupportedFeed
+from utils.feed_scheduler import FeedScheduler
+from utils.feed_normalizer import iter_entries, to_feed_dto
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "feeds")
+FEED_URL = "https://example.com/feed"
+
+# Feed mà parser nhanh phải nhường cho feedparser
+FALLBACK_FIXTURES = {"rdf_rss1.xml", "broken_rss.xml"}
+
+FEED_FIELDS = ("link_feed", "link_atom_feed", "title_feed", "description_feed", "logo_feed", "pubdate_feed")
+EMTY_FIELDS = ("link_emty", "title_emty", "description_emty", "image_emty", "pubdate_emty")
+
+def load(filename: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, filename), "rb") as f:
+        return f.read()
+
+def normalize(feed):
+    """Những gì bot đọc từ một feed: các trường DTO và dữ liệu mà FeedScheduler dùng."""
+    feed_dto = to_feed_dto(feed, FEED_URL)
+    return {
+        "feed": {field: getattr(feed_dto, f"get_{field}")() for field in FEED_FIELDS},
+        "entries": [
+            {field: getattr(emty_dto, f"get_{field}")() for field in EMTY_FIELDS}
+            for emty_dto in iter_entries(feed, feed_dto)
+        ],
+        "dates": [entry.get("published_parsed") or entry.get("updated_parsed") for entry in feed.entries],
+        "ttl": feed.feed.get("ttl"),
+        "sy_updateperiod": feed.feed.get("sy_updateperiod"),
+        "sy_updatefrequency": feed.feed.get("sy_updatefrequency"),
+    }
+
+def diff(expected, actual, path=""):
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(set(expected) | set(actual)):
+            yield from diff(expected.get(key), actual.get(key), f"{path}.{key}")
+    elif isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        for index, (a, b) in enumerate(zip(expected, actual)):
+            yield from diff(a, b, f"{path}[{index}]")
+    elif expected != actual:
+        yield f"{path}: feedparser={expected!r} fast={actual!r}"
+
+def test_same_output_as_feedparser():
+    """Với mọi fixture parser nhanh nhận, kết quả phải giống hệt feedparser."""
+    failures = 0
+    for filename in sorted(os.listdir(FIXTURES_DIR)):
+        if filename in FALLBACK_FIXTURES:
+            continue
+        content = load(filename)
+        headers = {"content-location": FEED_URL}
+        problems = list(diff(normalize(feedparser.parse(content, response_headers=headers)),
+                             normalize(parse_fast(content, headers))))
+        # feedparser chỉ giữ <hour> cuối cùng của <skipHours>; parser nhanh giữ đủ
+        expected_hours = FeedScheduler._parse_skip_hours(feedparser.parse(content))
+        actual_hours = FeedScheduler._parse_skip_hours(parse_fast(content, headers))
+        if not expected_hours <= actual_hours:
+            problems.append(f".skiphours: feedparser={expected_hours} fast={actual_hours}")
+
+        if problems:
+            failures += 1
+            print(f"❌ {filename}")
+            for problem in problems[:10]:
+                print(f"   {problem}")
+        else:
+            print(f"✅ {filename}")
+    assert failures == 0
+
+def test_fallback_to_feedparser():
+    """Feed hỏng / định dạng lạ: parse_fast từ chối, parse_feed vẫn trả kết quả của feedparser."""
+    for filename in sorted(FALLBACK_FIXTURES):
+        content = load(filename)
+        try:
+            parse_fast(content)
+            raise AssertionError(f"{filename} should not be handled by the fast parser")
+        except UnsupportedFeed as e:
+            print(f"✅ {filename}: fallback ({e})")
+        assert normalize(parse_feed(content)) == normalize(feedparser.parse(content))
+
+if __name__ == "__main__":
+    test_same_output_as_feedparser()
+    test_fallback_to_feedparser()
+    print("🎉 Fast parser matches feedparser on all fixtures")
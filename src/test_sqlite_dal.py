@@ -0,0 +1,128 @@
+import os
+import sys
+import sqlite3
+import tempfile
+from datetime import datetime
+
+# Thêm thư mục src vào Python path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from dto.server_dto import ServerDTO
+from dto.channel_dto import ChannelDTO
+from dto.feed_dto import FeedDTO
+from dto.emty_dto import EmtyDTO
+from dal.sqlite_server_dal import SqliteServerDAL
+from dal.sqlite_channel_dal import SqliteChannelDAL
+from dal.sqlite_feed_dal import SqliteFeedDAL
+from dal.sqlite_emty_dal import SqliteEmtyDAL
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test_readrss.db")
+PUBDATE = datetime(2024, 1, 1, 12, 0, 0)
+
+def feed(channel_id: str, n: int) -> FeedDTO:
+    return FeedDTO(f"https://example.com/{n}", f"https://example.com/{n}/feed", f"Feed {n}", "desc", "",
+                   PUBDATE, channel_id, server_id="s1")
+
+def emty(channel_id: str, n: int) -> EmtyDTO:
+    return EmtyDTO(f"https://example.com/post/{n}", "https://example.com/1", "https://example.com/1/feed",
+                   f"Post {n}", "desc", "", PUBDATE, channel_id)
+
+def test_server_round_trip():
+    dal = SqliteServerDAL(DB_PATH)
+    assert dal.insert_server(ServerDTO("s1", "Server 1"))
+    assert not dal.insert_server(ServerDTO("s1", "Server 1")), "insert trùng phải trả về False"
+    assert dal.get_server_by_server_id("s1").get_server_name() == "Server 1"
+    assert dal.delete_server_by_server_id("s1")
+    assert [s.get_server_id() for s in dal.get_all_server(is_active=False)] == ["s1"]
+    print("✅ server")
+
+def test_channel_round_trip():
+    dal = SqliteChannelDAL(DB_PATH)
+    assert dal.insert_channel(ChannelDTO("c1", "s1", "general"))
+    assert not dal.insert_channel(ChannelDTO("c1", "s1", "general")), "insert trùng phải trả về False"
+    assert dal.get_channel_by_channel_id("c1").get_channel_name() == "general"
+    assert dal.delete_channel_by_channel_id("c1")
+    assert dal.get_all_channel() == []
+    print("✅ channel")
+
+def test_feed_round_trip():
+    dal = SqliteFeedDAL(DB_PATH)
+    for n in range(3):
+        assert dal.insert_feed(feed("c1", n))
+    assert dal.insert_feed(feed("c2", 0))
+    assert not dal.insert_feed(feed("c1", 0)), "insert trùng phải trả về False"
+    assert len(dal.get_all_feed_by_server_id("s1")) == 4
+    assert len(dal.get_all_feed_by_channel_id("c1")) == 3
+
+    assert dal.delete_feed_by_link_atom_feed_and_channel_id("https://example.com/0/feed", "c1")
+    assert dal.get_feed_by_link_atom_feed_and_channel_id("https://example.com/0/feed", "c1") is None
+    progress = []
+    assert dal.delete_feed_by_channel_id("c1", on_progress=progress.append)
+    assert progress == [2]
+    assert [f.get_channel_id() for f in dal.get_all_feed()] == ["c2"]
+    assert dal.delete_all_feed()
+    assert dal.get_all_feed() == []
+    print("✅ feed")
+
+def test_emty_round_trip():
+    dal = SqliteEmtyDAL(DB_PATH)
+    assert dal.insert_emty_batch([emty("c1", n) for n in range(3)]) == [True, True, True]
+    assert dal.insert_emty_batch([emty("c1", 0), emty("c2", 0)]) == [False, True]
+    assert dal.get_emty_by_link_emty_and_channel_id("https://example.com/post/1", "c1").get_title_emty() == "Post 1"
+
+    assert dal.delete_emty_by_link_emty_and_channel_id("https://example.com/post/1", "c1")
+    assert dal.get_emty_by_link_emty_and_channel_id("https://example.com/post/1", "c1") is None
+    assert dal.delete_emty_by_link_atom_and_channel_id("https://example.com/1/feed", "c2")
+    assert dal.delete_emty_by_channel_id("c1")
+    assert dal.get_all_emty() == []
+    assert dal.insert_emty(emty("c1", 0)), "xóa xong phải ghi lại được"
+    assert dal.delete_all_emty()
+    assert dal.get_all_emty() == []
+    print("✅ emty")
+
+def test_batch_update_uses_stored_doc_id():
+    """Dòng có doc_id không khớp _generate_doc_id (dữ liệu cũ) vẫn được cập nhật qua DTO đã đọc ra."""
+    dal = SqliteFeedDAL(DB_PATH)
+    assert dal.insert_feed(feed("c1", 0))
+    with dal._transaction() as conn:
+        conn.execute("UPDATE tbl_feed SET doc_id = 'legacy-id'")
+    [feed_dto] = dal.get_all_feed()
+    assert feed_dto.get_doc_id() == "legacy-id"
+    assert "doc_id" not in feed_dto.to_document()
+    assert dal.update_last_emty_batch([(feed_dto, "https://example.com/post/9")])
+    assert dal.update_server_id_batch([(feed_dto, "s2")])
+    [stored] = dal.get_all_feed()
+    assert (stored.get_last_emty_link(), stored.get_server_id()) == ("https://example.com/post/9", "s2")
+    assert dal.delete_all_feed()
+    print("✅ stored doc_id")
+
+def test_iter_all_raises_on_error():
+    """Lỗi giữa chừng phải văng ra khỏi iter_all_*, không được trả về danh sách thiếu như thể đã đủ."""
+    dal = SqliteFeedDAL(DB_PATH)
+    assert dal.insert_feed(feed("c1", 0)) and dal.insert_feed(feed("c1", 1))
+
+    def failing_rows(*args, **kwargs):
+        yield from dal._query("SELECT * FROM tbl_feed LIMIT 1")
+        raise sqlite3.OperationalError("database is locked")
+    dal._iter_rows = failing_rows
+
+    received = []
+    try:
+        for feed_dto in dal.iter_all_feed():
+            received.append(feed_dto)
+        raise AssertionError("iter_all_feed should raise")
+    except sqlite3.OperationalError:
+        pass
+    assert len(received) == 1
+    assert dal.get_all_feed() == [], "get_all_* vẫn trả về [] khi lỗi"
+    assert SqliteFeedDAL(DB_PATH).delete_all_feed()
+    print("✅ iter_all errors")
+
+if __name__ == "__main__":
+    test_server_round_trip()
+    test_channel_round_trip()
+    test_feed_round_trip()
+    test_emty_round_trip()
+    test_batch_update_uses_stored_doc_id()
+    test_iter_all_raises_on_error()
+    print("🎉 SQLite DAL insert/delete round trips passed")
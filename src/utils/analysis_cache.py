@@ -0,0 +1,44 @@
+import os
+import hashlib
+from typing import Iterable, Optional
+from dto.emty_dto import EmtyDTO
+from utils.ttl_cache import PersistentTTLCache
+
+# Kết quả phân tích Gemini: thời gian sống (giây) và số kết quả tối đa trong cache
+GEMINI_ANALYSIS_TTL = int(os.getenv("GEMINI_ANALYSIS_TTL", "21600"))
+GEMINI_ANALYSIS_CACHE_SIZE = int(os.getenv("GEMINI_ANALYSIS_CACHE_SIZE", "512"))
+# File JSON lưu cache qua các lần khởi động lại; để trống để chỉ cache trong bộ nhớ
+GEMINI_ANALYSIS_CACHE_PATH = os.getenv("GEMINI_ANALYSIS_CACHE_PATH", "gemini_analysis.json")
+
+def fingerprint(entries: Iterable[EmtyDTO], base_prompt: str, model_name: str) -> str:
+    """Hash của model, prompt gốc và tiêu đề + mô tả các entry: cùng hash là cùng câu hỏi gửi cho Gemini."""
+    digest = hashlib.sha256()
+    for part in (model_name, base_prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for entry in entries:
+        for part in (entry.get_title_emty(), entry.get_description_emty()):
+            digest.update((part or "").encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+class AnalysisCache:
+    """
+    Cache fingerprint (xem `fingerprint`) → kết quả phân tích của Gemini, để phân tích lại một feed
+    chưa đổi không tốn thêm quota API. Được lưu xuống file JSON và nạp lại khi khởi động.
+    """
+    def __init__(self, path: Optional[str] = GEMINI_ANALYSIS_CACHE_PATH, maxsize: int = GEMINI_ANALYSIS_CACHE_SIZE,
+                 ttl: float = GEMINI_ANALYSIS_TTL):
+        self.__cache = PersistentTTLCache(path, maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.__cache.get(key)
+
+    def set(self, key: str, result: str) -> None:
+        self.__cache.set(key, result)
+
+    def invalidate(self, key: str) -> None:
+        self.__cache.invalidate(key)
+
+    def save(self) -> None:
+        self.__cache.save()
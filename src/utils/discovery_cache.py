@@ -0,0 +1,36 @@
+import os
+from typing import Optional
+from utils.ttl_cache import PersistentTTLCache
+
+# Kết quả tìm RSS của một trang: thời gian sống khi tìm thấy / không tìm thấy (giây)
+RSS_DISCOVERY_TTL = int(os.getenv("RSS_DISCOVERY_TTL", "86400"))
+RSS_DISCOVERY_NEGATIVE_TTL = int(os.getenv("RSS_DISCOVERY_NEGATIVE_TTL", "300"))
+RSS_DISCOVERY_CACHE_SIZE = int(os.getenv("RSS_DISCOVERY_CACHE_SIZE", "2048"))
+# File JSON lưu cache qua các lần khởi động lại; để trống để chỉ cache trong bộ nhớ
+RSS_DISCOVERY_CACHE_PATH = os.getenv("RSS_DISCOVERY_CACHE_PATH", "rss_discovery.json")
+
+class DiscoveryCache:
+    """
+    Cache URL trang web (đã qua handle_url) → RSS link tìm được, hoặc None nếu trang không có RSS.
+    Kết quả rỗng chỉ giữ trong thời gian ngắn để trang mới thêm RSS sẽ sớm được nhận ra.
+    Được lưu xuống file JSON (kèm thời điểm hết hạn) và nạp lại khi khởi động.
+    """
+    MISSING = PersistentTTLCache.MISSING
+
+    def __init__(self, path: Optional[str] = RSS_DISCOVERY_CACHE_PATH, maxsize: int = RSS_DISCOVERY_CACHE_SIZE,
+                 ttl: float = RSS_DISCOVERY_TTL, negative_ttl: float = RSS_DISCOVERY_NEGATIVE_TTL):
+        self.negative_ttl = negative_ttl
+        self.__cache = PersistentTTLCache(path, maxsize=maxsize, ttl=ttl)
+
+    def get(self, url: str):
+        """RSS link (hoặc None nếu đã biết là không có); DiscoveryCache.MISSING nếu chưa cache."""
+        return self.__cache.get(url, self.MISSING)
+
+    def set(self, url: str, rss_link: Optional[str]) -> None:
+        self.__cache.set(url, rss_link, None if rss_link else self.negative_ttl)
+
+    def invalidate(self, url: str) -> None:
+        self.__cache.invalidate(url)
+
+    def save(self) -> None:
+        self.__cache.save()
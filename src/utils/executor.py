@@ -0,0 +1,82 @@
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Số thread dành cho các lời gọi blocking (HTTP, feedparser, Firestore, Gemini)
+BLOCKING_WORKERS = int(os.getenv("BLOCKING_WORKERS", "16"))
+
+class BlockingExecutor:
+    """
+    Thread pool có kích thước cố định cho các lời gọi blocking, để event loop của Discord
+    (heartbeat, các lệnh khác) không bị đứng. Ghi lại độ sâu hàng đợi và thời gian chờ.
+    """
+    def __init__(self, max_workers: int = BLOCKING_WORKERS, name: str = "blocking"):
+        self.max_workers = max(1, max_workers)
+        self.__pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self.__lock = threading.Lock()
+        self.__queued = 0
+        self.__running = 0
+        self.__completed = 0
+        self.__total_wait = 0.0
+        self.__max_wait = 0.0
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Chạy `func(*args, **kwargs)` trong pool và await kết quả."""
+        submitted_at = time.monotonic()
+        started = False
+        with self.__lock:
+            self.__queued += 1
+
+        def call():
+            nonlocal started
+            waited = time.monotonic() - submitted_at
+            with self.__lock:
+                started = True
+                self.__queued -= 1
+                self.__running += 1
+                self.__total_wait += waited
+                self.__max_wait = max(self.__max_wait, waited)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self.__lock:
+                    self.__running -= 1
+                    self.__completed += 1
+
+        def on_done(_future: Future) -> None:
+            # Bị hủy khi còn trong hàng đợi (await bị cancel, shutdown) → call() không chạy
+            with self.__lock:
+                if not started:
+                    self.__queued -= 1
+
+        future = self.__pool.submit(call)
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, float]:
+        """queued: đang chờ thread; running: đang chạy; avg_wait/max_wait: thời gian chờ (giây)."""
+        with self.__lock:
+            started = self.__completed + self.__running
+            return {
+                "workers": self.max_workers,
+                "queued": self.__queued,
+                "running": self.__running,
+                "completed": self.__completed,
+                "avg_wait": self.__total_wait / started if started else 0.0,
+                "max_wait": self.__max_wait,
+            }
+
+    def shutdown(self) -> None:
+        self.__pool.shutdown(wait=False, cancel_futures=True)
+
+_executor = BlockingExecutor()
+
+def get_executor() -> BlockingExecutor:
+    return _executor
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Await một lời gọi blocking trên executor dùng chung."""
+    return await _executor.run(func, *args, **kwargs)
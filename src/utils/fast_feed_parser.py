@@ -0,0 +1,369 @@
+import os
+import re
+import logging
+import feedparser
+import xml.etree.ElementTree as ET
+from collections import deque
+from typing import Deque, Dict, Optional
+from urllib.parse import urljoin
+from feedparser import FeedParserDict
+from feedparser.datetimes import _parse_date
+
+logger = logging.getLogger("FastFeedParser")
+
+# Tắt (0) để luôn dùng feedparser
+FEED_FAST_PARSER = os.getenv("FEED_FAST_PARSER", "1").strip().lower() not in ("0", "false", "no", "off")
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+_SY = "{http://purl.org/rss/1.0/modules/syndication/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+
+_XML_DECL_ENCODING_RE = re.compile(rb"""^\s*<\?xml[^>]*encoding=["']([A-Za-z0-9._-]+)["']""")
+_UTF8 = {"utf-8", "utf8"}
+
+class UnsupportedFeed(Exception):
+    """Feed hỏng hoặc dùng định dạng/tính năng mà parser nhanh không xử lý → dùng feedparser."""
+
+def _text(elem) -> str:
+    return (elem.text or "").strip() if elem is not None else ""
+
+def _date(target: Dict, key: str, value: str) -> None:
+    """Gán `key` và `key_parsed` (struct_time UTC) giống feedparser."""
+    if value and key not in target:
+        target[key] = value
+        target[f"{key}_parsed"] = _parse_date(value)
+
+def _media(target: Dict, elem) -> None:
+    """media:thumbnail / media:content (kể cả nằm trong media:group) → danh sách thuộc tính như feedparser."""
+    for child in elem.iter():
+        if child.tag == f"{_MEDIA}thumbnail":
+            target.setdefault("media_thumbnail", []).append(FeedParserDict(child.attrib))
+        elif child.tag == f"{_MEDIA}content":
+            target.setdefault("media_content", []).append(FeedParserDict(child.attrib))
+
+class _Parser:
+    """
+    Đọc RSS 2.0 / Atom 1.0 bằng XMLPullParser theo từng đoạn byte, xử lý và giải phóng từng item/entry
+    ngay khi đọc xong. Giữ tối đa `max_entries` entry: feed mới → cũ thì `done` bật lên khi đủ
+    (không cần đọc tiếp), feed cũ → mới thì bỏ dần entry cũ nhất.
+    """
+    def __init__(self, base_url: str, max_entries: Optional[int] = None):
+        self.base_url = base_url
+        self.max_entries = max_entries
+        self.version = None
+        self.feed = FeedParserDict()
+        self.entries: Deque[FeedParserDict] = deque()
+        self.done = False
+        self.__oldest_first: Optional[bool] = None
+        self.__depth = 0
+        self.__pull = ET.XMLPullParser(events=("start", "end"))
+
+    def _url(self, href: str) -> str:
+        href = href.strip()
+        return urljoin(self.base_url, href) if href and self.base_url else href
+
+    def feed_data(self, data: bytes) -> None:
+        try:
+            self.__pull.feed(data)
+            for event, elem in self.__pull.read_events():
+                self._handle(event, elem)
+                if self.done:
+                    return
+        except ET.ParseError as e:
+            raise UnsupportedFeed(f"malformed XML: {e}")
+
+    def _handle(self, event: str, elem) -> None:
+        if event == "start":
+            self.__depth += 1
+            if _XML_BASE in elem.attrib:
+                raise UnsupportedFeed("xml:base")
+            if self.__depth == 1:
+                self._root(elem)
+            return
+
+        self.__depth -= 1
+        depth = self.__depth
+        if self.version == "rss20":
+            if depth == 2 and elem.tag == "item":
+                self._add_entry(self._rss_item(elem))
+                elem.clear()
+            elif depth == 2:
+                self._rss_channel_field(elem)
+                elem.clear()
+        else:
+            if depth == 1 and elem.tag == f"{_ATOM}entry":
+                self._add_entry(self._atom_entry(elem))
+                elem.clear()
+            elif depth == 1:
+                self._atom_feed_field(elem)
+                elem.clear()
+
+    def _add_entry(self, entry: FeedParserDict) -> None:
+        self.entries.append(entry)
+        if self.__oldest_first is None and len(self.entries) >= 2:
+            first = self.entries[0].get("published_parsed") or self.entries[0].get("updated_parsed")
+            second = self.entries[1].get("published_parsed") or self.entries[1].get("updated_parsed")
+            if first and second:
+                self.__oldest_first = first < second
+        if self.max_entries is None or len(self.entries) < self.max_entries:
+            return
+        if self.__oldest_first:
+            while len(self.entries) > self.max_entries:
+                self.entries.popleft()
+        else:
+            self.done = True
+
+    def close(self, truncated: bool = False) -> FeedParserDict:
+        """Kết quả cuối. Khi đã dừng sớm (`done`) hoặc dữ liệu bị cắt (`truncated`), phần XML còn dở được bỏ qua."""
+        if not (self.done or truncated):
+            try:
+                self.__pull.close()
+                for event, elem in self.__pull.read_events():
+                    self._handle(event, elem)
+            except ET.ParseError as e:
+                raise UnsupportedFeed(f"malformed XML: {e}")
+        if self.version is None:
+            raise UnsupportedFeed("empty document")
+
+        if self.version == "atom10" and "link" not in self.feed and self.feed.get("id"):
+            self.feed["link"] = self.feed["id"]
+        return FeedParserDict(
+            bozo=False,
+            version=self.version,
+            encoding="utf-8",
+            namespaces={},
+            feed=self.feed,
+            entries=list(self.entries),
+        )
+
+    def _root(self, elem) -> None:
+        if elem.tag == "rss" and elem.get("version", "").startswith("2."):
+            self.version = "rss20"
+        elif elem.tag == f"{_ATOM}feed":
+            self.version = "atom10"
+        else:
+            # RSS 0.9x/1.0 (RDF), Atom 0.3, ... để feedparser lo
+            raise UnsupportedFeed(f"root <{elem.tag}>")
+
+    # ---- RSS 2.0 ----
+
+    def _rss_channel_field(self, elem) -> None:
+        tag, feed = elem.tag, self.feed
+        if tag == "title":
+            feed.setdefault("title", _text(elem))
+        elif tag == "link":
+            feed.setdefault("link", self._url(_text(elem)))
+        elif tag == "description":
+            feed.setdefault("subtitle", _text(elem))
+        elif tag == "pubDate":
+            _date(feed, "published", _text(elem))
+        elif tag == "lastBuildDate":
+            _date(feed, "updated", _text(elem))
+        elif tag == "image":
+            image = FeedParserDict()
+            for child in elem:
+                if child.tag == "url":
+                    image["href"] = self._url(_text(child))
+                elif child.tag in ("title", "link"):
+                    image[child.tag] = _text(child)
+            feed.setdefault("image", image)
+        elif tag == "ttl":
+            feed["ttl"] = _text(elem)
+        elif tag == "skipHours":
+            feed["skiphours"] = [_text(child) for child in elem if child.tag == "hour"]
+        elif tag == f"{_SY}updatePeriod":
+            feed["sy_updateperiod"] = _text(elem)
+        elif tag == f"{_SY}updateFrequency":
+            feed["sy_updatefrequency"] = _text(elem)
+        elif tag == "language":
+            feed["language"] = _text(elem)
+
+    def _rss_item(self, elem) -> FeedParserDict:
+        entry = FeedParserDict()
+        guid = None
+        for child in elem:
+            tag = child.tag
+            if tag == "title":
+                entry.setdefault("title", _text(child))
+            elif tag == "link":
+                entry.setdefault("link", self._url(_text(child)))
+            elif tag == "description":
+                entry.setdefault("summary", _text(child))
+            elif tag == f"{_CONTENT}encoded":
+                entry.setdefault("content", [FeedParserDict(type="text/html", value=_text(child))])
+            elif tag == "guid":
+                guid = child
+            elif tag == "pubDate":
+                _date(entry, "published", _text(child))
+            elif tag == f"{_DC}date":
+                _date(entry, "updated", _text(child))
+            elif tag.startswith(_MEDIA):
+                _media(entry, child)
+
+        if guid is not None:
+            entry["id"] = _text(guid)
+            entry["guidislink"] = guid.get("isPermaLink", "true").lower() != "false"
+            if entry["guidislink"] and "link" not in entry:
+                entry["link"] = entry["id"]
+        if "summary" not in entry and "content" in entry:
+            entry["summary"] = entry["content"][0]["value"]
+        return entry
+
+    # ---- Atom 1.0 ----
+
+    @staticmethod
+    def _atom_text(elem) -> str:
+        if elem.get("type") == "xhtml":
+            raise UnsupportedFeed("xhtml text construct")
+        return _text(elem)
+
+    def _atom_link(self, target: Dict, elem) -> None:
+        rel = elem.get("rel", "alternate")
+        href = self._url(elem.get("href", ""))
+        if rel == "alternate" and href:
+            target.setdefault("link", href)
+
+    def _atom_feed_field(self, elem) -> None:
+        tag, feed = elem.tag, self.feed
+        if tag == f"{_ATOM}title":
+            feed.setdefault("title", self._atom_text(elem))
+        elif tag == f"{_ATOM}subtitle":
+            feed.setdefault("subtitle", self._atom_text(elem))
+        elif tag == f"{_ATOM}id":
+            feed.setdefault("id", _text(elem))
+        elif tag == f"{_ATOM}link":
+            self._atom_link(feed, elem)
+        elif tag == f"{_ATOM}logo":
+            feed.setdefault("logo", self._url(_text(elem)))
+        elif tag == f"{_ATOM}icon":
+            feed.setdefault("icon", self._url(_text(elem)))
+        elif tag == f"{_ATOM}updated":
+            _date(feed, "updated", _text(elem))
+        elif tag == f"{_ATOM}published":
+            _date(feed, "published", _text(elem))
+
+    def _atom_entry(self, elem) -> FeedParserDict:
+        entry = FeedParserDict()
+        for child in elem:
+            tag = child.tag
+            if tag == f"{_ATOM}title":
+                entry.setdefault("title", self._atom_text(child))
+            elif tag == f"{_ATOM}link":
+                self._atom_link(entry, child)
+            elif tag == f"{_ATOM}id":
+                entry.setdefault("id", _text(child))
+            elif tag == f"{_ATOM}summary":
+                entry.setdefault("summary", self._atom_text(child))
+            elif tag == f"{_ATOM}content":
+                if child.get("src"):
+                    raise UnsupportedFeed("out-of-line content")
+                entry.setdefault("content", [FeedParserDict(type=child.get("type", "text"), value=self._atom_text(child))])
+            elif tag == f"{_ATOM}published":
+                _date(entry, "published", _text(child))
+            elif tag == f"{_ATOM}updated":
+                _date(entry, "updated", _text(child))
+            elif tag.startswith(_MEDIA):
+                _media(entry, child)
+                if tag == f"{_MEDIA}group" and "summary" not in entry:
+                    # YouTube: mô tả video nằm trong media:group/media:description
+                    description = child.find(f"{_MEDIA}description")
+                    if description is not None:
+                        entry["summary"] = _text(description)
+
+        # Như feedparser: không có link alternate thì id được dùng làm link
+        if "link" not in entry and entry.get("id"):
+            entry["link"] = entry["id"]
+        if "summary" not in entry and "content" in entry:
+            entry["summary"] = entry["content"][0]["value"]
+        return entry
+
+def _check_head(head: bytes, headers: Dict[str, str]) -> None:
+    """Những trường hợp để feedparser lo ngay từ đầu: có DOCTYPE, hoặc charset HTTP khác khai báo trong XML."""
+    if b"<!DOCTYPE" in head or b"<!doctype" in head:
+        raise UnsupportedFeed("DOCTYPE")
+    # feedparser có quy tắc riêng khi hai charset khác nhau, không đoán
+    match = _XML_DECL_ENCODING_RE.match(head)
+    declared = match.group(1).decode().lower() if match else "utf-8"
+    charset = re.search(r"charset=([^\s;]+)", headers.get("content-type", ""), re.I)
+    if charset and charset.group(1).strip("\"'").lower() != declared and \
+            not (declared in _UTF8 and charset.group(1).strip("\"'").lower() in _UTF8):
+        raise UnsupportedFeed("charset mismatch")
+
+def parse_fast(content: bytes, response_headers: Optional[Dict[str, str]] = None) -> FeedParserDict:
+    """
+    Parse RSS 2.0 / Atom 1.0 hợp lệ thành dict cùng dạng với feedparser.parse (chỉ các khóa bot dùng).
+    Raise UnsupportedFeed khi gặp XML hỏng hoặc định dạng/tính năng lạ; khi đó hãy dùng feedparser.
+    """
+    headers = response_headers or {}
+    _check_head(content[:512], headers)
+    parser = _Parser(headers.get("content-location", ""))
+    parser.feed_data(content)
+    return parser.close()
+
+def parse_feed(content: bytes, response_headers: Optional[Dict[str, str]] = None) -> FeedParserDict:
+    """Parser nhanh nếu được, không thì feedparser (chậm hơn nhưng chịu được mọi kiểu feed)."""
+    stream = FeedStreamParser(response_headers)
+    stream.feed(content)
+    try:
+        return stream.close()
+    except UnsupportedFeed:
+        return feedparser.parse(content, response_headers=response_headers)
+
+class FeedStreamParser:
+    """
+    Parse feed theo từng đoạn byte khi đang tải, để không phải giữ cả body lẫn cả cây XML.
+    Dùng parser nhanh khi được (dừng khi đủ `max_entries` entry, xem `done`). Byte đã nhận chỉ được giữ
+    tới khi parser nhanh nhận phần tử gốc: bị từ chối trước đó thì close() đưa chúng cho feedparser;
+    bị từ chối sau đó thì `done` bật lên và close() raise UnsupportedFeed để bên gọi tải lại cho feedparser.
+    """
+    def __init__(self, response_headers: Optional[Dict[str, str]] = None, max_entries: Optional[int] = None):
+        self.headers = response_headers or {}
+        self.__fast: Optional[_Parser] = _Parser(self.headers.get("content-location", ""), max_entries) if FEED_FAST_PARSER else None
+        # Byte đã nhận, phòng khi phải chuyển sang feedparser; None khi đã bỏ (parser nhanh đã nhận feed)
+        self.__buffer: Optional[bytearray] = bytearray()
+        self.__reason = None if FEED_FAST_PARSER else "disabled"
+
+    @property
+    def done(self) -> bool:
+        """Không cần tải thêm: đã đủ entry, hoặc parser nhanh bỏ cuộc khi đã không còn giữ byte."""
+        if self.__fast is None:
+            return self.__buffer is None
+        return self.__fast.done
+
+    def feed(self, data: bytes) -> None:
+        if self.__fast is not None and self.__buffer is not None and not self.__buffer:
+            self.__check(lambda: _check_head(data[:512], self.headers))
+        if self.__buffer is not None:
+            self.__buffer += data
+        if self.__fast is not None:
+            self.__check(lambda: self.__fast.feed_data(data))
+            if self.__fast is not None and self.__fast.version is not None:
+                # Parser nhanh đã nhận feed: không giữ body nữa, bộ nhớ chỉ còn phụ thuộc số entry
+                self.__buffer = None
+
+    def __check(self, step) -> None:
+        try:
+            step()
+        except UnsupportedFeed as e:
+            self.__fast = None
+            self.__reason = str(e)
+
+    def close(self, truncated: bool = False) -> FeedParserDict:
+        """
+        `truncated`: body bị cắt giữa chừng (vượt giới hạn dung lượng).
+        Raise UnsupportedFeed nếu phải dùng feedparser mà byte đã nhận không còn được giữ.
+        """
+        if self.__fast is not None:
+            try:
+                return self.__fast.close(truncated)
+            except UnsupportedFeed as e:
+                self.__fast = None
+                self.__reason = str(e)
+        if self.__buffer is None:
+            raise UnsupportedFeed(self.__reason)
+        if FEED_FAST_PARSER:
+            logger.debug(f"Falling back to feedparser ({self.__reason}) for {self.headers.get('content-location', 'feed')}")
+        return feedparser.parse(bytes(self.__buffer), response_headers=self.headers)
@@ -0,0 +1,33 @@
+import os
+from typing import NamedTuple, Optional
+from utils.ttl_cache import TTLCache
+
+# Số feed URL giữ validator và thời gian giữ (giây); validator cũ chỉ làm lần tải sau trả 200 thay vì 304
+FEED_VALIDATOR_CACHE_SIZE = int(os.getenv("FEED_VALIDATOR_CACHE_SIZE", "4096"))
+FEED_VALIDATOR_TTL = int(os.getenv("FEED_VALIDATOR_TTL", "86400"))
+
+class CachedFeed(NamedTuple):
+    etag: Optional[str]
+    modified: Optional[str]
+
+class FeedValidatorCache:
+    """
+    Lưu ETag / Last-Modified cho từng feed URL (LRU, có TTL), để lần tải sau gửi
+    If-None-Match / If-Modified-Since và bỏ qua tải + parse khi server trả 304.
+    Không giữ bản parse: bên gọi nhận 304 (FeedPoller) chỉ cần biết feed không đổi.
+    """
+    def __init__(self, maxsize: int = FEED_VALIDATOR_CACHE_SIZE, ttl: float = FEED_VALIDATOR_TTL):
+        self.__entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, rss_link: str) -> Optional[CachedFeed]:
+        return self.__entries.get(rss_link)
+
+    def update(self, rss_link: str, etag: Optional[str], modified: Optional[str]) -> None:
+        if etag or modified:
+            self.__entries.set(rss_link, CachedFeed(etag, modified))
+        else:
+            # Server không hỗ trợ validator → không có gì để gửi lại lần sau
+            self.__entries.invalidate(rss_link)
+
+    def invalidate(self, rss_link: str) -> None:
+        self.__entries.invalidate(rss_link)
@@ -0,0 +1,123 @@
+import re
+from typing import Collection, Iterable, Iterator, Optional
+from dto.feed_dto import FeedDTO
+from dto.emty_dto import EmtyDTO
+from utils.text_processor import TextProcessor
+
+# Chuẩn hóa kết quả parse (FeedParserDict) thành DTO. Không có side effect khi import, để tiến trình
+# con của ParsePool dùng được mà không phải nạp handle_rss (Gemini, prompt.txt, các cache trên đĩa).
+
+def _first(*vals):
+    for v in vals:
+        if v:
+            return v
+    return ""
+
+def to_feed_dto(feed, rss_link: str) -> FeedDTO:
+    """FeedDTO từ phần thông tin chung của feed."""
+    # Lấy logo an toàn (RSS/Atom có thể khác khóa)
+    logo_url = ""
+    img_obj = feed.feed.get("image")
+    if isinstance(img_obj, dict):
+        logo_url = img_obj.get("href") or img_obj.get("url") or ""
+    logo_url = logo_url or feed.feed.get("logo", "")
+
+    description = feed.feed.get("subtitle", "") or feed.feed.get("description", "")
+
+    # PubDate cấp feed: ưu tiên published → updated → pubDate → lastBuildDate
+    feed_pub = _first(
+        feed.feed.get("published"),
+        feed.feed.get("updated"),
+        feed.feed.get("pubDate"),
+        feed.feed.get("lastBuildDate"),
+    )
+
+    return FeedDTO(
+        link_feed=feed.feed.get("link", "") or rss_link,
+        link_atom_feed=feed.feed.get("id", rss_link),
+        title_feed=feed.feed.get("title", "") or "",
+        description_feed=description,
+        logo_feed=logo_url,
+        pubDate_feed=feed_pub,
+    )
+
+def to_emty_dto(entry, feed_dto: FeedDTO) -> EmtyDTO:
+    """Chuẩn hóa một entry thành EmtyDTO (phần tốn CPU nhất: bóc HTML của nội dung)."""
+    normalized = entry.get("normalized")
+    if normalized:
+        # Đã được chuẩn hóa sẵn ở ParsePool
+        link_emty, title_emty, description_emty, image_emty, pubdate_emty = normalized
+        return EmtyDTO(
+            link_emty=link_emty,
+            link_feed=feed_dto.get_link_feed(),
+            link_atom_feed=feed_dto.get_link_atom_feed(),
+            title_emty=title_emty,
+            description_emty=description_emty,
+            image_emty=image_emty,
+            pubdate_emty=pubdate_emty,
+        )
+
+    # Ảnh trong entry (media)
+    media_content = ""
+    if getattr(entry, "media_thumbnail", None):
+        media_content = entry.media_thumbnail[0].get("url", "")
+    elif getattr(entry, "media_content", None):
+        media_content = entry.media_content[0].get("url", "")
+
+    # Nội dung entry
+    if isinstance(entry.get("content"), list) and entry["content"]:
+        content = entry["content"][0].get("value", "")
+    else:
+        content = entry.get("summary", entry.get("description", "")) or ""
+
+    # Nếu là link GitHub (Atom) thì gom khoảng trắng
+    if "github.com" in feed_dto.get_link_atom_feed():
+        content = re.sub(r"\s+", " ", content.replace("\n", " ")).strip()
+
+    # PubDate cấp entry: ưu tiên published → updated → pubDate
+    entry_pub = _first(
+        entry.get("published"),
+        entry.get("updated"),
+        entry.get("pubDate"),
+    )
+
+    return EmtyDTO(
+        link_emty=entry.get("link", ""),
+        link_feed=feed_dto.get_link_feed(),
+        link_atom_feed=feed_dto.get_link_atom_feed(),
+        title_emty=(entry.get("title") or "").strip(),
+        description_emty=str(TextProcessor.parse_html(content)),
+        image_emty=media_content,
+        pubdate_emty=entry_pub,
+    )
+
+def newest_first(entries) -> Iterable:
+    """Đa số feed xếp mới → cũ; feed xếp cũ → mới (so ngày của entry đầu và cuối) thì đọc ngược."""
+    if len(entries) > 1:
+        first = entries[0].get("published_parsed") or entries[0].get("updated_parsed")
+        last = entries[-1].get("published_parsed") or entries[-1].get("updated_parsed")
+        if first and last and first < last:
+            return reversed(entries)
+    return entries
+
+def iter_entries(feed, feed_dto: FeedDTO, stop_at: Optional[Collection[str]] = None,
+                 limit: Optional[int] = None) -> Iterator[EmtyDTO]:
+    """
+    Sinh EmtyDTO theo thứ tự mới → cũ, chuẩn hóa từng entry khi được lấy tới.
+    Dừng khi đủ `limit` entry, hoặc khi đã gặp hết các link trong `stop_at` (entry đã biết,
+    ví dụ con trỏ last_emty_link của các channel); entry đã biết cuối cùng không được sinh ra.
+    """
+    if limit is not None and limit <= 0:
+        return
+    pending = set(stop_at or ())
+    count = 0
+    for entry in newest_first(feed.entries):
+        link = entry.get("link", "")
+        if link in pending:
+            pending.discard(link)
+            if not pending:
+                return
+        yield to_emty_dto(entry, feed_dto)
+        count += 1
+        if limit is not None and count >= limit:
+            return
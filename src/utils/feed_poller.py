@@ -0,0 +1,246 @@
+import os
+import copy
+import time
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+from bll.async_channel_bll import AsyncChannelBLL
+from bll.async_feed_bll import AsyncFeedBLL
+from bll.async_emty_bll import AsyncEmtyBLL
+from dto.feed_dto import FeedDTO
+from dto.emty_dto import EmtyDTO
+from gui.embed_feed import EmbedFeed
+from utils.handle_rss import fetch_feed, forget_feed_validators, read_rss_entries
+from utils.feed_scheduler import FeedScheduler
+from utils.executor import run_blocking
+
+logger = logging.getLogger("FeedPoller")
+
+# Số feed được tải/xử lý cùng lúc trong một vòng poll
+FEED_POLL_CONCURRENCY = int(os.getenv("FEED_POLL_CONCURRENCY", "10"))
+# Số entry mới nhất được xét mỗi lần poll (entry cũ hơn coi như đã bỏ lỡ)
+FEED_MAX_NEW_ENTRIES = int(os.getenv("FEED_MAX_NEW_ENTRIES", "10"))
+
+class FeedPoller:
+    """
+    Một vòng poll: gom các subscription theo link_atom_feed, chỉ tải những URL đã đến hạn
+    theo `FeedScheduler` (mỗi URL đúng một lần, tối đa `concurrency` URL cùng lúc)
+    rồi gửi mọi entry mới hơn con trỏ của từng channel/DM đã đăng ký.
+    """
+    def __init__(self, bot, concurrency: int = FEED_POLL_CONCURRENCY):
+        self.bot = bot
+        self.scheduler = FeedScheduler()
+        self.__semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _resolve_target(self, channel_id: str) -> Optional[Tuple[object, str]]:
+        """Trả về (target, id_server): channel trong server, hoặc user nếu là DM."""
+        try:
+            target = self.bot.get_channel(int(channel_id))
+            if target:  # Server channel
+                return target, str(target.guild.id)
+            user = await self.bot.fetch_user(int(channel_id))  # DM channel
+            return user, str(user.id)
+        except Exception as e:
+            logger.exception(f"Error resolving target {channel_id}: {e}")
+            return None
+
+    @staticmethod
+    def _new_entries(entries: List[EmtyDTO], last_emty_link: Optional[str]) -> List[EmtyDTO]:
+        """
+        Các entry mới hơn con trỏ `last_emty_link`, theo thứ tự cũ → mới.
+        `entries` theo thứ tự mới → cũ; khi chưa có con trỏ chỉ lấy entry mới nhất.
+        """
+        if not last_emty_link:
+            return entries[:1]
+        new_entries = []
+        for emty_dto in entries:
+            if emty_dto.get_link_emty() == last_emty_link:
+                break
+            new_entries.append(emty_dto)
+        return new_entries[::-1]
+
+    async def _send_to_target(self, feed_dto, entries: List[EmtyDTO], target, id_server: str):
+        """Gửi các entry (đã được ghi vào DB) đến target theo thứ tự cũ → mới."""
+        try:
+            for emty_dto in entries:
+                embed = await run_blocking(EmbedFeed, id_server=id_server, feed_dto=feed_dto, emty_dto=emty_dto)
+                await target.send(embed=embed)
+                logger.info(f"✅ Sent feed to {getattr(target, 'name', 'DM')} ({target.id})")
+                logger.debug(f"Inserted emty: {emty_dto}")
+        except Exception as e:
+            logger.exception(f"Error sending feed {feed_dto.get_link_atom_feed()} to {target.id}: {e}")
+
+    async def _record_deliveries(self, deliveries: List[Tuple[FeedDTO, List[EmtyDTO]]]) -> Tuple[List[List[EmtyDTO]], bool]:
+        """
+        Ghi entry mới của mọi subscription trong một lượt WriteBatch rồi dời con trỏ,
+        trước khi gửi bất cứ thứ gì. Trả về, cho từng subscription, các entry vừa ghi (cần gửi),
+        và cờ cho biết mọi entry lẫn con trỏ đều đã được ghi.
+        """
+        records = [emty_dto for _, new_entries in deliveries for emty_dto in new_entries]
+        results = await AsyncEmtyBLL().insert_emty_batch(records)
+        complete = all(inserted is not None for inserted in results)
+
+        to_send, cursors, offset = [], [], 0
+        for subscription, new_entries in deliveries:
+            sendable, cursor = [], None
+            for emty_dto, inserted in zip(new_entries, results[offset:offset + len(new_entries)]):
+                if inserted is None:  # Ghi lỗi → giữ con trỏ ở đây để lần poll sau thử lại
+                    break
+                cursor = emty_dto.get_link_emty()
+                if inserted:
+                    sendable.append(emty_dto)
+            offset += len(new_entries)
+            to_send.append(sendable)
+            if cursor and cursor != subscription.get_last_emty_link():
+                cursors.append((subscription, cursor))
+
+        if cursors:
+            complete = await AsyncFeedBLL().update_last_emty_batch(cursors) and complete
+        return to_send, complete
+
+    async def _process_feed_url(self, link_atom_feed: str, subscriptions: List[Tuple[FeedDTO, object, str]],
+                                started_at: Optional[float] = None):
+        """
+        Tải và parse `link_atom_feed` một lần, sau đó fan-out đến tất cả subscription.
+        `started_at`: lúc bắt đầu vòng poll, làm mốc tính lần poll kế tiếp.
+        """
+        feed = None
+        try:
+            try:
+                async with self.__semaphore:
+                    # fetch_feed là blocking I/O → chạy trong thread để các feed khác không phải chờ
+                    feed = await run_blocking(fetch_feed, link_atom_feed, only_if_modified=True)
+            finally:
+                self.scheduler.schedule(link_atom_feed, feed, now=started_at)
+
+            if feed is None:
+                logger.debug(f"Feed not modified: {link_atom_feed}")
+                return
+
+            if not feed.entries:
+                logger.warning(f"Incomplete feed data for {link_atom_feed}")
+                return
+
+            # Chuẩn hóa tối đa FEED_MAX_NEW_ENTRIES entry mới nhất, dừng sớm khi đã gặp con trỏ của mọi
+            # subscription. Có subscription chưa có con trỏ thì không dừng sớm (con trỏ của subscription khác
+            # có thể chính là entry mới nhất, entry mà subscription mới cần).
+            cursors = [subscription.get_last_emty_link() for subscription, _, _ in subscriptions]
+            stop_at = set(cursors) if all(cursors) else None
+            feed_dto, entries = await run_blocking(read_rss_entries, link_atom_feed, FEED_MAX_NEW_ENTRIES, feed, stop_at)
+            if not entries:
+                logger.debug(f"No new entries: {link_atom_feed}")
+                return
+
+            # Đủ giới hạn mà không thấy con trỏ → con trỏ cũ hơn giới hạn (hoặc đã rời feed),
+            # các entry giữa con trỏ và giới hạn bị bỏ qua
+            window = {emty_dto.get_link_emty() for emty_dto in entries} if len(entries) >= FEED_MAX_NEW_ENTRIES else None
+
+            deliveries, targets = [], []
+            for subscription, target, id_server in subscriptions:
+                cursor = subscription.get_last_emty_link()
+                if window is not None and cursor and cursor not in window:
+                    logger.warning(f"Cursor not within the {FEED_MAX_NEW_ENTRIES} newest entries of {link_atom_feed} "
+                                   f"for channel {subscription.get_channel_id()}; older entries are skipped.")
+                new_entries = []
+                for emty_dto in self._new_entries(entries, subscription.get_last_emty_link()):
+                    emty_dto = copy.copy(emty_dto)
+                    emty_dto.set_channel_id(str(target.id))
+                    new_entries.append(emty_dto)
+                if new_entries:
+                    deliveries.append((subscription, new_entries))
+                    targets.append((target, id_server))
+            if not deliveries:
+                return
+
+            to_send, complete = await self._record_deliveries(deliveries)
+            if not complete:
+                # Validator đã được lưu lúc tải: giữ lại thì lần poll sau nhận 304 và không thử ghi lại
+                forget_feed_validators(link_atom_feed)
+            await asyncio.gather(*(
+                self._send_to_target(feed_dto, sendable, target, id_server)
+                for sendable, (target, id_server) in zip(to_send, targets) if sendable
+            ))
+        except Exception as e:
+            logger.exception(f"Error processing feed {link_atom_feed}: {e}")
+            if feed is not None:
+                forget_feed_validators(link_atom_feed)
+
+    @staticmethod
+    async def _active_channel_ids() -> Set[str]:
+        return {channel.get_channel_id() async for channel in AsyncChannelBLL().iter_all_channel()}
+
+    @staticmethod
+    async def _group_by_feed_url() -> Dict[str, List[FeedDTO]]:
+        grouped: Dict[str, List[FeedDTO]] = {}
+        async for feed in AsyncFeedBLL().iter_all_feed():
+            grouped.setdefault(feed.get_link_atom_feed(), []).append(feed)
+        return grouped
+
+    async def _backfill_server_ids(self, subscriptions: Dict[str, List[FeedDTO]]) -> None:
+        """
+        Gán server_id cho feed chưa có (ghi bởi bản cũ sau lần reconcile lúc khởi động) theo guild
+        của channel trong cache của bot, để /show thấy feed đó ngay mà không cần khởi động lại.
+        """
+        try:
+            updates = []
+            for feeds in subscriptions.values():
+                for feed in feeds:
+                    if feed.get_server_id():
+                        continue
+                    guild = getattr(self.bot.get_channel(int(feed.get_channel_id())), "guild", None)
+                    if guild is not None:
+                        updates.append((feed, str(guild.id)))
+            if updates and await AsyncFeedBLL().update_server_id_batch(updates):
+                logger.info(f"Backfilled server_id on {len(updates)} feed(s).")
+        except Exception as e:
+            logger.exception(f"Error backfilling feed server_id: {e}")
+
+    async def run_cycle(self):
+        """Lấy danh sách feed từ DB và gửi đến các channel/DM tương ứng."""
+        # Mốc chung cho cả vòng: lịch tính từ lúc vòng bắt đầu (nhịp cố định của tasks.loop),
+        # không phải lúc tải xong, để feed có khoảng poll 60 giây đến hạn đúng ở vòng kế tiếp
+        started_at = time.time()
+        try:
+            # Đọc hai collection theo trang, song song, không giữ danh sách đầy đủ
+            active_channel_ids, grouped = await asyncio.gather(
+                self._active_channel_ids(),
+                self._group_by_feed_url(),
+            )
+            num_subscriptions = sum(len(feeds) for feeds in grouped.values())
+
+            # link_atom_feed → các subscription (FeedDTO của từng channel) còn hoạt động
+            subscriptions: Dict[str, List[FeedDTO]] = {}
+            for link, feeds in grouped.items():
+                feeds = [feed for feed in feeds if str(feed.get_channel_id()) in active_channel_ids]
+                if feeds:
+                    subscriptions[link] = feeds
+
+            await self._backfill_server_ids(subscriptions)
+
+            self.scheduler.sync(subscriptions.keys(), now=started_at)
+            due = self.scheduler.pop_due(now=started_at)
+            if not due:
+                return
+            subscriptions = {link: subscriptions[link] for link in due}
+            try:
+                channel_ids = list({str(feed.get_channel_id()) for feeds in subscriptions.values() for feed in feeds})
+                resolved = await asyncio.gather(*(self._resolve_target(cid) for cid in channel_ids))
+                targets = {cid: t for cid, t in zip(channel_ids, resolved) if t}
+
+                # Không resolve được channel nào của một URL → không có ai để gửi, khỏi tải feed đó
+                # (requeue bên dưới đưa nó lại vào lịch)
+                resolved_subscriptions = {
+                    link: [(feed, *targets[str(feed.get_channel_id())])
+                           for feed in feeds if str(feed.get_channel_id()) in targets]
+                    for link, feeds in subscriptions.items()
+                }
+                await asyncio.gather(*(
+                    self._process_feed_url(link, link_subscriptions, started_at)
+                    for link, link_subscriptions in resolved_subscriptions.items() if link_subscriptions
+                ))
+            finally:
+                # Feed đã pop mà chưa được _process_feed_url schedule lại (lỗi giữa chừng) → đưa lại vào lịch
+                self.scheduler.requeue(due, now=started_at)
+            logger.debug(f"Polled {len(subscriptions)} due feed URL(s) out of {num_subscriptions} subscription(s)")
+        except Exception as e:
+            logger.exception(f"Error loading feed list: {e}")
@@ -0,0 +1,211 @@
+import os
+import time
+import heapq
+import logging
+import calendar
+import threading
+from email.utils import parsedate_to_datetime
+from statistics import median
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger("FeedScheduler")
+
+# Khoảng poll ngắn nhất / dài nhất cho một feed (giây)
+FEED_MIN_INTERVAL = int(os.getenv("FEED_MIN_INTERVAL", "60"))
+FEED_MAX_INTERVAL = int(os.getenv("FEED_MAX_INTERVAL", "21600"))
+
+# Feed đến hạn trong vòng chừng này giây cũng được lấy ra ngay: vòng poll chạy theo nhịp cố định
+# nhưng thời điểm bắt đầu lệch vài ms-giây, không được để feed trễ nguyên một vòng vì thế
+FEED_DUE_SLACK = 5.0
+
+# Số pubdate gần nhất dùng để ước lượng nhịp đăng bài
+_CADENCE_SAMPLES = 10
+
+_UPDATE_PERIODS = {
+    "hourly": 3600,
+    "daily": 86400,
+    "weekly": 604800,
+    "monthly": 2592000,
+    "yearly": 31536000,
+}
+
+class FeedScheduler:
+    """
+    Hàng đợi ưu tiên theo thời điểm đến hạn của từng feed URL.
+    Khoảng poll được học từ nhịp pubdate của entry và tôn trọng <ttl>, sy:updatePeriod,
+    skipHours và Retry-After, để mỗi feed chỉ được tải khi thật sự đến hạn.
+    """
+    def __init__(self, min_interval: int = FEED_MIN_INTERVAL, max_interval: int = FEED_MAX_INTERVAL):
+        self.__min_interval = max(1, min_interval)
+        self.__max_interval = max(self.__min_interval, max_interval)
+        self.__heap: List[Tuple[float, str]] = []
+        self.__due: Dict[str, float] = {}
+        self.__interval: Dict[str, float] = {}
+        self.__in_flight: Set[str] = set()  # Đã pop_due, chưa được schedule lại
+        self.__lock = threading.Lock()
+
+    def sync(self, links: Iterable[str], now: Optional[float] = None) -> None:
+        """Thêm feed mới (đến hạn ngay) và bỏ các feed không còn ai đăng ký."""
+        now = time.time() if now is None else now
+        links = set(links)
+        with self.__lock:
+            for link in links - self.__due.keys():
+                self.__push(link, now)
+            for link in self.__due.keys() - links:
+                # Mục cũ trong heap sẽ bị bỏ qua khi pop
+                del self.__due[link]
+                self.__interval.pop(link, None)
+                self.__in_flight.discard(link)
+
+    def pop_due(self, now: Optional[float] = None, slack: float = FEED_DUE_SLACK) -> List[str]:
+        """
+        Lấy ra các feed đã đến hạn (hoặc sẽ đến hạn trong `slack` giây).
+        Mỗi feed lấy ra phải được `schedule` lại sau khi xử lý.
+        """
+        now = time.time() if now is None else now
+        due = []
+        with self.__lock:
+            while self.__heap and self.__heap[0][0] <= now + slack:
+                due_at, link = heapq.heappop(self.__heap)
+                if self.__due.get(link) == due_at:
+                    due.append(link)
+            self.__in_flight.update(due)
+        return due
+
+    def requeue(self, links: Iterable[str], now: Optional[float] = None) -> None:
+        """
+        Đưa lại vào hàng đợi các feed đã pop_due nhưng chưa được `schedule` (lỗi giữa chừng, hoặc bị bỏ qua),
+        với khoảng poll hiện tại như một lần tải lỗi, để feed không bị mất khỏi lịch.
+        """
+        now = time.time() if now is None else now
+        with self.__lock:
+            for link in links:
+                if link in self.__in_flight and link in self.__due:
+                    self.__in_flight.discard(link)
+                    self.__push(link, now + self.__interval.get(link, self.__min_interval))
+
+    def schedule(self, link: str, feed=None, now: Optional[float] = None) -> float:
+        """
+        Tính lần poll kế tiếp cho `link` từ kết quả feedparser (None nếu 304 hoặc lỗi)
+        và đưa lại vào hàng đợi. Trả về thời điểm đến hạn.
+        """
+        now = time.time() if now is None else now
+        with self.__lock:
+            self.__in_flight.discard(link)
+            if link not in self.__due:
+                return now  # Feed đã bị hủy đăng ký trong lúc đang tải
+
+            interval = self.__interval.get(link, self.__min_interval)
+            if feed is not None:
+                interval = self.__learn_interval(feed, interval)
+                self.__interval[link] = interval
+
+            due_at = now + interval
+            retry_after = self._retry_after(feed, now)
+            if retry_after is not None:
+                due_at = max(due_at, now + retry_after)
+
+            due_at = self._skip_hours(feed, due_at)
+            self.__push(link, due_at)
+            return due_at
+
+    def __push(self, link: str, due_at: float) -> None:
+        self.__due[link] = due_at
+        heapq.heappush(self.__heap, (due_at, link))
+
+    def __learn_interval(self, feed, previous: float) -> float:
+        interval = previous
+        cadence = self._publish_cadence(feed)
+        if cadence is not None:
+            # Poll gấp đôi nhịp đăng bài để không trễ quá nửa chu kỳ
+            interval = cadence / 2
+
+        hint = self._publisher_hint(feed)
+        if hint is not None:
+            interval = max(interval, hint)
+
+        return min(max(interval, self.__min_interval), self.__max_interval)
+
+    @staticmethod
+    def _publish_cadence(feed) -> Optional[float]:
+        """Trung vị khoảng cách giữa các pubdate gần nhất (giây)."""
+        stamps = []
+        for entry in feed.get("entries", []):
+            parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            if parsed:
+                stamps.append(calendar.timegm(parsed))
+        stamps = sorted(set(stamps), reverse=True)[:_CADENCE_SAMPLES]
+        if len(stamps) < 2:
+            return None
+        return median(a - b for a, b in zip(stamps, stamps[1:]))
+
+    @staticmethod
+    def _publisher_hint(feed) -> Optional[float]:
+        """Khoảng cập nhật mà publisher khai báo qua <ttl> (phút) hoặc sy:updatePeriod/updateFrequency."""
+        channel = feed.get("feed", {})
+        hints = []
+        try:
+            ttl = channel.get("ttl")
+            if ttl:
+                hints.append(int(ttl) * 60)
+        except (TypeError, ValueError):
+            pass
+
+        period = _UPDATE_PERIODS.get(str(channel.get("sy_updateperiod", "")).strip().lower())
+        if period:
+            try:
+                frequency = max(1, int(channel.get("sy_updatefrequency") or 1))
+            except (TypeError, ValueError):
+                frequency = 1
+            hints.append(period / frequency)
+
+        return max(hints) if hints else None
+
+    @staticmethod
+    def _retry_after(feed, now: float) -> Optional[float]:
+        """Retry-After (giây hoặc HTTP-date) khi server trả 429/503."""
+        if feed is None or getattr(feed, "status", None) not in (429, 503):
+            return None
+        value = (feed.get("headers") or {}).get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _skip_hours(feed, due_at: float) -> float:
+        """Dời `due_at` ra khỏi các giờ (GMT) mà feed khai báo trong <skipHours>."""
+        hours = FeedScheduler._parse_skip_hours(feed)
+        if not hours or len(hours) >= 24:
+            return due_at
+        while time.gmtime(due_at).tm_hour in hours:
+            due_at = (int(due_at) // 3600 + 1) * 3600
+        return due_at
+
+    @staticmethod
+    def _parse_skip_hours(feed) -> Set[int]:
+        if feed is None:
+            return set()
+        channel = feed.get("feed", {})
+        raw = channel.get("skiphours")
+        if isinstance(raw, (list, tuple, set)):
+            values = raw
+        elif "skiphours" in channel:
+            # feedparser gộp các <hour> con vào một khóa duy nhất
+            values = [channel.get("hour")]
+        else:
+            return set()
+
+        hours = set()
+        for value in values:
+            try:
+                hours.add(int(value) % 24)
+            except (TypeError, ValueError):
+                continue
+        return hours
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List
+from bll.async_channel_bll import AsyncChannelBLL
+from bll.async_feed_bll import AsyncFeedBLL
+from bll.async_server_bll import AsyncServerBLL
+from dto.channel_dto import ChannelDTO
+from dto.server_dto import ServerDTO
+
+logger = logging.getLogger("GuildSync")
+
+class GuildSync:
+    """
+    Bản sao trong bộ nhớ của tbl_server / tbl_channel, đánh chỉ mục theo ID.
+    Đối chiếu toàn bộ một lần lúc khởi động, sau đó chỉ cập nhật theo gateway event.
+    Chỉ channel đã có trong DB (đã đăng ký feed) mới được theo dõi.
+    """
+    def __init__(self):
+        self.__servers: Dict[str, ServerDTO] = {}
+        self.__channels: Dict[str, ChannelDTO] = {}
+
+    async def reconcile(self, guilds: Iterable) -> bool:
+        """
+        Nạp server/channel từ DB rồi ghi mọi chênh lệch với danh sách guild hiện tại trong một lượt batch.
+        Trả về False nếu lỗi giữa chừng (để lần on_ready sau thử lại).
+        """
+        try:
+            self.__servers, self.__channels = await asyncio.gather(self._load_servers(), self._load_channels())
+
+            server_changes, channel_changes = [], []
+            for guild in guilds:
+                server_changes += self._server_changes(guild)
+                channel_changes += self._channel_changes(guild.channels)
+            await self._save(server_changes, channel_changes)
+            await self._backfill_feed_servers(guilds)
+            logger.info(f"Reconciled {len(self.__servers)} server(s) and {len(self.__channels)} channel(s): "
+                        f"{len(server_changes)} server / {len(channel_changes)} channel change(s).")
+            return True
+        except Exception as e:
+            logger.exception(f"Error reconciling guilds: {e}")
+            return False
+
+    @staticmethod
+    async def _load_servers() -> Dict[str, ServerDTO]:
+        return {server.get_server_id(): server async for server in AsyncServerBLL().iter_all_server(True)}
+
+    @staticmethod
+    async def _load_channels() -> Dict[str, ChannelDTO]:
+        return {channel.get_channel_id(): channel async for channel in AsyncChannelBLL().iter_all_channel(True)}
+
+    @staticmethod
+    async def _backfill_feed_servers(guilds: Iterable) -> None:
+        """Gán server_id cho các feed cũ (tạo trước khi feed có trường này) theo guild chứa channel."""
+        guild_of_channel = {str(channel.id): str(guild.id) for guild in guilds for channel in guild.channels}
+        updates, unresolved = [], 0
+        async for feed_dto in AsyncFeedBLL().iter_all_feed():
+            if feed_dto.get_server_id():
+                continue
+            server_id = guild_of_channel.get(str(feed_dto.get_channel_id()))
+            if server_id:
+                updates.append((feed_dto, server_id))
+            else:
+                unresolved += 1
+        if updates:
+            await AsyncFeedBLL().update_server_id_batch(updates)
+        if updates or unresolved:
+            logger.info(f"Backfilled server_id on {len(updates)} feed(s); {unresolved} feed(s) not in any current guild.")
+
+    def _server_changes(self, guild, is_active: bool = True, create: bool = True) -> List[ServerDTO]:
+        server_id = str(guild.id)
+        server_dto = self.__servers.get(server_id)
+        if server_dto is None:
+            if not create:
+                return []
+            server_dto = ServerDTO(server_id, str(guild.name), is_active=is_active)
+            self.__servers[server_id] = server_dto
+            return [server_dto]
+
+        if server_dto.get_server_name() == str(guild.name) and server_dto.get_state() == is_active:
+            return []
+        server_dto.set_server_name(str(guild.name))
+        server_dto.set_state(is_active)
+        return [server_dto]
+
+    def _channel_changes(self, channels: Iterable, is_active: bool = True) -> List[ChannelDTO]:
+        changes = []
+        for channel in channels:
+            channel_dto = self.__channels.get(str(channel.id))
+            if channel_dto is None:
+                continue
+            if channel_dto.get_channel_name() == channel.name and channel_dto.get_state() == is_active:
+                continue
+            channel_dto.set_channel_name(channel.name)
+            channel_dto.set_state(is_active)
+            changes.append(channel_dto)
+        return changes
+
+    async def _track_server(self, guild) -> None:
+        """Server chưa có trong bản sao (có thể vừa được đăng ký sau lần reconcile) → tìm trong DB."""
+        server_id = str(guild.id)
+        if server_id not in self.__servers:
+            server_dto = await AsyncServerBLL().get_server_by_server_id(server_id)
+            if server_dto is not None:
+                self.__servers[server_id] = server_dto
+
+    async def _track_channels(self, channels: Iterable) -> None:
+        """Như _track_server, cho các channel chưa có trong bản sao (tra song song)."""
+        channel_ids = [str(channel.id) for channel in channels if str(channel.id) not in self.__channels]
+        found = await asyncio.gather(*(AsyncChannelBLL().get_channel_by_channel_id(cid) for cid in channel_ids))
+        for channel_id, channel_dto in zip(channel_ids, found):
+            if channel_dto is not None:
+                self.__channels[channel_id] = channel_dto
+
+    async def _save(self, servers: List[ServerDTO], channels: List[ChannelDTO]) -> None:
+        if servers:
+            await AsyncServerBLL().upsert_server_batch(servers)
+        if channels:
+            await AsyncChannelBLL().upsert_channel_batch(channels)
+
+    # ---------------- Gateway events ---------------- #
+    async def guild_join(self, guild) -> None:
+        await self._save(self._server_changes(guild), self._channel_changes(guild.channels))
+
+    async def guild_remove(self, guild) -> None:
+        await asyncio.gather(self._track_server(guild), self._track_channels(guild.channels))
+        await self._save(
+            self._server_changes(guild, is_active=False, create=False),
+            self._channel_changes(guild.channels, is_active=False),
+        )
+
+    async def guild_update(self, before, after) -> None:
+        if before.name != after.name:
+            await self._save(self._server_changes(after), [])
+
+    async def channel_update(self, before, after) -> None:
+        if before.name == after.name:
+            return
+        await self._track_channels([after])
+        await self._save([], self._channel_changes([after]))
+
+    async def channel_delete(self, channel) -> None:
+        await self._track_channels([channel])
+        await self._save([], self._channel_changes([channel], is_active=False))
@@ -1,13 +1,27 @@
-import re
 import feedparser
-import cloudscraper
-from bs4 import BeautifulSoup
-from typing import List, Optional, Tuple
+from typing import Collection, List, Optional, Tuple
 from dto.feed_dto import FeedDTO
 from dto.emty_dto import EmtyDTO
-from utils.text_processor import TextProcessor
+from utils.feed_cache import FeedValidatorCache
+from utils.http_client import get_http_client
+from utils.discovery_cache import DiscoveryCache
+from utils.rss_discovery import find_feed_link
+from utils.fast_feed_parser import FeedStreamParser, UnsupportedFeed
+from utils.parse_pool import get_parse_pool
+from utils.analysis_cache import AnalysisCache, fingerprint
+from utils.feed_normalizer import iter_entries, to_feed_dto
 import google.generativeai as genai
 import os
+import logging
+
+logger = logging.getLogger("HandleRSS")
+
+# Giới hạn cho mỗi lần tải feed: dung lượng body tối đa (byte) và số entry cần đọc
+FEED_MAX_BYTES = int(os.getenv("FEED_MAX_BYTES", str(4 * 1024 * 1024)))
+FEED_MAX_ENTRIES = int(os.getenv("FEED_MAX_ENTRIES", "50"))
+FEED_CHUNK_SIZE = 64 * 1024
+
+GEMINI_MODEL = "gemini-2.5-flash"
 
 base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Lấy thư mục gốc của dự án
 prompt = os.path.join(base_dir, "prompt.txt")
@@ -19,11 +33,11 @@ class GetRSS:
         self.__rss_link = self.__fetch_rss_link(url)
 
     def __fetch_rss_link(self, url: str) -> Optional[str]:
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rss_link = soup.find('link', attrs={'type': 'application/rss+xml'})
-        return rss_link['href'] if rss_link else None  # type: ignore
+        # Chỉ đọc tới hết <head>, đóng response là bỏ phần còn lại của trang
+        with get_http_client().get(url, stream=True) as response:
+            # Không khai báo charset thì để find_feed_link dùng UTF-8 (requests sẽ đoán ISO-8859-1)
+            charset = response.encoding if "charset" in response.headers.get("content-type", "").lower() else None
+            return find_feed_link(response.iter_content(chunk_size=8192), response.url, charset)
 
     def get_rss_link(self) -> Optional[str]:
         return self.__rss_link
@@ -35,172 +49,160 @@ def handle_url(url: str) -> str:
     url = url.replace(":///", "://").replace("///", "//")
     return url
 
-def get_rss_link(url: str) -> Optional[str]:
-    return GetRSS(handle_url(url)).get_rss_link()
+_discovery_cache = DiscoveryCache()
 
-def _first(*vals):
-    for v in vals:
-        if v:
-            return v
-    return ""
+def get_rss_link(url: str) -> Optional[str]:
+    """Tìm RSS link của trang; kết quả (kể cả không tìm thấy) được cache theo URL đã chuẩn hóa."""
+    url = handle_url(url)
+    rss_link = _discovery_cache.get(url)
+    if rss_link is DiscoveryCache.MISSING:
+        rss_link = GetRSS(url).get_rss_link()  # Lỗi mạng văng ra ngoài, không bị cache
+        _discovery_cache.set(url, rss_link)
+    return rss_link
+
+_validator_cache = FeedValidatorCache()
+
+def _read_capped(response) -> Tuple[bytes, bool]:
+    """Body tối đa FEED_MAX_BYTES byte, và cờ cho biết body có bị cắt hay không."""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=FEED_CHUNK_SIZE):
+        body += chunk
+        if len(body) > FEED_MAX_BYTES:
+            logger.info(f"Feed larger than {FEED_MAX_BYTES} bytes, parsing only the beginning: {response.url}")
+            return bytes(body[:FEED_MAX_BYTES]), True
+    return bytes(body), False
+
+def _parse_stream(response, response_headers) -> feedparser.FeedParserDict:
+    """
+    Parse body trong lúc tải, ngừng tải khi đã đủ FEED_MAX_ENTRIES entry hoặc vượt FEED_MAX_BYTES
+    (feed lưu trữ hàng nghìn item), nên bộ nhớ cho mỗi feed có giới hạn.
+    """
+    stream = FeedStreamParser(response_headers, max_entries=FEED_MAX_ENTRIES)
+    received = 0
+    truncated = False
+    for chunk in response.iter_content(chunk_size=FEED_CHUNK_SIZE):
+        if received + len(chunk) > FEED_MAX_BYTES:
+            stream.feed(chunk[:FEED_MAX_BYTES - received])
+            logger.info(f"Feed larger than {FEED_MAX_BYTES} bytes, parsing only the beginning: {response.url}")
+            truncated = True
+            break
+        received += len(chunk)
+        stream.feed(chunk)
+        if stream.done:
+            break
+    try:
+        return stream.close(truncated)
+    except UnsupportedFeed as e:
+        # Parser nhanh bỏ cuộc giữa feed, khi body đã không còn được giữ → tải lại (có giới hạn) cho feedparser
+        logger.info(f"Re-fetching feed for feedparser ({e}): {response.url}")
+        with get_http_client().get(response.url, stream=True) as retry:
+            content, _ = _read_capped(retry)
+        return feedparser.parse(content, response_headers=response_headers)
+
+def fetch_feed(rss_link: str, only_if_modified: bool = False):
+    """
+    Tải feed qua session HTTP dùng chung rồi parse.
+    Với `only_if_modified=True`: gửi conditional GET (If-None-Match / If-Modified-Since) và trả về None
+    khi server trả 304 (feed không đổi kể từ lần tải trước).
+    """
+    cached = _validator_cache.get(rss_link) if only_if_modified else None
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.modified:
+        headers["If-Modified-Since"] = cached.modified
 
-def read_rss_link(url: Optional[str] = None, rss_link: Optional[str] = None) -> Optional[Tuple[FeedDTO, Optional[EmtyDTO]]]:
+    try:
+        with get_http_client().get(rss_link, headers=headers, stream=True) as response:
+            status = response.status_code
+            if status == 304 and cached:
+                response.content  # Body rỗng; đọc hết để kết nối được trả về pool thay vì bị đóng
+                return None
+
+            response_headers = {k.lower(): v for k, v in response.headers.items()}
+            response_headers.setdefault("content-location", response.url)
+            pool = get_parse_pool()
+            if pool is None:
+                feed = _parse_stream(response, response_headers)
+            else:
+                # Parse + chuẩn hóa entry ở tiến trình khác, thread này chỉ tải
+                content, truncated = _read_capped(response)
+                feed = pool.parse(rss_link, content, response_headers, FEED_MAX_ENTRIES, truncated)
+    except Exception as e:
+        # Giống feedparser khi không tải được: feed rỗng, bozo, không có status
+        return feedparser.FeedParserDict(bozo=1, bozo_exception=e, entries=[], feed=feedparser.FeedParserDict())
+
+    feed["status"] = status
+    feed["headers"] = response_headers
+    feed["href"] = response.url
+    if "etag" in response_headers:
+        feed["etag"] = response_headers["etag"]
+    if "last-modified" in response_headers:
+        feed["modified"] = response_headers["last-modified"]
+
+    # Lỗi tạm thời (429/503...) không được xóa validator đã có
+    if status < 400:
+        _validator_cache.update(rss_link, feed.get("etag"), feed.get("modified"))
+    return feed
+
+def forget_feed_validators(rss_link: str) -> None:
+    """Bỏ ETag / Last-Modified đã lưu của feed: lần tải sau là GET đầy đủ thay vì nhận 304."""
+    _validator_cache.invalidate(rss_link)
+
+def read_rss_link(url: Optional[str] = None, rss_link: Optional[str] = None, only_if_modified: bool = False, feed=None) -> Optional[Tuple[FeedDTO, Optional[EmtyDTO]]]:
+    """
+    Trả về (FeedDTO, EmtyDTO mới nhất).
+    Với `only_if_modified=True`, trả về None nếu feed không đổi kể từ lần tải trước (HTTP 304).
+    `feed`: kết quả fetch_feed đã có sẵn, để khỏi tải lại.
+    """
     if url:
         rss_link = get_rss_link(url)
     if not rss_link:
         raise ValueError("Cần cung cấp 'url' hoặc 'rss_link'")
 
-    feed = feedparser.parse(rss_link)
-
-    # Lấy logo an toàn (RSS/Atom có thể khác khóa)
-    logo_url = ""
-    img_obj = feed.feed.get("image")
-    if isinstance(img_obj, dict):
-        logo_url = img_obj.get("href") or img_obj.get("url") or ""
-    logo_url = logo_url or feed.feed.get("logo", "")
-
-    description = feed.feed.get("subtitle", "") or feed.feed.get("description", "")
-
-    # PubDate cấp feed: ưu tiên published → updated → pubDate → lastBuildDate
-    feed_pub = _first(
-        feed.feed.get("published"),
-        feed.feed.get("updated"),
-        feed.feed.get("pubDate"),
-        feed.feed.get("lastBuildDate"),
-    )
-
-    feed_dto = FeedDTO(
-        link_feed=feed.feed.get("link", "") or rss_link,
-        link_atom_feed=feed.feed.get("id", rss_link),
-        title_feed=feed.feed.get("title", "") or "",
-        description_feed=description,
-        logo_feed=logo_url,
-        pubDate_feed=feed_pub,
-    )
+    if feed is None:
+        feed = fetch_feed(rss_link, only_if_modified=only_if_modified)
+        if feed is None:
+            return None
 
+    feed_dto = to_feed_dto(feed, rss_link)
     # Không có entries → trả về chỉ feed_dto
-    if not feed.entries:
-        return (feed_dto, None)
-
-    entry = feed.entries[0]
-
-    # Ảnh trong entry (media)
-    media_content = ""
-    if getattr(entry, "media_thumbnail", None):
-        media_content = entry.media_thumbnail[0].get("url", "")
-    elif getattr(entry, "media_content", None):
-        media_content = entry.media_content[0].get("url", "")
-
-    # Nội dung entry
-    if isinstance(entry.get("content"), list) and entry["content"]:
-        content = entry["content"][0].get("value", "")
-    else:
-        content = entry.get("summary", entry.get("description", "")) or ""
-
-    # Nếu là link GitHub (Atom) thì gom khoảng trắng
-    if "github.com" in feed_dto.get_link_atom_feed():
-        content = re.sub(r"\s+", " ", content.replace("\n", " ")).strip()
-
-    # PubDate cấp entry: ưu tiên published → updated → pubDate
-    entry_pub = _first(
-        entry.get("published"),
-        entry.get("updated"),
-        entry.get("pubDate"),
-    )
-
-    emty_dto = EmtyDTO(
-        link_emty=entry.get("link", ""),
-        link_feed=feed_dto.get_link_feed(),
-        link_atom_feed=feed_dto.get_link_atom_feed(),
-        title_emty=(entry.get("title") or "").strip(),
-        description_emty=str(TextProcessor.parse_html(content)),
-        image_emty=media_content,
-        pubdate_emty=entry_pub,
-    )
-
-    return (feed_dto, emty_dto)
-
-def read_rss_entries(rss_link: str, limit: int = 5) -> Tuple[FeedDTO, List[EmtyDTO]]:
+    return (feed_dto, next(iter_entries(feed, feed_dto, limit=1), None))
+
+def read_rss_entries(rss_link: str, limit: int = 5, feed=None, stop_at: Optional[Collection[str]] = None) -> Tuple[FeedDTO, List[EmtyDTO]]:
     """
-    Trả về (FeedDTO, [EmtyDTO]) cho tối đa `limit` entry đầu tiên (mới nhất theo thứ tự feed.entries).
+    Trả về (FeedDTO, [EmtyDTO]) cho tối đa `limit` entry mới nhất, dừng sớm theo `stop_at` (xem iter_entries).
     Đây là hàm chuẩn hóa để dùng ở nơi khác (ví dụ analyze).
+    `feed`: kết quả fetch_feed đã có sẵn, để khỏi tải lại.
     """
     if not rss_link:
         raise ValueError("Thiếu rss_link")
 
-    feed = feedparser.parse(rss_link)
-
-    # Tạo FeedDTO giống logic read_rss_link
-    logo_url = ""
-    img_obj = feed.feed.get("image")
-    if isinstance(img_obj, dict):
-        logo_url = img_obj.get("href") or img_obj.get("url") or ""
-    logo_url = logo_url or feed.feed.get("logo", "")
-
-    description = feed.feed.get("subtitle", "") or feed.feed.get("description", "")
-
-    feed_pub = _first(
-        feed.feed.get("published"),
-        feed.feed.get("updated"),
-        feed.feed.get("pubDate"),
-        feed.feed.get("lastBuildDate"),
-    )
-
-    feed_dto = FeedDTO(
-        link_feed=feed.feed.get("link", "") or rss_link,
-        link_atom_feed=feed.feed.get("id", rss_link),
-        title_feed=feed.feed.get("title", "") or "",
-        description_feed=description,
-        logo_feed=logo_url,
-        pubDate_feed=feed_pub,
-    )
-
-    entries: List[EmtyDTO] = []
-    if not feed.entries:
-        return feed_dto, entries
-
-    for entry in feed.entries[:limit]:
-        # Ảnh trong entry (media)
-        media_content = ""
-        if getattr(entry, "media_thumbnail", None):
-            media_content = entry.media_thumbnail[0].get("url", "")
-        elif getattr(entry, "media_content", None):
-            media_content = entry.media_content[0].get("url", "")
-
-        # Nội dung entry
-        if isinstance(entry.get("content"), list) and entry["content"]:
-            content = entry["content"][0].get("value", "")
-        else:
-            content = entry.get("summary", entry.get("description", "")) or ""
-
-        # Nếu là link GitHub (Atom) thì gom khoảng trắng
-        if "github.com" in feed_dto.get_link_atom_feed():
-            content = re.sub(r"\s+", " ", content.replace("\n", " ")).strip()
-
-        entry_pub = _first(
-            entry.get("published"),
-            entry.get("updated"),
-            entry.get("pubDate"),
-        )
+    if feed is None:
+        feed = fetch_feed(rss_link)
+
+    feed_dto = to_feed_dto(feed, rss_link)
+    return feed_dto, list(iter_entries(feed, feed_dto, stop_at=stop_at, limit=limit))
 
-        emty_dto = EmtyDTO(
-            link_emty=entry.get("link", ""),
-            link_feed=feed_dto.get_link_feed(),
-            link_atom_feed=feed_dto.get_link_atom_feed(),
-            title_emty=(entry.get("title") or "").strip(),
-            description_emty=str(TextProcessor.parse_html(content)),
-            image_emty=media_content,
-            pubdate_emty=entry_pub,
-        )
-        entries.append(emty_dto)
 
-    return feed_dto, entries
+_analysis_cache = AnalysisCache()
+_prompt_cache: dict = {}  # prompt_file → (mtime_ns, nội dung)
 
+def _read_prompt(prompt_file: str) -> str:
+    """Nội dung prompt file, chỉ đọc lại khi file bị sửa."""
+    mtime_ns = os.stat(prompt_file).st_mtime_ns
+    cached = _prompt_cache.get(prompt_file)
+    if cached is None or cached[0] != mtime_ns:
+        with open(prompt_file, "r", encoding="utf-8") as f:
+            cached = (mtime_ns, f.read())
+        _prompt_cache[prompt_file] = cached
+    return cached[1]
 
 def analyze_rss_link(rss_link: str, num_entries: int = 5, prompt_file: str = "prompt.txt") -> str:
     """
     Phân tích trực tiếp dữ liệu từ RSS link bằng Gemini.
     Dùng read_rss_entries để lấy dữ liệu rồi build prompt.
+    Kết quả được cache theo fingerprint (entry + prompt + model): feed chưa đổi thì không gọi lại Gemini.
     """
     try:
         if not rss_link:
@@ -213,8 +215,13 @@ def analyze_rss_link(rss_link: str, num_entries: int = 5, prompt_file: str = "pr
         # load prompt gốc
         if not os.path.exists(prompt_file):
             return f"Prompt file '{prompt_file}' not found."
-        with open(prompt_file, "r", encoding="utf-8") as f:
-            base_prompt = f.read()
+        base_prompt = _read_prompt(prompt_file)
+
+        key = fingerprint(entries, base_prompt, GEMINI_MODEL)
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Gemini analysis cache hit: {rss_link}")
+            return cached
 
         # ghép dữ liệu từ các EmtyDTO
         data_text = "\n\n".join(
@@ -226,16 +233,21 @@ def analyze_rss_link(rss_link: str, num_entries: int = 5, prompt_file: str = "pr
 
         # gọi Gemini
         genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        model = genai.GenerativeModel("gemini-2.5-flash")
+        model = genai.GenerativeModel(GEMINI_MODEL)
         response = model.generate_content(full_prompt)
 
+        result = None
         if hasattr(response, "text") and response.text:
-            return response.text
+            result = response.text
         elif hasattr(response, "candidates") and response.candidates:
             parts = response.candidates[0].content.parts
             if parts:
-                return parts[0].text
-        return "Không nhận được phản hồi từ Gemini."
+                result = parts[0].text
+        if not result:
+            return "Không nhận được phản hồi từ Gemini."
+        # Chỉ cache phản hồi thật, lỗi và phản hồi rỗng thì lần sau gọi lại
+        _analysis_cache.set(key, result)
+        return result
     except Exception as e:
         # Không để exception văng lên ngoài — trả về message dễ đọc
         return f"Error in analyze_rss_link: {e}"
\ No newline at end of file
@@ -0,0 +1,86 @@
+import os
+import threading
+import requests
+import cloudscraper
+from cloudscraper import CipherSuiteAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from typing import Dict, Optional
+
+# Timeout kết nối / đọc (giây) cho mọi request HTTP của bot
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+# Số kết nối keep-alive tối đa tới cùng một host, và số host được giữ pool
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "8"))
+HTTP_MAX_HOSTS = int(os.getenv("HTTP_MAX_HOSTS", "64"))
+# Thời gian chờ tối đa (giây) khi mọi kết nối tới host đã bận, trước khi báo lỗi EmptyPoolError
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+
+class _PoolWaitMixin:
+    """requests không truyền pool_timeout cho urllib3: pool đầy (pool_block=True) thì chờ mãi → đặt mặc định."""
+    pool_timeout: Optional[float] = HTTP_POOL_TIMEOUT
+
+    def _get_conn(self, timeout=None):
+        return super()._get_conn(timeout=self.pool_timeout if timeout is None else timeout)
+
+class _HTTPConnectionPool(_PoolWaitMixin, HTTPConnectionPool):
+    pass
+
+class _HTTPSConnectionPool(_PoolWaitMixin, HTTPSConnectionPool):
+    pass
+
+class HttpClient:
+    """
+    Session HTTP dùng chung (cloudscraper, tức requests.Session) cho việc tìm RSS và tải feed.
+    Kết nối TCP/TLS được giữ lại theo từng host nên các lần tải lặp lại (YouTube, GitHub...)
+    không phải bắt tay lại; mỗi host giới hạn `max_per_host` kết nối đồng thời, request phải chờ
+    kết nối rảnh quá HTTP_POOL_TIMEOUT giây thì báo lỗi thay vì chờ mãi (host chậm giữ hết kết nối).
+    """
+    def __init__(self, max_per_host: int = HTTP_MAX_PER_HOST, max_hosts: int = HTTP_MAX_HOSTS,
+                 connect_timeout: float = HTTP_CONNECT_TIMEOUT, read_timeout: float = HTTP_READ_TIMEOUT):
+        self.timeout = (connect_timeout, read_timeout)
+        self.__max_per_host = max(1, max_per_host)
+        self.__max_hosts = max(1, max_hosts)
+        self.__session: Optional[requests.Session] = None
+        self.__lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        session = cloudscraper.create_scraper()
+        pool = dict(pool_connections=self.__max_hosts, pool_maxsize=self.__max_per_host, pool_block=True)
+        # Giữ cấu hình TLS của cloudscraper, chỉ thay kích thước pool
+        session.mount("https://", CipherSuiteAdapter(
+            cipherSuite=session.cipherSuite,
+            ecdhCurve=session.ecdhCurve,
+            server_hostname=session.server_hostname,
+            source_address=session.source_address,
+            ssl_context=session.ssl_context,
+            **pool
+        ))
+        session.mount("http://", HTTPAdapter(**pool))
+        for adapter in (session.get_adapter("https://"), session.get_adapter("http://")):
+            adapter.poolmanager.pool_classes_by_scheme = {"http": _HTTPConnectionPool, "https": _HTTPSConnectionPool}
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self.__session is None:
+            with self.__lock:
+                if self.__session is None:
+                    self.__session = self._build_session()
+        return self.__session
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """GET qua session dùng chung, mặc định áp timeout kết nối / đọc."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
+
+_client = HttpClient()
+
+def get_http_client() -> HttpClient:
+    return _client
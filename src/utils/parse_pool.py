@@ -0,0 +1,182 @@
+import os
+import logging
+import threading
+import tracemalloc
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+import feedparser
+from feedparser import FeedParserDict
+
+logger = logging.getLogger("ParsePool")
+
+# Số tiến trình parse feed; 0 = parse ngay trong thread tải feed (mặc định)
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", "0"))
+# Số feed gom vào một task gửi sang tiến trình con, và thời gian chờ gom (giây)
+FEED_PARSE_CHUNK_SIZE = int(os.getenv("FEED_PARSE_CHUNK_SIZE", "4"))
+FEED_PARSE_CHUNK_DELAY = float(os.getenv("FEED_PARSE_CHUNK_DELAY", "0.01"))
+
+# Khóa cấp feed được gửi về: những gì to_feed_dto và FeedScheduler đọc
+_FEED_KEYS = (
+    "title", "link", "id", "subtitle", "description", "image", "logo", "published", "updated", "pubDate",
+    "lastBuildDate", "ttl", "sy_updateperiod", "sy_updatefrequency", "skiphours", "hour",
+)
+
+# (rss_link, body, response_headers, max_entries, truncated)
+ParseJob = Tuple[str, bytes, Dict[str, str], Optional[int], bool]
+
+def _init_worker() -> None:
+    # Tiến trình con import lại main.py, nơi bật tracemalloc; tắt đi vì nó làm parse chậm hẳn
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def _parse_one(job: ParseJob) -> Dict[str, Any]:
+    """Chạy trong tiến trình con: parse body rồi chuẩn hóa mọi entry thành bản ghi gọn (tuple)."""
+    from utils.fast_feed_parser import FeedStreamParser, UnsupportedFeed
+    from utils.feed_normalizer import newest_first, to_emty_dto, to_feed_dto
+
+    rss_link, content, headers, max_entries, truncated = job
+    stream = FeedStreamParser(headers, max_entries=max_entries)
+    stream.feed(content)
+    try:
+        feed = stream.close(truncated)
+    except UnsupportedFeed:
+        feed = feedparser.parse(content, response_headers=headers)
+
+    feed_dto = to_feed_dto(feed, rss_link)
+    entries = []
+    # Cắt sau khi đã xếp mới → cũ: feed cũ → mới (feedparser đọc cả body) phải giữ các entry mới nhất
+    for entry in list(newest_first(feed.entries))[:max_entries]:
+        emty_dto = to_emty_dto(entry, feed_dto)
+        entries.append({
+            "link": entry.get("link", ""),
+            "published_parsed": entry.get("published_parsed"),
+            "updated_parsed": entry.get("updated_parsed"),
+            "normalized": (
+                emty_dto.get_link_emty(), emty_dto.get_title_emty(), emty_dto.get_description_emty(),
+                emty_dto.get_image_emty(), emty_dto.get_pubdate_emty(),
+            ),
+        })
+    return {
+        "bozo": feed.get("bozo", False),
+        "version": feed.get("version", ""),
+        "feed": {key: feed.feed[key] for key in _FEED_KEYS if key in feed.feed},
+        "entries": entries,
+    }
+
+def _parse_chunk(jobs: List[ParseJob]) -> List[Tuple[bool, Any]]:
+    """Một task = nhiều feed, để chi phí gửi/nhận giữa các tiến trình được chia đều."""
+    results = []
+    for job in jobs:
+        try:
+            results.append((True, _parse_one(job)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+def _to_feed(record: Dict[str, Any]) -> FeedParserDict:
+    """Dựng lại FeedParserDict từ bản ghi gọn; entry mang sẵn `normalized` nên không cần bóc HTML lần nữa."""
+    feed = FeedParserDict({key: FeedParserDict(value) if isinstance(value, dict) else value
+                           for key, value in record["feed"].items()})
+    entries = []
+    for entry in record["entries"]:
+        entry = FeedParserDict(entry)
+        for key in ("published_parsed", "updated_parsed"):
+            if entry[key] is None:
+                del entry[key]
+        entries.append(entry)
+    return FeedParserDict(bozo=record["bozo"], version=record["version"], feed=feed, entries=entries)
+
+class ParsePool:
+    """
+    Pool tiến trình cho phần parse + chuẩn hóa feed (thuần Python, giữ GIL), để nhiều feed được parse
+    song song trên nhiều core. Các lời gọi `parse` từ nhiều thread được gom thành task
+    `chunk_size` feed (chờ tối đa `chunk_delay` giây để gom).
+    """
+    def __init__(self, workers: int = FEED_PARSE_WORKERS, chunk_size: int = FEED_PARSE_CHUNK_SIZE,
+                 chunk_delay: float = FEED_PARSE_CHUNK_DELAY):
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_delay = chunk_delay
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__lock = threading.Lock()
+        self.__pending: List[Tuple[ParseJob, Future]] = []
+        self.__timer: Optional[threading.Timer] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self.__executor is None:
+            # spawn: không fork từ một tiến trình đang có nhiều thread (event loop, executor, Flask)
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            logger.info(f"Started {self.workers} feed parse worker(s).")
+        return self.__executor
+
+    def parse(self, rss_link: str, content: bytes, response_headers: Dict[str, str],
+              max_entries: Optional[int] = None, truncated: bool = False) -> FeedParserDict:
+        """Blocking: gửi body sang pool và chờ kết quả (gọi từ thread tải feed)."""
+        future: Future = Future()
+        with self.__lock:
+            self.__pending.append(((rss_link, content, response_headers, max_entries, truncated), future))
+            if len(self.__pending) >= self.chunk_size:
+                self._flush_locked()
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.chunk_delay, self._flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+        return _to_feed(future.result())
+
+    def _flush(self) -> None:
+        with self.__lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        batch, self.__pending = self.__pending, []
+        if not batch:
+            return
+        futures = [future for _, future in batch]
+        try:
+            executor = self._get_executor()
+            task = executor.submit(_parse_chunk, [job for job, _ in batch])
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        def done(task: Future) -> None:
+            try:
+                results = task.result()
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # Một tiến trình con bị chết (hết RAM...) làm hỏng cả pool → lần sau tạo pool mới
+                    logger.error(f"Feed parse pool broke, restarting: {e}")
+                    with self.__lock:
+                        if self.__executor is executor:
+                            self.__executor = None
+                for future in futures:
+                    future.set_exception(e)
+                return
+            for future, (ok, value) in zip(futures, results):
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        task.add_done_callback(done)
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=False, cancel_futures=True)
+                self.__executor = None
+
+_pool: Optional[ParsePool] = ParsePool() if FEED_PARSE_WORKERS > 0 else None
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """Pool dùng chung, hoặc None nếu FEED_PARSE_WORKERS=0 (parse ngay trong thread)."""
+    return _pool
@@ -0,0 +1,63 @@
+import codecs
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Optional
+from urllib.parse import urljoin
+
+# Loại feed được nhận, theo thứ tự ưu tiên khi trang khai báo nhiều loại
+FEED_TYPES = ("application/rss+xml", "application/atom+xml", "application/feed+json")
+# Không tìm thấy </head> sau ngần này byte thì bỏ cuộc
+MAX_HEAD_BYTES = 512 * 1024
+
+class FeedLinkParser(HTMLParser):
+    """
+    Tìm <link type="application/rss+xml|atom+xml|feed+json"> trong <head>.
+    `done` bật lên khi gặp </head> (hoặc <body>), lúc đó có thể ngừng đọc trang.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: Dict[str, str] = {}
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.done = True
+        elif tag == "link" and not self.done:
+            attrs = dict(attrs)
+            feed_type = (attrs.get("type") or "").split(";")[0].strip().lower()
+            href = (attrs.get("href") or "").strip()
+            if feed_type in FEED_TYPES and href:
+                self.links.setdefault(feed_type, href)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+
+    def best_link(self) -> Optional[str]:
+        for feed_type in FEED_TYPES:
+            if feed_type in self.links:
+                return self.links[feed_type]
+        return None
+
+def find_feed_link(chunks: Iterable[bytes], base_url: str, encoding: Optional[str] = None,
+                   max_bytes: int = MAX_HEAD_BYTES) -> Optional[str]:
+    """
+    Đọc lần lượt các đoạn HTML cho tới hết <head> (hoặc `max_bytes`) và trả về feed link tuyệt đối
+    (RSS > Atom > JSON Feed), hoặc None. Phần còn lại của trang không được đọc.
+    """
+    parser = FeedLinkParser()
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    read = 0
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        read += len(chunk)
+        if parser.done or read >= max_bytes:
+            break
+    parser.close()
+    link = parser.best_link()
+    return urljoin(base_url, link) if link else None
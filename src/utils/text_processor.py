@@ -1,6 +1,75 @@
 import re
+import html
 from bs4 import BeautifulSoup
-from typing import Optional
+from typing import List, Optional
+
+# Một token markup: comment, CDATA, khai báo (<!...>, <?...?>) hoặc thẻ mở/đóng (giá trị thuộc tính có thể chứa '>')
+_MARKUP_RE = re.compile(
+    r"""<!--.*?(?:-->|$)"""
+    r"""|<!\[CDATA\[(?P<cdata>.*?)(?:\]\]>|$)"""
+    r"""|<[!?][^>]*>"""
+    r"""|<(?P<closing>/?)(?P<tag>[a-zA-Z][^\s/>]*)(?:"[^"]*"|'[^']*'|[^'">])*>""",
+    re.S,
+)
+# Chỗ trông như bắt đầu một thẻ nhưng không khớp _MARKUP_RE
+_TAG_START_RE = re.compile(r"<[a-zA-Z/!?]")
+
+# Thẻ khối: xuống dòng trước/sau để các đoạn không bị dính chữ vào nhau
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption", "figure",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "ol", "p", "pre", "section",
+    "table", "tr", "ul",
+})
+# Nội dung của các thẻ này không phải văn bản hiển thị
+_SKIP_TAGS = frozenset({"script", "style", "template", "noscript"})
+_SKIP_END_RE = {tag: re.compile(rf"</{tag}\s*>", re.I) for tag in _SKIP_TAGS}
+
+class _MalformedHTML(Exception):
+    pass
+
+def _extract_text(content: str) -> str:
+    """
+    Bóc chữ khỏi HTML trong một lượt quét regex, không dựng cây DOM: bỏ thẻ, xuống dòng ở thẻ khối,
+    bỏ script/style, rồi giải mã entity. Thẻ bị cắt dở ở cuối (description hay bị cắt ngắn) được bỏ đi.
+    Gặp thẻ hỏng ở giữa nội dung thì raise _MalformedHTML.
+    """
+    parts: List[str] = []
+    pos = 0
+    search = _MARKUP_RE.search
+    while True:
+        match = search(content, pos)
+        text = content[pos:match.start()] if match else content[pos:]
+        if "<" in text:
+            bad = _TAG_START_RE.search(text)
+            if bad:
+                if match:
+                    raise _MalformedHTML()
+                text = text[:bad.start()]
+        parts.append(text)
+        if not match:
+            break
+        pos = match.end()
+
+        cdata, closing, tag = match.group("cdata", "closing", "tag")
+        if tag is None:
+            if cdata:
+                parts.append(html.escape(cdata, quote=False))
+            continue
+        tag = tag.lower()
+        if tag in _BLOCK_TAGS:
+            parts.append("\n")
+        elif tag in _SKIP_TAGS and not closing and not match.group(0).endswith("/>"):
+            # Nội dung script/style có thể chứa '<' → nhảy thẳng tới thẻ đóng
+            end = _SKIP_END_RE[tag].search(content, pos)
+            if not end:
+                break
+            pos = end.end()
+    return html.unescape("".join(parts))
+
+def _collapse_whitespace(text: str) -> str:
+    """Gộp khoảng trắng trong từng dòng thành một dấu cách và bỏ các dòng trống."""
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
 
 class TextProcessor:
     
@@ -32,13 +101,23 @@ class TextProcessor:
     def parse_html(content: Optional[str]) -> Optional[str]:
         if content is None:
             return None
-        
-        # Use BeautifulSoup to parse the HTML content
+
+        # Không có thẻ thì chỉ cần giải mã entity
+        if "<" not in content:
+            return _collapse_whitespace(html.unescape(content))
+
+        try:
+            text = _extract_text(content)
+        except _MalformedHTML:
+            # HTML hỏng (thẻ không đóng được ở giữa nội dung) → để BeautifulSoup lo
+            text = TextProcessor.parse_html_soup(content)
+        return _collapse_whitespace(text)
+
+    @staticmethod
+    def parse_html_soup(content: str) -> str:
+        """Cách cũ: dựng cây BeautifulSoup rồi lấy toàn bộ chữ. Chậm hơn, chỉ dùng làm dự phòng."""
         soup = BeautifulSoup(content, 'html.parser')
-        
-        # Strip away HTML tags and keep only the text
-        text = soup.get_text()
-        return text
+        return soup.get_text()
 
     @staticmethod
     def clean_feed_text(text: str) -> str:
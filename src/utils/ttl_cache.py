@@ -0,0 +1,137 @@
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger("TTLCache")
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    Cache LRU giới hạn `maxsize` mục, mỗi mục hết hạn sau `ttl` giây (có thể đặt riêng khi set).
+    An toàn khi dùng từ nhiều thread.
+    """
+    MISSING = _MISSING
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key → (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def items(self) -> List[Tuple[Hashable, float, Any]]:
+        """Các mục còn hạn theo thứ tự LRU (cũ → mới): (key, số giây còn lại, value)."""
+        now = time.monotonic()
+        with self._lock:
+            return [(key, expires_at - now, value) for key, (expires_at, value) in self._data.items() if expires_at > now]
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+class PersistentTTLCache(TTLCache):
+    """
+    TTLCache lưu xuống file JSON (`[[key, thời điểm hết hạn, value], ...]`) và nạp lại khi khởi động.
+    Ghi file được gom lại: chậm nhất `save_delay` giây sau lần thay đổi đầu tiên, và khi tắt tiến trình.
+    Key và value phải ghi được ra JSON; `path` rỗng thì chỉ cache trong bộ nhớ.
+    """
+    def __init__(self, path: Optional[str], maxsize: int = 1024, ttl: float = 300.0, save_delay: float = 5.0):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.path = path
+        self.save_delay = save_delay
+        self.__timer: Optional[threading.Timer] = None
+        self.__file_lock = threading.Lock()
+        if self.path:
+            self._load()
+            atexit.register(self.save)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        super().set(key, value, ttl)
+        self._schedule_save()
+
+    def invalidate(self, key: Hashable) -> None:
+        super().invalidate(key)
+        self._schedule_save()
+
+    def clear(self) -> None:
+        super().clear()
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            if self.__timer is None:
+                self.__timer = threading.Timer(self.save_delay, self.save)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            now = time.time()
+            # File lưu theo thứ tự LRU nên set lần lượt là giữ nguyên thứ tự
+            for key, expires_at, value in entries:
+                if expires_at > now:
+                    super().set(key, value, expires_at - now)
+            logger.info(f"Loaded {len(self)} cached item(s) from '{self.path}'.")
+        except Exception as e:
+            logger.error(f"Error loading cache from '{self.path}': {e}")
+
+    def save(self) -> None:
+        """Ghi ngay toàn bộ cache xuống file (hủy lần ghi đang chờ nếu có)."""
+        if not self.path:
+            return
+        with self._lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+        now = time.time()
+        entries = [[key, now + remaining, value] for key, remaining, value in self.items()]
+        try:
+            with self.__file_lock:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)  # Ghi nguyên khối, không để file dở dang khi bị dừng giữa chừng
+        except Exception as e:
+            logger.error(f"Error saving cache to '{self.path}': {e}")